@@ -0,0 +1,87 @@
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+
+# 원본 XML 응답을 gzip으로 보관할 디렉터리 (비어 있으면 보관하지 않음)
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "").strip()
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ArchivedPayload:
+    """보관된 응답 파일 하나"""
+    api_endpoint: str
+    fetched_at: datetime
+    path: str
+
+
+def params_digest(params: dict | None) -> str:
+    """요청 파라미터를 파일 이름에 쓸 짧은 해시로 만듭니다."""
+    encoded = json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+class ArchiveWriter:
+    """
+    응답 본문을 받는 대로 gzip 파일에 이어 씁니다.
+    모두 받은 뒤 commit()해야 최종 파일 이름으로 바뀌며, 실패 시 discard()로 임시 파일을 지웁니다.
+    """
+
+    def __init__(self, api_endpoint: str, params: dict | None = None, archive_dir: str = ARCHIVE_DIR):
+        fetched_at = datetime.now()
+        directory = os.path.join(archive_dir, api_endpoint, fetched_at.strftime("%Y%m%d"))
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{fetched_at.strftime('%Y%m%d%H%M%S%f')}_{params_digest(params)}.xml.gz")
+        self._tmp_path = self.path + ".part"
+        self._file = gzip.open(self._tmp_path, "wb")
+
+    def write(self, chunk: bytes):
+        self._file.write(chunk)
+
+    def commit(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def open_archive(api_endpoint: str, params: dict | None = None) -> ArchiveWriter | None:
+    """보관이 켜져 있으면 ArchiveWriter를, 아니면 None을 반환합니다."""
+    return ArchiveWriter(api_endpoint, params) if ARCHIVE_DIR else None
+
+
+def list_archived(archive_dir: str = ARCHIVE_DIR, api_endpoint: str | None = None,
+                  since: datetime | None = None, until: datetime | None = None) -> list[ArchivedPayload]:
+    """보관된 응답 파일 목록을 수집 시각 순서로 반환합니다."""
+    payloads = []
+    if not archive_dir or not os.path.isdir(archive_dir):
+        return payloads
+    endpoints = [api_endpoint] if api_endpoint else sorted(os.listdir(archive_dir))
+    for endpoint in endpoints:
+        endpoint_dir = os.path.join(archive_dir, endpoint)
+        if not os.path.isdir(endpoint_dir):
+            continue
+        for root, _, files in os.walk(endpoint_dir):
+            for name in files:
+                if not name.endswith(".xml.gz"):
+                    continue
+                fetched_at = datetime.strptime(name.split("_", 1)[0], "%Y%m%d%H%M%S%f")
+                if (since and fetched_at < since) or (until and fetched_at >= until):
+                    continue
+                payloads.append(ArchivedPayload(endpoint, fetched_at, os.path.join(root, name)))
+    return sorted(payloads, key=lambda payload: payload.fetched_at)
+
+
+def iter_archived_chunks(path: str) -> Iterator[bytes]:
+    """보관된 응답 파일을 압축을 풀면서 청크 단위로 읽습니다."""
+    with gzip.open(path, "rb") as file:
+        while chunk := file.read(ARCHIVE_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,101 @@
+import math
+import time
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 있어 외부 API를 호출하지 않고 바로 실패한 경우 발생하는 예외"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"{name}: 연속 실패로 호출이 차단되었습니다 ({math.ceil(retry_after)}초 후 재시도)")
+
+
+class CircuitBreaker:
+    """
+    API별 회로 차단기.
+
+    - closed: 정상 호출. 연속 실패가 failure_threshold회에 이르면 open으로 전환
+    - open: reset_timeout초 동안 호출하지 않고 CircuitOpenError로 즉시 실패
+    - half_open: reset_timeout이 지나면 half_open_max개의 시험 호출만 허용하고,
+      성공하면 closed, 실패하면 다시 open으로 전환
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30, half_open_max: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        # 통계
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+        self.last_error: str | None = None
+        self.last_failure_at: float | None = None
+
+    def _retry_after(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self):
+        """호출 전에 확인합니다. 차단 중이면 CircuitOpenError를 발생시킵니다."""
+        if self.state == "open":
+            if self._retry_after() > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self._retry_after())
+            self.state = "half_open"
+            self._probes = 0
+        if self.state == "half_open":
+            if self._probes >= self.half_open_max:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.reset_timeout)
+            self._probes += 1
+        self.calls += 1
+
+    def record_success(self):
+        """호출 성공을 기록합니다 (half_open이면 closed로 복구)."""
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.state = "closed"
+        self._probes = 0
+
+    def record_failure(self, error: Exception | str):
+        """호출 실패를 기록하고 필요하면 차단기를 엽니다."""
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)
+        self.last_failure_at = time.time()
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self):
+        """외부 API와 무관한 이유로 호출이 끝난 경우 (예: DB 오류) 시험 호출 자리만 반납합니다."""
+        if self.state == "half_open" and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self):
+        if self.state != "open":
+            self.times_opened += 1
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._probes = 0
+
+    def stats(self) -> dict:
+        """차단기 상태와 호출 통계를 반환합니다."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after_seconds": round(self._retry_after(), 1) if self.state == "open" else 0,
+            "calls": self.calls,
+            "successes": self.successes,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+            "last_error": self.last_error,
+            "last_failure_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.last_failure_at)) if self.last_failure_at else None
+        }
@@ -0,0 +1,226 @@
+import asyncio
+import os
+import random
+import xml.etree.ElementTree as ET
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TypeVar
+from urllib.parse import quote_plus, urlsplit
+
+import httpx
+from dotenv import load_dotenv
+
+from collector.breaker import CircuitBreaker, CircuitOpenError
+from collector.limiter import TokenBucket
+from collector.parser import UpstreamResultError
+
+
+load_dotenv()
+
+API_URL = os.getenv("API_URL", "").strip()
+SERVICE_KEY = os.getenv("SERVICE_KEY", "").strip()
+
+# API 엔드포인트와 ORM 모델 매핑
+API_MODEL_MAPPING = {
+    'getRoadInfoList': 'RoadInfoList',
+    'getRoadLinkInfoList': 'getRoadLinkInfoList',
+    'getRoadTrafficInfoList': 'getRoadTrafficInfoList',
+    'getRoadLinkTrafficInfoList': 'getRoadLinkTrafficInfoList',
+    'getRoadLinkTrafficInfo': 'getRoadLinkTrafficInfo',
+    'getRoadLinkCongestInfo': 'getRoadLinkCongestInfo',
+    'getIncidentInfo': 'getIncidentInfo',
+    'getParkingPlaceInfoList': 'getParkingPlaceInfoList',
+    'getParkingPlaceAvailabilityInfoList': 'getParkingPlaceAvailabilityInfoList'
+}
+
+# 커넥션 풀 설정 (keep-alive 연결을 재사용하여 매 호출마다 TCP/TLS 핸드셰이크를 하지 않음)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# 타임아웃 설정 (초)
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_POOL_TIMEOUT = float(os.getenv("HTTP_POOL_TIMEOUT", "10"))
+
+# 호스트별 읽기 타임아웃 (예: "openapigits.gg.go.kr=60,example.com=10")
+HTTP_HOST_TIMEOUTS = {
+    host.strip(): float(seconds)
+    for host, _, seconds in (
+        entry.partition("=") for entry in os.getenv("HTTP_HOST_TIMEOUTS", "").split(",") if "=" in entry
+    )
+}
+
+# 모든 API가 공유하는 호출 속도 제한 (초당 호출 수, 순간 허용량)
+UPSTREAM_RATE_PER_SEC = float(os.getenv("UPSTREAM_RATE_PER_SEC", "10"))
+UPSTREAM_BURST = int(os.getenv("UPSTREAM_BURST", "10"))
+
+# API별 회로 차단기: 연속 실패 횟수, 차단 유지 시간(초), 반개방 상태의 시험 호출 수
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+BREAKER_HALF_OPEN_MAX = int(os.getenv("BREAKER_HALF_OPEN_MAX", "1"))
+
+# 재시도 가능한 실패의 재시도 횟수와 백오프 (초)
+UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "2"))
+UPSTREAM_RETRY_BASE = float(os.getenv("UPSTREAM_RETRY_BASE", "0.5"))
+UPSTREAM_RETRY_MAX_DELAY = float(os.getenv("UPSTREAM_RETRY_MAX_DELAY", "10"))
+
+# 일시적인 오류로 보고 재시도하는 resultCode (01: 서비스 오류, 02: DB 오류, 04: HTTP 오류, 05: 서비스 연결 실패)
+# 키 미등록(30), 호출 한도 초과(22) 등은 재시도해도 같은 결과이므로 제외
+RETRYABLE_RESULT_CODES = {code.strip() for code in os.getenv("RETRYABLE_RESULT_CODES", "01,02,04,05").split(",") if code.strip()}
+# 실패로 집계하지 않는 resultCode (03: 데이터 없음)
+NON_FAILURE_RESULT_CODES = {"03"}
+
+_http_client: httpx.AsyncClient | None = None
+
+upstream_limiter = TokenBucket(UPSTREAM_RATE_PER_SEC, UPSTREAM_BURST)
+_breakers: dict[str, CircuitBreaker] = {}
+_retries: dict[str, int] = {}
+
+T = TypeVar("T")
+
+
+def build_url(api_endpoint: str) -> str:
+    """API_URL + api_endpoint + ?serviceKey=... 형태의 요청 URL을 만듭니다."""
+    encoded_key = quote_plus(SERVICE_KEY)
+    return f"{API_URL}{api_endpoint}?serviceKey={encoded_key}"
+
+
+def get_timeout(url: str) -> httpx.Timeout:
+    """요청 URL의 호스트에 맞는 타임아웃을 반환합니다."""
+    read_timeout = HTTP_HOST_TIMEOUTS.get(urlsplit(url).hostname or "", HTTP_READ_TIMEOUT)
+    return httpx.Timeout(read_timeout, connect=HTTP_CONNECT_TIMEOUT, pool=HTTP_POOL_TIMEOUT)
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """애플리케이션 전체에서 공유할 비동기 HTTP 클라이언트를 생성합니다."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT, pool=HTTP_POOL_TIMEOUT),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """공유 HTTP 클라이언트를 닫고 커넥션 풀을 정리합니다."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 HTTP 클라이언트를 반환합니다 (lifespan에서 먼저 열려 있어야 함)."""
+    if _http_client is None:
+        raise RuntimeError("HTTP 클라이언트가 초기화되지 않았습니다. 애플리케이션 lifespan에서 open_http_client()를 호출하세요.")
+    return _http_client
+
+
+def get_breaker(api_endpoint: str) -> CircuitBreaker:
+    """API별 회로 차단기를 반환합니다 (없으면 생성)."""
+    if api_endpoint not in _breakers:
+        _breakers[api_endpoint] = CircuitBreaker(
+            api_endpoint, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, BREAKER_HALF_OPEN_MAX
+        )
+    return _breakers[api_endpoint]
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """외부 API 쪽 문제로 인한 실패인지 판단합니다 (회로 차단기 실패 집계 대상)."""
+    if isinstance(error, UpstreamResultError):
+        return error.result_code not in NON_FAILURE_RESULT_CODES
+    return isinstance(error, (httpx.HTTPError, ET.ParseError))
+
+
+def is_retryable(error: BaseException) -> bool:
+    """다시 호출하면 성공할 수 있는 일시적인 실패인지 판단합니다."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return True
+    if isinstance(error, UpstreamResultError):
+        return error.result_code in RETRYABLE_RESULT_CODES
+    return False
+
+
+def retry_delay(error: BaseException, attempt: int) -> float:
+    """재시도 전 대기 시간: 지수 백오프에 full jitter를 적용하고, Retry-After 헤더가 있으면 따릅니다."""
+    if isinstance(error, httpx.HTTPStatusError):
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), UPSTREAM_RETRY_MAX_DELAY)
+    return random.uniform(0, min(UPSTREAM_RETRY_MAX_DELAY, UPSTREAM_RETRY_BASE * 2 ** attempt))
+
+
+async def call_with_retry(api_endpoint: str, func: Callable[[], Awaitable[T]],
+                          retry_if: Callable[[Exception], bool] | None = None,
+                          max_retries: int = UPSTREAM_MAX_RETRIES) -> T:
+    """
+    외부 API 호출을 재시도 가능한 실패에 한해 백오프하며 다시 실행합니다.
+    차단기가 열렸거나 retry_if가 False를 반환하면(예: 이미 일부를 DB에 저장함) 바로 예외를 전달합니다.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await func()
+        except Exception as e:
+            if (attempt >= max_retries or not is_retryable(e) or (retry_if and not retry_if(e))
+                    or get_breaker(api_endpoint).state == "open"):
+                raise
+            _retries[api_endpoint] = _retries.get(api_endpoint, 0) + 1
+            await asyncio.sleep(retry_delay(e, attempt))
+
+
+@asynccontextmanager
+async def guarded(api_endpoint: str) -> AsyncIterator[None]:
+    """
+    외부 API 호출 한 번을 감쌉니다: 차단기 확인 -> 공유 토큰 버킷 대기 -> 호출 결과를 차단기에 기록.
+    블록 안에서 발생한 예외(응답 본문 파싱 중 resultCode 오류 포함)도 외부 API 실패로 집계합니다.
+    """
+    breaker = get_breaker(api_endpoint)
+    breaker.before_call()
+    await upstream_limiter.acquire()
+    try:
+        yield
+    except BaseException as e:
+        if is_upstream_failure(e):
+            breaker.record_failure(e)
+        else:
+            breaker.release()
+        raise
+    breaker.record_success()
+
+
+def upstream_stats() -> dict:
+    """공유 속도 제한기와 API별 차단기/재시도 통계를 반환합니다."""
+    return {
+        "limiter": upstream_limiter.stats(),
+        "breakers": {
+            name: {**breaker.stats(), "retries": _retries.get(name, 0)}
+            for name, breaker in sorted(_breakers.items())
+        }
+    }
+
+
+async def fetch(api_endpoint: str, params: dict | None = None) -> httpx.Response:
+    """공유 클라이언트로 외부 API를 호출하고 응답을 반환합니다."""
+    full_url = build_url(api_endpoint)
+    async with guarded(api_endpoint):
+        response = await get_http_client().get(full_url, params=params, timeout=get_timeout(full_url))
+        response.raise_for_status()
+    return response
+
+
+@asynccontextmanager
+async def stream(api_endpoint: str, params: dict | None = None) -> AsyncIterator[httpx.Response]:
+    """응답 본문을 메모리에 모두 올리지 않고 스트리밍으로 읽을 수 있도록 외부 API를 호출합니다."""
+    full_url = build_url(api_endpoint)
+    async with guarded(api_endpoint):
+        async with get_http_client().stream("GET", full_url, params=params, timeout=get_timeout(full_url)) as response:
+            response.raise_for_status()
+            yield response
@@ -0,0 +1,155 @@
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from collector.limiter import TokenBucket
+from collector.parser import UpstreamResultError
+from database.connection import SessionFactory
+from database.repository import get_distinct_values, get_crawl_progress, save_crawl_checkpoint
+
+
+# 동시에 진행할 호출 수, 초당 호출 수 (호출 하나의 재시도는 collector.client.call_with_retry가 담당)
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))
+CRAWL_RATE_PER_SEC = float(os.getenv("CRAWL_RATE_PER_SEC", "5"))
+# 파라미터 값과 무관하게 모든 호출이 같은 결과가 나오는 resultCode - 받으면 남은 호출을 중단
+# (12: 서비스 없음, 20: 접근 거부, 22: 호출 한도 초과, 30: 키 미등록, 31: 키 기한 만료, 32: 미등록 IP)
+CRAWL_ABORT_RESULT_CODES = {
+    code.strip() for code in os.getenv("CRAWL_ABORT_RESULT_CODES", "12,20,22,30,31,32").split(",") if code.strip()
+}
+
+
+@dataclass(frozen=True)
+class CrawlSpec:
+    """파라미터별 크롤링 설정: 어떤 파라미터를 어느 테이블의 어느 컬럼 값으로 채울지"""
+    param: str
+    source_model: str
+    source_column: str
+
+
+class CrawlSourceEmptyError(Exception):
+    """크롤링할 파라미터 값의 출처 테이블에 값이 없어 호출할 수 없는 경우 발생하는 예외"""
+
+    def __init__(self, api_endpoint: str, spec: CrawlSpec):
+        self.api_endpoint = api_endpoint
+        self.spec = spec
+        super().__init__(
+            f"{api_endpoint}: 호출할 {spec.param} 값이 없습니다 "
+            f"({spec.source_model}.{spec.source_column}을 먼저 수집하세요)"
+        )
+
+
+# 파라미터가 필요한 API와 파라미터 값의 출처
+# (주차장 API의 laeId는 파라미터 없이 수집한 주차장 정보 목록에서 가져옴 - 지자체 목록 API는 수집하지 않음)
+CRAWL_SPECS = {
+    'getRoadLinkInfoList': CrawlSpec("routeId", "RoadInfoList", "routeId"),
+    'getRoadLinkTrafficInfoList': CrawlSpec("routeId", "RoadInfoList", "routeId"),
+    'getRoadLinkTrafficInfo': CrawlSpec("linkId", "getRoadLinkInfoList", "linkId"),
+    'getParkingPlaceInfoList': CrawlSpec("laeId", "getParkingPlaceInfoList", "laeId"),
+    'getParkingPlaceAvailabilityInfoList': CrawlSpec("laeId", "getParkingPlaceInfoList", "laeId")
+}
+
+# 수집 함수 형식: (api_endpoint, db, mode, params) -> 수집 결과
+CollectFunc = Callable[[str, Session, str, dict], Awaitable[dict]]
+
+
+def _load_plan(api_endpoint: str, resume: bool) -> tuple[str, list, int]:
+    """크롤링할 파라미터 값 목록을 만들고, resume이면 마지막 실행에서 끝난 값은 제외합니다."""
+    spec = CRAWL_SPECS[api_endpoint]
+    db = SessionFactory()
+    try:
+        values = get_distinct_values(db, spec.source_model, spec.source_column)
+        last_run_id, done = get_crawl_progress(db, api_endpoint)
+    finally:
+        db.close()
+    if not values:
+        raise CrawlSourceEmptyError(api_endpoint, spec)
+
+    if resume and last_run_id:
+        pending = [value for value in values if str(value) not in done]
+        return last_run_id, pending, len(values) - len(pending)
+    return datetime.now().strftime("%Y%m%d%H%M%S"), values, 0
+
+
+def _save_checkpoint(api_endpoint: str, run_id: str, value, status: str, row_count: int):
+    db = SessionFactory()
+    try:
+        save_crawl_checkpoint(db, api_endpoint, run_id, value, status, row_count)
+    finally:
+        db.close()
+
+
+async def crawl(api_endpoint: str, collect: CollectFunc, *, mode: str = "incremental", resume: bool = False,
+                concurrency: int = CRAWL_CONCURRENCY, rate: float = CRAWL_RATE_PER_SEC) -> dict:
+    """
+    파라미터가 필요한 API를 파라미터 값마다 한 번씩 호출하여 수집합니다.
+    동시 호출 수(concurrency)와 초당 호출 수(rate, 토큰 버킷)를 제한합니다.
+    일시적인 실패의 재시도는 collect 안의 call_with_retry가 한 번만 담당하고(재시도 가능한 오류만),
+    키/호출 한도 오류(CRAWL_ABORT_RESULT_CODES)를 받으면 남은 값은 호출하지 않고 중단합니다.
+    파라미터마다 처리 결과를 crawl_checkpoint에 기록하므로 resume=True로 실패하거나 호출하지 않은 값을 이어서 수집할 수 있습니다.
+    
+    :param api_endpoint: CRAWL_SPECS에 등록된 API 이름
+    :param collect: 파라미터 하나를 수집하는 함수 (api_endpoint, db, mode, params)
+    :return: 실행 ID, 처리/건너뜀/실패 건수, 적재 건수 등의 요약
+    :raises CrawlSourceEmptyError: 파라미터 값의 출처 테이블이 비어 있는 경우
+    """
+    if api_endpoint not in CRAWL_SPECS:
+        raise ValueError(f"파라미터 크롤링을 지원하지 않는 API입니다: {api_endpoint}")
+
+    spec = CRAWL_SPECS[api_endpoint]
+    run_id, pending, skipped = await run_in_threadpool(_load_plan, api_endpoint, resume)
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate)
+    abort_error: str | None = None
+
+    async def crawl_one(value) -> dict:
+        nonlocal abort_error
+        async with semaphore:
+            if abort_error:
+                # 체크포인트를 남기지 않으므로 resume 때 다시 호출됨
+                return {"value": value, "status": "aborted"}
+            await bucket.acquire()
+            db = SessionFactory()
+            try:
+                result = await collect(api_endpoint, db, mode, {spec.param: value})
+                await run_in_threadpool(_save_checkpoint, api_endpoint, run_id, value, "done", result.get("count", 0))
+                return {"value": value, "status": "done", **result}
+            except Exception as e:
+                db.rollback()
+                error = getattr(e, "detail", None) or str(e)
+                cause = e.__cause__ or e
+                if isinstance(cause, UpstreamResultError) and cause.result_code in CRAWL_ABORT_RESULT_CODES:
+                    abort_error = error
+            finally:
+                db.close()
+            await run_in_threadpool(_save_checkpoint, api_endpoint, run_id, value, "failed", 0)
+            return {"value": value, "status": "failed", "error": error}
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(crawl_one(value) for value in pending))
+    failures = [result for result in results if result["status"] == "failed"]
+    aborted = sum(1 for result in results if result["status"] == "aborted")
+
+    return {
+        "endpoint": api_endpoint,
+        "param": spec.param,
+        "run_id": run_id,
+        "resumed": resume and skipped > 0,
+        "total": len(pending) + skipped,
+        "skipped": skipped,
+        "succeeded": len(results) - len(failures) - aborted,
+        "failed": len(failures),
+        "aborted": aborted,
+        "abort_reason": abort_error,
+        "count": sum(result.get("count", 0) for result in results),
+        "inserted": sum(result.get("inserted", 0) for result in results),
+        "updated": sum(result.get("updated", 0) for result in results),
+        "unchanged": sum(result.get("unchanged", 0) for result in results),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "failures": [{"value": result["value"], "error": result["error"]} for result in failures[:20]]
+    }
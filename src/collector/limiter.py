@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지는 토큰 버킷 (최대 burst개까지 누적).
+    acquire()는 토큰이 생길 때까지 기다리므로 호출 속도를 rate 이하로 제한합니다.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        # 통계: 토큰 발급 수, 대기해야 했던 횟수, 누적/최대 대기 시간
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """토큰 하나를 가져갑니다 (없으면 채워질 때까지 대기)."""
+        started = time.monotonic()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self.throttled += 1
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+        waited = time.monotonic() - started
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def stats(self) -> dict:
+        """제한 설정과 대기 통계를 반환합니다 (throttled가 늘고 있으면 호출이 제한되고 있는 것)."""
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.capacity,
+            "available_tokens": round(self._tokens, 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 1) if self.acquired else 0.0
+        }
@@ -0,0 +1,115 @@
+import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterable, Iterable, Iterator, AsyncIterator
+
+
+class UpstreamResultError(Exception):
+    """외부 API가 정상(00)이 아닌 resultCode를 반환한 경우 발생하는 예외"""
+
+    def __init__(self, result_code: str, result_msg: str | None = None):
+        self.result_code = result_code
+        self.result_msg = result_msg or "알 수 없는 오류"
+        super().__init__(f"API 오류 ({self.result_code}): {self.result_msg}")
+
+
+def element_to_dict(element: ET.Element) -> dict:
+    """itemList 요소 하나를 딕셔너리로 변환합니다 (값은 문자열 그대로, 타입 변환은 database.converter에서 수행)."""
+    item_dict = {}
+    for child in element:
+        # 빈 값 처리
+        item_dict[child.tag] = child.text.strip() or None if child.text else None
+    return item_dict
+
+
+class ItemListParser:
+    """
+    XML 바이트 청크를 받아 itemList 레코드를 하나씩 만들어내는 증분(streaming) 파서.
+
+    전체 응답을 문자열/트리로 만들지 않고, 완성된 itemList 요소만 딕셔너리로 변환한 뒤
+    트리에서 제거하므로 메모리 사용량이 응답 크기와 무관하게 거의 일정합니다.
+    헤더의 resultCode가 00이 아니면 본문을 더 읽기 전에 UpstreamResultError를 발생시킵니다.
+    """
+
+    def __init__(self, item_tag: str = "itemList"):
+        self.item_tag = item_tag
+        self.result_code: str | None = None
+        self.result_msg: str | None = None
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: list[ET.Element] = []
+        self._item_depth = 0
+        self._header: ET.Element | None = None
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """청크를 파서에 넣고 지금까지 완성된 레코드를 반환합니다."""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list[dict]:
+        """입력을 마치고 남은 레코드를 반환합니다."""
+        self._parser.close()
+        records = self._drain()
+        self._check_result()
+        return records
+
+    def _drain(self) -> list[dict]:
+        records = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                if element.tag == self.item_tag:
+                    self._item_depth += 1
+                continue
+
+            self._stack.pop()
+            if element.tag == self.item_tag:
+                self._item_depth -= 1
+                records.append(element_to_dict(element))
+                # 처리한 요소를 부모에서 떼어내어 트리가 커지지 않도록 함
+                if self._stack:
+                    self._stack[-1].remove(element)
+                element.clear()
+            elif self._item_depth:
+                continue
+            elif element.tag == "resultCode":
+                self.result_code = (element.text or "").strip()
+                self._header = self._stack[-1] if self._stack else None
+            elif element.tag == "resultMsg":
+                self.result_msg = (element.text or "").strip()
+            elif element is self._header:
+                # resultCode를 감싼 헤더 요소가 닫히면 본문을 읽기 전에 오류 여부를 판단
+                self._check_result()
+        return records
+
+    def _check_result(self):
+        if self.result_code and self.result_code != "00":
+            raise UpstreamResultError(self.result_code, self.result_msg)
+
+
+def iter_batches(chunks: Iterable[bytes], batch_size: int, parser: ItemListParser | None = None) -> Iterator[list[dict]]:
+    """바이트 청크 이터러블을 파싱하여 batch_size 단위의 레코드 묶음을 반환합니다."""
+    parser = parser or ItemListParser()
+    batch: list[dict] = []
+    for chunk in chunks:
+        batch.extend(parser.feed(chunk))
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+    batch.extend(parser.close())
+    while batch:
+        yield batch[:batch_size]
+        batch = batch[batch_size:]
+
+
+async def aiter_batches(chunks: AsyncIterable[bytes], batch_size: int, parser: ItemListParser | None = None) -> AsyncIterator[list[dict]]:
+    """비동기 바이트 스트림을 파싱하여 batch_size 단위의 레코드 묶음을 반환합니다."""
+    parser = parser or ItemListParser()
+    batch: list[dict] = []
+    async for chunk in chunks:
+        batch.extend(parser.feed(chunk))
+        while len(batch) >= batch_size:
+            yield batch[:batch_size]
+            batch = batch[batch_size:]
+    batch.extend(parser.close())
+    while batch:
+        yield batch[:batch_size]
+        batch = batch[batch_size:]
+
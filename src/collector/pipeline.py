@@ -0,0 +1,369 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from fastapi.concurrency import run_in_threadpool
+
+from collector.client import API_MODEL_MAPPING, build_url, call_with_retry
+from collector.parser import ItemListParser
+from collector.source import open_payload
+from database.connection import SessionFactory
+from database.repository import ingest_data
+
+
+logger = logging.getLogger(__name__)
+
+# 단계별 작업자 수 (파싱은 수집 작업자가 받은 청크를 넘기는 스레드 수)
+PIPELINE_FETCHERS = int(os.getenv("PIPELINE_FETCHERS", "4"))
+PIPELINE_PARSERS = int(os.getenv("PIPELINE_PARSERS", "2"))
+PIPELINE_WRITERS = int(os.getenv("PIPELINE_WRITERS", "2"))
+# 단계 사이 큐 크기 (가득 차면 앞 단계가 대기 -> 쓰기가 밀리면 응답 읽기도 멈춤)
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "8"))
+# 한 번에 DB에 쓰는 레코드 수
+PIPELINE_BATCH_SIZE = int(os.getenv("PIPELINE_BATCH_SIZE", os.getenv("INGEST_BATCH_SIZE", "1000")))
+# 조회용으로 보관할 최근 작업 수
+PIPELINE_JOB_HISTORY = int(os.getenv("PIPELINE_JOB_HISTORY", "200"))
+
+
+@dataclass
+class PipelineJob:
+    """파이프라인에 제출된 수집 작업 하나 (API 한 번 호출 -> 파싱 -> 적재)"""
+    id: str
+    api_endpoint: str
+    mode: str
+    params: dict | None = None
+    status: str = "queued"  # queued / fetching / parsing / writing / done / failed
+    submitted_at: datetime = field(default_factory=datetime.now)
+    finished_at: datetime | None = None
+    payload_bytes: int = 0
+    cache_hit: bool | None = None
+    batches_queued: int = 0
+    batches_total: int | None = None  # 응답을 끝까지 읽은 뒤에 정해짐
+    batches_done: int = 0
+    stats: dict = field(default_factory=lambda: {"count": 0, "inserted": 0, "updated": 0, "unchanged": 0})
+    error: str | None = None
+    exception: BaseException | None = field(default=None, repr=False)
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    async def wait(self) -> "PipelineJob":
+        """작업이 끝날 때까지 기다립니다."""
+        await self._done.wait()
+        return self
+
+    def result(self) -> dict:
+        """_collect_and_store_data와 같은 형식의 수집 결과"""
+        model_name = API_MODEL_MAPPING.get(self.api_endpoint, self.api_endpoint)
+        if not self.stats["count"]:
+            return {
+                "message": f"{self.api_endpoint}: 수집된 데이터가 없습니다.",
+                "count": 0,
+                "job_id": self.id,
+                "endpoint": self.api_endpoint,
+                "url": build_url(self.api_endpoint)
+            }
+        return {
+            "message": f"{self.api_endpoint} 데이터 수집 및 저장 완료",
+            **self.stats,
+            "mode": self.mode,
+            "cache_hit": self.cache_hit,
+            "job_id": self.id,
+            "endpoint": self.api_endpoint,
+            "model": model_name,
+            "url": build_url(self.api_endpoint)
+        }
+
+    def to_dict(self) -> dict:
+        elapsed = ((self.finished_at or datetime.now()) - self.submitted_at).total_seconds()
+        return {
+            "job_id": self.id,
+            "endpoint": self.api_endpoint,
+            "params": self.params,
+            "mode": self.mode,
+            "status": self.status,
+            "submitted_at": self.submitted_at.isoformat(timespec="seconds"),
+            "finished_at": self.finished_at.isoformat(timespec="seconds") if self.finished_at else None,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "payload_bytes": self.payload_bytes,
+            "cache_hit": self.cache_hit,
+            "batches_queued": self.batches_queued,
+            "batches_total": self.batches_total,
+            "batches_done": self.batches_done,
+            **self.stats,
+            "error": self.error,
+            "result": self.result() if self.status == "done" else None
+        }
+
+
+@dataclass
+class StageStats:
+    """단계별 처리량 통계"""
+    workers: int
+    processed: int = 0
+    items: int = 0
+    bytes: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+
+    def to_dict(self, uptime: float) -> dict:
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "items": self.items,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 3),
+            # 작업자 한 명이 일하는 동안의 처리 속도
+            "items_per_second": round(self.items / self.busy_seconds, 1) if self.busy_seconds else 0.0,
+            # 전체 작업자 시간 중 일한 비율 (1에 가까우면 이 단계가 병목)
+            "utilization": round(self.busy_seconds / (uptime * self.workers), 3) if uptime and self.workers else 0.0
+        }
+
+
+def _write_batch(model_name: str, batch: list[dict], mode: str) -> dict:
+    """레코드 묶음 하나를 자체 세션(트랜잭션)으로 적재합니다."""
+    db = SessionFactory()
+    try:
+        return ingest_data(db, model_name, batch, mode)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+class IngestPipeline:
+    """
+    수집(fetch) -> 파싱(parse) -> 적재(write) 단계를 크기 제한 큐로 연결한 수집 파이프라인.
+
+    - 수집 단계: 비동기 작업자가 외부 API 응답을 청크 단위로 읽음 (재시도/차단기/캐시 적용)
+    - 파싱 단계: 받은 청크를 바로 증분 파서(ItemListParser)에 넣음 (파싱 스레드에서)
+    - 적재 단계: 묶음이 찰 때마다 적재 큐로 넘겨 각자의 세션으로 DB에 저장
+
+    응답 전체를 메모리에 올리지 않으므로 응답 크기와 무관하게 작업당 메모리는 묶음 몇 개 분량이고,
+    적재 큐가 가득 차면 수집 작업자가 다음 청크를 읽지 않고 기다리므로 적재가 밀리면 외부 API 읽기도 늦춰집니다.
+    """
+
+    def __init__(self, fetchers: int = PIPELINE_FETCHERS, parsers: int = PIPELINE_PARSERS,
+                 writers: int = PIPELINE_WRITERS, queue_size: int = PIPELINE_QUEUE_SIZE,
+                 batch_size: int = PIPELINE_BATCH_SIZE, on_job_done: Callable[[PipelineJob], None] | None = None):
+        """:param on_job_done: 작업이 성공적으로 끝날 때마다 호출할 함수 (예: 적재 후 집계 갱신 요청)"""
+        self.fetchers = fetchers
+        self.parsers = parsers
+        self.writers = writers
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.on_job_done = on_job_done
+        self.jobs: OrderedDict[str, PipelineJob] = OrderedDict()
+        self._fetch_queue: asyncio.Queue | None = None
+        self._write_queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._parse_executor: ThreadPoolExecutor | None = None
+        self._started_at: float | None = None
+        self._stages = {
+            "fetch": StageStats(fetchers),
+            "parse": StageStats(parsers),
+            "write": StageStats(writers)
+        }
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self):
+        """단계별 작업자를 시작합니다."""
+        if self.running:
+            return
+        self._fetch_queue = asyncio.Queue(self.queue_size)
+        self._write_queue = asyncio.Queue(self.queue_size)
+        self._parse_executor = ThreadPoolExecutor(self.parsers, thread_name_prefix="pipeline-parse")
+        self._tasks = (
+            [asyncio.create_task(self._fetch_worker()) for _ in range(self.fetchers)]
+            + [asyncio.create_task(self._write_worker()) for _ in range(self.writers)]
+        )
+        self._started_at = time.monotonic()
+
+    async def stop(self):
+        """작업자를 멈추고 끝나지 않은 작업은 실패로 처리합니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._parse_executor:
+            self._parse_executor.shutdown(wait=False, cancel_futures=True)
+            self._parse_executor = None
+        for job in self.jobs.values():
+            if not job.finished:
+                self._fail(job, RuntimeError("파이프라인이 종료되어 작업이 취소되었습니다."))
+
+    async def submit(self, api_endpoint: str, mode: str = "incremental", params: dict | None = None) -> PipelineJob:
+        """
+        수집 작업을 제출하고 작업 객체를 반환합니다.
+        수집 큐가 가득 차 있으면 자리가 날 때까지 기다립니다 (backpressure).
+        """
+        if not self.running:
+            raise RuntimeError("수집 파이프라인이 시작되지 않았습니다.")
+        job = PipelineJob(uuid.uuid4().hex[:12], api_endpoint, mode, params)
+        self.jobs[job.id] = job
+        while len(self.jobs) > PIPELINE_JOB_HISTORY:
+            oldest_id, oldest = next(iter(self.jobs.items()))
+            if not oldest.finished:
+                break
+            del self.jobs[oldest_id]
+        await self._fetch_queue.put(job)
+        return job
+
+    def get_job(self, job_id: str) -> PipelineJob | None:
+        return self.jobs.get(job_id)
+
+    # ----- 단계별 작업자 -----
+
+    async def _fetch_worker(self):
+        stage = self._stages["fetch"]
+        while True:
+            job = await self._fetch_queue.get()
+            try:
+                job.status = "fetching"
+                # 적재 큐에 넘긴 묶음이 있으면 다시 받을 때 중복 저장되므로 재시도하지 않음
+                await call_with_retry(job.api_endpoint, lambda: self._stream(job),
+                                      retry_if=lambda e: job.batches_queued == 0)
+                stage.processed += 1
+            except Exception as e:
+                stage.errors += 1
+                self._fail(job, e)
+            finally:
+                self._fetch_queue.task_done()
+
+    async def _stream(self, job: PipelineJob):
+        """
+        응답을 청크 단위로 읽어 파서에 넣고, 묶음이 찰 때마다 적재 큐에 넣습니다.
+        resultCode 오류는 파서가 헤더를 읽는 즉시 발생하므로 본문을 더 받지 않습니다.
+        """
+        fetch_stage, parse_stage = self._stages["fetch"], self._stages["parse"]
+        parser = ItemListParser()
+        batch: list[dict] = []
+        job.payload_bytes = 0
+        async with open_payload(job.api_endpoint, job.params) as payload:
+            job.cache_hit = payload.cache_hit
+            chunks = aiter(payload.chunks)
+            while True:
+                started = time.perf_counter()
+                chunk = await anext(chunks, None)
+                fetch_stage.busy_seconds += time.perf_counter() - started
+                if chunk is None:
+                    break
+                if job.finished:
+                    # 적재 단계에서 이미 실패한 작업은 나머지를 읽지 않음
+                    return
+                job.status = "parsing"
+                job.payload_bytes += len(chunk)
+                fetch_stage.bytes += len(chunk)
+                batch.extend(await self._parse(parser.feed, chunk))
+                while len(batch) >= self.batch_size:
+                    await self._queue_batch(job, batch[:self.batch_size])
+                    batch = batch[self.batch_size:]
+            batch.extend(await self._parse(parser.close))
+        parse_stage.processed += 1
+        parse_stage.bytes += job.payload_bytes
+        for start in range(0, len(batch), self.batch_size):
+            await self._queue_batch(job, batch[start:start + self.batch_size])
+
+        # 응답을 끝까지 읽어야 전체 묶음 수를 알 수 있음 (이미 모두 적재했으면 여기서 완료)
+        job.batches_total = job.batches_queued
+        if job.batches_done == job.batches_total:
+            self._finish(job)
+        elif not job.finished:
+            job.status = "writing"
+
+    async def _parse(self, func, *args) -> list[dict]:
+        """파서 호출을 파싱 스레드에서 실행합니다 (이벤트 루프를 막지 않도록)."""
+        stage = self._stages["parse"]
+        started = time.perf_counter()
+        try:
+            records = await asyncio.get_running_loop().run_in_executor(self._parse_executor, func, *args)
+        finally:
+            stage.busy_seconds += time.perf_counter() - started
+        stage.items += len(records)
+        return records
+
+    async def _queue_batch(self, job: PipelineJob, batch: list[dict]):
+        # 적재 큐가 가득 차면 여기서 대기 -> 그동안 응답을 더 읽지 않음
+        await self._write_queue.put((job, batch))
+        job.batches_queued += 1
+
+    async def _write_worker(self):
+        stage = self._stages["write"]
+        while True:
+            job, batch = await self._write_queue.get()
+            started = time.perf_counter()
+            try:
+                if job.finished:
+                    continue
+                model_name = API_MODEL_MAPPING.get(job.api_endpoint, job.api_endpoint)
+                batch_stats = await run_in_threadpool(_write_batch, model_name, batch, job.mode)
+                for key, value in batch_stats.items():
+                    job.stats[key] += value
+                job.stats["count"] += len(batch)
+                job.batches_done += 1
+                stage.processed += 1
+                stage.items += len(batch)
+                if job.batches_done == job.batches_total:
+                    self._finish(job)
+            except Exception as e:
+                stage.errors += 1
+                self._fail(job, e)
+            finally:
+                stage.busy_seconds += time.perf_counter() - started
+                self._write_queue.task_done()
+
+    def _finish(self, job: PipelineJob):
+        job.status = "done"
+        job.finished_at = datetime.now()
+        job._done.set()
+        if self.on_job_done:
+            try:
+                self.on_job_done(job)
+            except Exception:
+                logger.exception("수집 작업 완료 처리 실패: %s %s", job.id, job.api_endpoint)
+
+    def _fail(self, job: PipelineJob, error: BaseException):
+        if job.finished:
+            return
+        job.status = "failed"
+        job.error = getattr(error, "detail", None) or str(error)
+        if job.batches_done:
+            total = job.batches_total if job.batches_total is not None else job.batches_queued
+            job.error += f" (묶음 {job.batches_done}/{total}개는 이미 저장됨)"
+        job.exception = error
+        job.finished_at = datetime.now()
+        job._done.set()
+        logger.warning("수집 작업 실패: %s %s (%s)", job.id, job.api_endpoint, job.error)
+
+    def stats(self) -> dict:
+        """큐 깊이, 단계별 처리량, 작업 상태별 개수를 반환합니다."""
+        uptime = time.monotonic() - self._started_at if self._started_at else 0.0
+        queues = {"fetch": self._fetch_queue, "write": self._write_queue}
+        job_counts: dict[str, int] = {}
+        for job in self.jobs.values():
+            job_counts[job.status] = job_counts.get(job.status, 0) + 1
+        return {
+            "running": self.running,
+            "uptime_seconds": round(uptime, 1),
+            "batch_size": self.batch_size,
+            "queues": {
+                name: {"depth": queue.qsize() if queue else 0, "max": self.queue_size}
+                for name, queue in queues.items()
+            },
+            "stages": {name: stage.to_dict(uptime) for name, stage in self._stages.items()},
+            "jobs": job_counts
+        }
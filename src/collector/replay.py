@@ -0,0 +1,105 @@
+"""
+보관된 원본 응답(ARCHIVE_DIR)을 네트워크 없이 DB에 다시 적재합니다.
+
+사용 예 (src 디렉터리에서):
+    python -m collector.replay --endpoint getRoadTrafficInfoList --since 20250801 --workers 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from collector.archive import ARCHIVE_DIR, ArchivedPayload, iter_archived_chunks, list_archived
+from collector.client import API_MODEL_MAPPING
+from collector.parser import iter_batches
+from database.connection import SessionFactory, create_tables
+from database.repository import HISTORY_TIME_COLUMNS, ingest_data
+
+
+REPLAY_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+
+
+def replay_files(payloads: list[ArchivedPayload], mode: str = "incremental") -> dict:
+    """보관 파일들을 주어진 순서대로 하나의 세션에서 적재합니다."""
+    stats = {"files": 0, "count": 0, "inserted": 0, "updated": 0, "unchanged": 0, "errors": []}
+    db = SessionFactory()
+    try:
+        for payload in payloads:
+            model_name = API_MODEL_MAPPING[payload.api_endpoint]
+            try:
+                for batch in iter_batches(iter_archived_chunks(payload.path), REPLAY_BATCH_SIZE):
+                    for key, value in ingest_data(db, model_name, batch, mode).items():
+                        stats[key] += value
+                    stats["count"] += len(batch)
+                stats["files"] += 1
+            except Exception as e:
+                db.rollback()
+                stats["errors"].append({"path": payload.path, "error": str(e)})
+    finally:
+        db.close()
+    return stats
+
+
+def plan_tasks(payloads: list[ArchivedPayload]) -> list[list[ArchivedPayload]]:
+    """
+    병렬로 실행할 작업 단위를 만듭니다.
+    이력 테이블은 자연키에 수집 시각이 들어 있어 순서와 무관하므로 파일마다 독립 작업으로,
+    기준 정보 테이블은 최신 스냅샷이 마지막에 적용되도록 API별로 시간 순서대로 한 작업에 묶습니다.
+    """
+    tasks, ordered = [], {}
+    for payload in payloads:
+        if API_MODEL_MAPPING[payload.api_endpoint] in HISTORY_TIME_COLUMNS:
+            tasks.append([payload])
+        else:
+            ordered.setdefault(payload.api_endpoint, []).append(payload)
+    return list(ordered.values()) + tasks
+
+
+def replay(archive_dir: str = ARCHIVE_DIR, api_endpoint: str | None = None, since: datetime | None = None,
+           until: datetime | None = None, workers: int = 4, mode: str = "incremental") -> dict:
+    """보관된 응답을 병렬로 다시 적재하고 요약을 반환합니다."""
+    payloads = [payload for payload in list_archived(archive_dir, api_endpoint, since, until)
+                if payload.api_endpoint in API_MODEL_MAPPING]
+    started = time.perf_counter()
+    summary = {"files": 0, "count": 0, "inserted": 0, "updated": 0, "unchanged": 0, "errors": []}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for stats in executor.map(lambda task: replay_files(task, mode), plan_tasks(payloads)):
+            for key, value in stats.items():
+                summary[key] += value
+
+    summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    summary["rows_per_second"] = round(summary["count"] / summary["elapsed_seconds"]) if summary["elapsed_seconds"] else 0
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관된 외부 API 응답을 DB에 다시 적재합니다.")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR, help="보관 디렉터리 (기본: ARCHIVE_DIR 환경 변수)")
+    parser.add_argument("--endpoint", help="특정 API만 적재 (예: getRoadTrafficInfoList)")
+    parser.add_argument("--since", help="이 시각 이후 수집분만 (YYYYMMDD 또는 YYYYMMDDHHMMSS)")
+    parser.add_argument("--until", help="이 시각 이전 수집분만 (YYYYMMDD 또는 YYYYMMDDHHMMSS)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 적재 작업 수")
+    parser.add_argument("--mode", choices=["incremental", "append"], default="incremental", help="적재 방식")
+    args = parser.parse_args()
+
+    def parse_time(value: str | None) -> datetime | None:
+        if not value:
+            return None
+        return datetime.strptime(value, "%Y%m%d%H%M%S" if len(value) > 8 else "%Y%m%d")
+
+    if not args.archive_dir:
+        parser.error("보관 디렉터리를 --archive-dir 또는 ARCHIVE_DIR 환경 변수로 지정하세요.")
+
+    create_tables()
+    summary = replay(args.archive_dir, args.endpoint, parse_time(args.since), parse_time(args.until), args.workers, args.mode)
+    print(f"파일 {summary['files']}개, 레코드 {summary['count']}건 적재 "
+          f"(신규 {summary['inserted']}, 변경 {summary['updated']}, 동일 {summary['unchanged']}) - "
+          f"{summary['elapsed_seconds']}초, 초당 {summary['rows_per_second']}건")
+    for error in summary["errors"]:
+        print(f"실패: {error['path']} - {error['error']}")
+
+
+if __name__ == "__main__":
+    main()
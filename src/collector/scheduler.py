@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import os
+import random
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+# 여러 워커(uvicorn --workers) 중 하나만 스케줄러를 실행하도록 잡는 파일 잠금 경로
+SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", os.path.join(tempfile.gettempdir(), "gyeonggi_scheduler.lock"))
+# 잠금을 잡지 못한 프로세스가 다시 시도하는 간격 (초) - 리더 프로세스가 죽으면 다른 워커가 이어서 실행
+SCHEDULER_LEADER_RETRY = float(os.getenv("SCHEDULER_LEADER_RETRY", "30"))
+# 실행 간격에 더할 무작위 지터 비율 (0.1 = ±10%)
+SCHEDULER_JITTER = float(os.getenv("SCHEDULER_JITTER", "0.1"))
+# 연속 실패 시 대기 시간의 상한 (초). 대기 시간은 수집 간격에서 시작해 실패할 때마다 2배씩 늘어나며,
+# 수집 간격이 이 값보다 길면 수집 간격을 상한으로 씀 (실패했다고 간격보다 자주 호출하지 않음)
+SCHEDULER_BACKOFF_MAX = float(os.getenv("SCHEDULER_BACKOFF_MAX", "3600"))
+
+# 데이터셋별 기본 수집 간격 (초)
+DEFAULT_INTERVALS = {
+    'getRoadInfoList': 24 * 60 * 60,
+    'getRoadLinkInfoList': 24 * 60 * 60,
+    'getRoadTrafficInfoList': 5 * 60,
+    'getRoadLinkTrafficInfoList': 5 * 60,
+    'getRoadLinkTrafficInfo': 5 * 60,
+    'getRoadLinkCongestInfo': 5 * 60,
+    'getIncidentInfo': 2 * 60,
+    'getParkingPlaceInfoList': 24 * 60 * 60,
+    'getParkingPlaceAvailabilityInfoList': 60
+}
+
+
+def get_intervals() -> dict[str, float]:
+    """
+    데이터셋별 수집 간격을 반환합니다.
+    SCHEDULE_INTERVALS="getIncidentInfo=60,getRoadLinkInfoList=0" 처럼 덮어쓸 수 있으며 0이면 해당 작업을 끕니다.
+    """
+    intervals = dict(DEFAULT_INTERVALS)
+    for entry in os.getenv("SCHEDULE_INTERVALS", "").split(","):
+        name, _, seconds = entry.partition("=")
+        if seconds:
+            intervals[name.strip()] = float(seconds)
+    return {name: seconds for name, seconds in intervals.items() if seconds > 0}
+
+
+@dataclass
+class ScheduledJob:
+    """주기적으로 실행할 작업과 실행 상태"""
+    name: str
+    interval: float
+    func: Callable[[], Awaitable[object]]
+    next_run_at: datetime | None = None
+    last_started_at: datetime | None = None
+    last_finished_at: datetime | None = None
+    last_duration: float | None = None
+    last_lag: float | None = None
+    last_status: str | None = None
+    last_error: str | None = None
+    run_count: int = 0
+    failure_count: int = 0
+    consecutive_failures: int = 0
+    running: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def to_dict(self) -> dict:
+        now = datetime.now()
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval,
+            "running": self.running,
+            "last_started_at": self.last_started_at,
+            "last_finished_at": self.last_finished_at,
+            "last_duration_seconds": self.last_duration,
+            "last_lag_seconds": self.last_lag,
+            "last_status": self.last_status,
+            "last_error": self.last_error,
+            "next_run_at": self.next_run_at,
+            # 예정 시각이 지났는데 아직 시작하지 못한 경우의 지연 시간
+            "current_lag_seconds": max((now - self.next_run_at).total_seconds(), 0) if self.next_run_at and not self.running else 0,
+            "run_count": self.run_count,
+            "failure_count": self.failure_count,
+            "consecutive_failures": self.consecutive_failures
+        }
+
+
+class Scheduler:
+    """
+    데이터셋별 주기 수집을 실행하는 프로세스 내 스케줄러.
+    작업마다 독립된 asyncio 태스크로 돌며, 지터와 실패 시 지수 백오프를 적용하고 같은 작업이 겹쳐 실행되지 않도록 합니다.
+    파일 잠금을 잡은 프로세스 하나만 실제로 작업을 실행하고, 나머지는 SCHEDULER_LEADER_RETRY초마다 잠금을 다시 시도합니다.
+    """
+
+    def __init__(self, lock_file: str = SCHEDULER_LOCK_FILE):
+        self.jobs: dict[str, ScheduledJob] = {}
+        self.lock_file = lock_file
+        self.is_leader = False
+        self._lock_handle = None
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, name: str, interval: float, func: Callable[[], Awaitable[object]]):
+        """작업을 등록합니다."""
+        self.jobs[name] = ScheduledJob(name=name, interval=interval, func=func)
+
+    def _acquire_lock(self) -> bool:
+        """이 프로세스가 스케줄러를 실행할지 파일 잠금으로 결정합니다 (배포당 하나만 실행)."""
+        handle = open(self.lock_file, "a+")
+        try:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            return False
+        self._lock_handle = handle
+        return True
+
+    def _release_lock(self):
+        if self._lock_handle is not None:
+            if fcntl:
+                fcntl.flock(self._lock_handle, fcntl.LOCK_UN)
+            self._lock_handle.close()
+            self._lock_handle = None
+
+    async def start(self):
+        """잠금을 잡으면 작업 태스크를 시작하고, 못 잡으면 잡을 때까지 주기적으로 다시 시도합니다."""
+        if self._try_lead():
+            return
+        logger.info("다른 프로세스가 스케줄러를 실행 중이므로 이 워커는 대기합니다 (%s초마다 잠금 재시도).", SCHEDULER_LEADER_RETRY)
+        self._tasks.append(asyncio.create_task(self._wait_for_leadership(), name="scheduler:leader-election"))
+
+    def _try_lead(self) -> bool:
+        """잠금을 잡았으면 리더가 되어 작업 태스크를 시작합니다."""
+        if not self._acquire_lock():
+            return False
+        self.is_leader = True
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._run_forever(job), name=f"scheduler:{job.name}"))
+        return True
+
+    async def _wait_for_leadership(self):
+        # 리더 프로세스가 종료되면 잠금이 풀리므로 다음 시도에서 이 프로세스가 이어받음
+        while True:
+            await asyncio.sleep(SCHEDULER_LEADER_RETRY)
+            if self._try_lead():
+                logger.info("스케줄러 잠금을 잡아 이 워커에서 작업을 시작합니다.")
+                return
+
+    async def stop(self):
+        """실행 중인 작업 태스크를 취소하고 잠금을 해제합니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._release_lock()
+        self.is_leader = False
+
+    async def run_job(self, name: str) -> bool:
+        """작업을 한 번 실행합니다. 이미 실행 중이면 건너뛰고 False를 반환합니다."""
+        job = self.jobs[name]
+        if job.lock.locked():
+            return False
+        async with job.lock:
+            job.running = True
+            job.last_started_at = datetime.now()
+            if job.next_run_at:
+                job.last_lag = max((job.last_started_at - job.next_run_at).total_seconds(), 0)
+            started = time.perf_counter()
+            try:
+                await job.func()
+                job.last_status = "success"
+                job.last_error = None
+                job.consecutive_failures = 0
+            except Exception as e:
+                job.last_status = "error"
+                job.last_error = getattr(e, "detail", None) or str(e)
+                logger.warning("스케줄 작업 실패: %s (%s)", name, job.last_error)
+                job.failure_count += 1
+                job.consecutive_failures += 1
+            finally:
+                job.running = False
+                job.run_count += 1
+                job.last_duration = time.perf_counter() - started
+                job.last_finished_at = datetime.now()
+        return True
+
+    def _next_delay(self, job: ScheduledJob) -> float:
+        """다음 실행까지의 대기 시간 (성공 시 간격±지터, 실패 시 간격부터 2배씩 늘리는 지수 백오프)"""
+        if job.consecutive_failures:
+            # 2 ** n이 너무 커지지 않도록 지수를 제한 (2 ** 20배면 어떤 간격도 상한을 넘음)
+            exponent = min(job.consecutive_failures - 1, 20)
+            delay = min(job.interval * 2 ** exponent, max(SCHEDULER_BACKOFF_MAX, job.interval))
+        else:
+            delay = job.interval
+        return max(delay * (1 + random.uniform(-SCHEDULER_JITTER, SCHEDULER_JITTER)), 1)
+
+    async def _run_forever(self, job: ScheduledJob):
+        # 모든 작업이 동시에 시작하지 않도록 첫 실행을 최대 10초 안에서 분산
+        delay = random.uniform(0, min(job.interval, 10))
+        while True:
+            job.next_run_at = datetime.now() + timedelta(seconds=delay)
+            await asyncio.sleep(delay)
+            await self.run_job(job.name)
+            delay = self._next_delay(job)
+
+    def status(self) -> dict:
+        """스케줄러와 작업별 상태를 반환합니다."""
+        return {
+            "enabled": SCHEDULER_ENABLED,
+            "leader": self.is_leader,
+            "jobs": [job.to_dict() for job in self.jobs.values()]
+        }
@@ -0,0 +1,109 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from cache import TTLCache
+from collector.archive import open_archive
+from collector.client import stream
+
+
+UPSTREAM_CACHE_ENABLED = os.getenv("UPSTREAM_CACHE_ENABLED", "true").strip().lower() in ("1", "true", "yes")
+UPSTREAM_CACHE_MAX_ENTRIES = int(os.getenv("UPSTREAM_CACHE_MAX_ENTRIES", "256"))
+# 이보다 큰 응답은 캐시하지 않음 (바이트)
+UPSTREAM_CACHE_MAX_ENTRY_BYTES = int(os.getenv("UPSTREAM_CACHE_MAX_ENTRY_BYTES", str(8 * 1024 * 1024)))
+CACHE_CHUNK_SIZE = 64 * 1024
+
+# API별 응답 캐시 유지 시간 (초)
+DEFAULT_CACHE_TTLS = {
+    'getRoadInfoList': 60 * 60,
+    'getRoadLinkInfoList': 60 * 60,
+    'getRoadTrafficInfoList': 60,
+    'getRoadLinkTrafficInfoList': 60,
+    'getRoadLinkTrafficInfo': 60,
+    'getRoadLinkCongestInfo': 60,
+    'getIncidentInfo': 60,
+    'getParkingPlaceInfoList': 60 * 60,
+    'getParkingPlaceAvailabilityInfoList': 30
+}
+
+
+def get_cache_ttls() -> dict[str, float]:
+    """API별 캐시 TTL을 반환합니다. UPSTREAM_CACHE_TTLS="getIncidentInfo=30,..." 로 덮어쓸 수 있습니다 (0이면 캐시 안 함)."""
+    ttls = dict(DEFAULT_CACHE_TTLS)
+    for entry in os.getenv("UPSTREAM_CACHE_TTLS", "").split(","):
+        name, _, seconds = entry.partition("=")
+        if seconds:
+            ttls[name.strip()] = float(seconds)
+    return ttls
+
+
+CACHE_TTLS = get_cache_ttls()
+upstream_cache = TTLCache(max_entries=UPSTREAM_CACHE_MAX_ENTRIES)
+
+
+def cache_key(api_endpoint: str, params: dict | None = None) -> tuple:
+    """API 이름과 정렬된 요청 파라미터로 캐시 키를 만듭니다."""
+    return (api_endpoint, tuple(sorted((key, str(value)) for key, value in (params or {}).items())))
+
+
+@dataclass
+class Payload:
+    """응답 본문 청크 스트림과 캐시 적중 여부"""
+    chunks: AsyncIterator[bytes]
+    cache_hit: bool
+
+
+async def _iter_cached(body: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), CACHE_CHUNK_SIZE):
+        yield body[start:start + CACHE_CHUNK_SIZE]
+
+
+@asynccontextmanager
+async def open_payload(api_endpoint: str, params: dict | None = None, use_cache: bool = True) -> AsyncIterator[Payload]:
+    """
+    외부 API 응답 본문을 청크 스트림으로 엽니다.
+    같은 API+파라미터를 TTL 안에 다시 요청하면 캐시된 본문을 돌려주어 호출 한도를 아끼고,
+    네트워크에서 받은 본문은 스트리밍하면서 (설정된 경우) gzip 보관 파일과 캐시에 함께 기록합니다.
+    블록 안에서 예외가 나면(resultCode 오류 포함) 캐시/보관하지 않습니다.
+    """
+    ttl = CACHE_TTLS.get(api_endpoint, 0)
+    caching = use_cache and UPSTREAM_CACHE_ENABLED and ttl > 0
+    key = cache_key(api_endpoint, params)
+
+    cached = upstream_cache.get(key) if caching else None
+    if cached is not None:
+        yield Payload(_iter_cached(cached), cache_hit=True)
+        return
+
+    async with stream(api_endpoint, params) as response:
+        archive = open_archive(api_endpoint, params)
+        state = {"buffer": bytearray() if caching else None, "complete": False}
+
+        async def chunks() -> AsyncIterator[bytes]:
+            async for chunk in response.aiter_bytes():
+                if archive:
+                    archive.write(chunk)
+                buffer = state["buffer"]
+                if buffer is not None:
+                    buffer.extend(chunk)
+                    if len(buffer) > UPSTREAM_CACHE_MAX_ENTRY_BYTES:
+                        state["buffer"] = None
+                yield chunk
+            state["complete"] = True
+
+        try:
+            yield Payload(chunks(), cache_hit=False)
+        except BaseException:
+            if archive:
+                archive.discard()
+            raise
+
+        if not state["complete"]:
+            if archive:
+                archive.discard()
+            return
+        if archive:
+            archive.commit()
+        if state["buffer"] is not None:
+            upstream_cache.set(key, bytes(state["buffer"]), ttl)
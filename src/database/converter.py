@@ -0,0 +1,125 @@
+import logging
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Annotated, Any, TypedDict
+
+from pydantic import BeforeValidator, ConfigDict, TypeAdapter, ValidationError
+
+from database.orm import Base
+
+
+logger = logging.getLogger(__name__)
+
+# 외부 API가 보내는 날짜/시각 형식 (collDate: 20250801123000, ocrnDt: 2025-08-01 12:30:00 등)
+UPSTREAM_DATETIME_FORMATS = (
+    "%Y%m%d%H%M%S", "%Y%m%d%H%M", "%Y%m%d",
+    "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d",
+    "%Y.%m.%d %H:%M:%S", "%Y.%m.%d"
+)
+
+
+def _blank_to_none(value: Any) -> Any:
+    """앞뒤 공백을 제거하고 빈 문자열은 None으로 바꿉니다."""
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    return value
+
+
+def parse_upstream_datetime(value: Any) -> Any:
+    """외부 API의 날짜/시각 문자열을 datetime으로 변환합니다 (형식이 맞지 않으면 그대로 두어 검증 오류로 처리)."""
+    if isinstance(value, int):
+        value = str(value)
+    if not isinstance(value, str):
+        return value
+    for fmt in UPSTREAM_DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return value
+
+
+def parse_decimal(value: Any) -> Any:
+    """좌표 등 소수 값을 Decimal로 변환합니다 (쉼표 허용)."""
+    if isinstance(value, str):
+        try:
+            return Decimal(value.replace(",", ""))
+        except InvalidOperation:
+            return value
+    return value
+
+
+def _column_python_type(column) -> type:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return str
+
+
+def _field_annotation(python_type: type):
+    """ORM 컬럼 타입에 맞는 검증 타입 (빈 값은 None, 날짜/소수는 전용 변환기 적용)"""
+    validators = [BeforeValidator(_blank_to_none)]
+    if python_type in (datetime, date):
+        validators.insert(0, BeforeValidator(parse_upstream_datetime))
+    elif python_type is Decimal:
+        validators.insert(0, BeforeValidator(parse_decimal))
+    # BeforeValidator는 뒤에 선언한 것부터 실행되므로 빈 값 처리가 먼저 적용됨
+    return Annotated[python_type | None, *validators]
+
+
+class RecordConverter:
+    """
+    모델 하나에 대한 레코드 변환기.
+
+    ORM 컬럼 타입으로 TypedDict 스키마를 한 번만 만들어 두고, 묶음 전체를
+    TypeAdapter(list[...])로 한 번에 검증/변환합니다 (행마다 파이썬 코드를 돌지 않음).
+    - 모델에 없는 태그는 버림
+    - 빈 문자열 -> None, 숫자/소수/날짜 컬럼은 해당 타입으로, 문자열 컬럼은 문자열로 변환
+    - 변환할 수 없는 값은 None으로 바꾸고 경고 로그를 남김
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.columns = {
+            column.name: _column_python_type(column)
+            for column in model.__table__.columns
+            if not column.primary_key
+        }
+        record_type = TypedDict(f"{model.__name__}Record", {
+            name: _field_annotation(python_type) for name, python_type in self.columns.items()
+        }, total=False)
+        record_type.__pydantic_config__ = ConfigDict(extra="ignore", coerce_numbers_to_str=True)
+        self._adapter = TypeAdapter(list[record_type])
+
+    def convert(self, records: list[dict]) -> list[dict]:
+        """레코드 묶음을 컬럼 타입에 맞게 변환합니다."""
+        if not records:
+            return []
+        try:
+            return self._adapter.validate_python(records)
+        except ValidationError as e:
+            # 잘못된 값이 있는 필드만 None으로 바꾸고 다시 한 번 묶음 전체를 변환
+            records = [dict(record) for record in records]
+            for error in e.errors():
+                loc = error["loc"]
+                if len(loc) >= 2 and isinstance(loc[0], int) and loc[1] in self.columns:
+                    records[loc[0]][loc[1]] = None
+            logger.warning("%s: 변환할 수 없는 값 %d개를 비웠습니다 (예: %s)",
+                           self.model.__name__, e.error_count(), e.errors()[0]["msg"])
+            return self._adapter.validate_python(records)
+
+
+@lru_cache(maxsize=None)
+def get_converter(model_name: str) -> RecordConverter:
+    """모델 이름에 해당하는 변환기를 반환합니다 (모델별로 한 번만 생성)."""
+    for mapper in Base.registry.mappers:
+        if mapper.class_.__name__ == model_name:
+            return RecordConverter(mapper.class_)
+    raise ValueError(f"Model '{model_name}' not found.")
+
+
+def convert_records(model_name: str, records: list[dict]) -> list[dict]:
+    """수집한 레코드 묶음을 모델의 컬럼 타입에 맞게 변환합니다."""
+    return get_converter(model_name).convert(records)
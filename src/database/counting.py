@@ -0,0 +1,111 @@
+"""
+목록 조회의 전체 건수(total_count) 계산 방식.
+
+    exact   같은 조건의 COUNT(*) 결과를 (조건, 조회하는 테이블들의 데이터 버전)별로 캐시 - 그 테이블에 적재가 커밋되면 다시 셈
+    approx  조건이 없으면 테이블 통계의 행 수, 조건이 있으면 실행 계획의 예상 행 수 (지원하지 않는 DB는 exact)
+    none    세지 않음 (응답의 has_more로 다음 페이지 여부만 확인)
+"""
+import json
+import logging
+import os
+from typing import Literal
+
+from sqlalchemy import Table, func, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select, visitors
+
+from cache import TTLCache
+from database.version import table_versions
+
+
+logger = logging.getLogger(__name__)
+
+CountMode = Literal["exact", "approx", "none"]
+
+# exact 건수 캐시 (버전이 그대로여도 TTL이 지나면 다시 셈 - 세션을 거치지 않은 쓰기 대비)
+COUNT_CACHE_TTL = float(os.getenv("COUNT_CACHE_TTL", "60"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1024"))
+count_cache = TTLCache(max_entries=COUNT_CACHE_MAX_ENTRIES, ttl=COUNT_CACHE_TTL)
+
+
+def count_statement(stmt: Select) -> Select:
+    """같은 조건의 COUNT 문 (하위 쿼리로 감싸지 않아 조건의 인덱스를 그대로 사용)"""
+    return stmt.with_only_columns(func.count(), maintain_column_froms=True).order_by(None)
+
+
+def read_tables(stmt: Select) -> tuple[str, ...]:
+    """문장이 읽는 테이블 이름 (FROM 절과 조건 안의 하위 쿼리 포함, 예: RouteName 필터의 road_info_list)"""
+    return tuple(sorted({element.name for element in visitors.iterate(stmt) if isinstance(element, Table)}))
+
+
+def _cache_key(db: Session, stmt: Select) -> tuple:
+    compiled = stmt.compile(dialect=db.get_bind().dialect)
+    params = tuple(sorted((name, repr(value)) for name, value in compiled.params.items()))
+    # 다른 테이블(집계 대상 표시, 변경 감지 지문 등)에 쓰기가 커밋되어도 캐시가 유지되도록 읽는 테이블의 버전만 넣음
+    tables = read_tables(stmt)
+    return str(compiled), params, tables, table_versions(*tables)
+
+
+def exact_count(db: Session, stmt: Select) -> int:
+    """조건에 맞는 정확한 건수 (같은 조건, 같은 데이터 버전이면 캐시된 값)"""
+    key = _cache_key(db, stmt)
+    total = count_cache.get(key)
+    if total is None:
+        total = db.execute(count_statement(stmt)).scalar()
+        count_cache.set(key, total)
+    return total
+
+
+def approx_count(db: Session, stmt: Select) -> int | None:
+    """
+    통계/실행 계획 기반 건수 추정치 (추정할 수 없으면 None).
+    MySQL의 TABLE_ROWS와 EXPLAIN rows는 실제와 수십 % 차이가 날 수 있습니다.
+    """
+    table = stmt.column_descriptions[0]["entity"].__table__
+    bind = db.get_bind()
+    dialect = bind.dialect.name
+    if stmt.whereclause is None:
+        if dialect == "mysql":
+            return db.execute(text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :name"
+            ), {"name": table.name}).scalar()
+        if dialect == "postgresql":
+            # ANALYZE 전에는 -1
+            rows = db.execute(text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"), {"name": table.name}).scalar()
+            return int(rows) if rows is not None and rows >= 0 else None
+        return None
+
+    sql = stmt.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True}).string
+    if dialect == "mysql":
+        # 조회 대상 테이블의 예상 검사 행 수 x 조건을 통과할 비율
+        for row in db.connection().exec_driver_sql(f"EXPLAIN {sql}").mappings():
+            if row["table"] == table.name and row["rows"] is not None:
+                return int(row["rows"] * float(row.get("filtered") or 100) / 100)
+        return None
+    if dialect == "postgresql":
+        plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return None
+
+
+def count_rows(db: Session, stmt: Select, mode: CountMode = "exact") -> tuple[int | None, CountMode]:
+    """
+    요청한 방식으로 전체 건수를 셉니다.
+
+    :param stmt: 조건이 적용된 SELECT 문
+    :param mode: exact / approx / none
+    :return: (건수, 실제로 사용한 방식) 튜플 - approx를 지원하지 않으면 exact로 셈
+    """
+    if mode == "none":
+        return None, "none"
+    if mode == "approx":
+        try:
+            estimate = approx_count(db, stmt)
+        except Exception as e:
+            logger.warning("건수 추정 실패, 정확한 건수로 대체: %s", e)
+            db.rollback()  # 조회 세션이므로 실패한 트랜잭션만 정리 (PostgreSQL은 오류 후 다음 문을 거부)
+            estimate = None
+        if estimate is not None:
+            return estimate, "approx"
+    return exact_count(db, stmt), "exact"
@@ -0,0 +1,110 @@
+"""
+목록 조회의 커서(키셋) 페이지네이션.
+
+OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 뒤 페이지일수록 느려지고, 적재 중에는 행이 페이지 사이로 밀립니다.
+커서 방식은 마지막 행의 (정렬 키, 기본키) 값을 불투명한 문자열로 돌려주고,
+다음 요청은 인덱스에서 그 값 바로 다음 위치부터 page_size만큼만 읽으므로 몇 번째 페이지든 비용이 같습니다.
+"""
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from sqlalchemy import Column, and_, or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없거나 다른 정렬 순서에서 만든 커서"""
+
+
+def order_columns(entity, sort_key: str | None = None) -> list[Column]:
+    """
+    커서 정렬 순서 - 정렬 키 뒤에 기본키를 붙여 순서가 항상 하나로 정해지게 합니다.
+
+    :param entity: 조회할 ORM 모델
+    :param sort_key: 정렬 키 컬럼 이름 (None이면 기본키 순)
+    """
+    primary_key = list(entity.__mapper__.primary_key)
+    if sort_key is None:
+        return primary_key
+    sort_column = entity.__table__.c[sort_key]
+    return [sort_column] + [column for column in primary_key if column is not sort_column]
+
+
+def keyset_query(stmt: Select, sort_key: str | None = None) -> tuple[Select, list[Column]]:
+    """
+    커서 페이지네이션용 SELECT 문과 정렬 컬럼을 반환합니다.
+    정렬 키가 NULL인 행은 커서 값으로 비교할 수 없으므로 제외합니다.
+    """
+    columns = order_columns(stmt.column_descriptions[0]["entity"], sort_key)
+    if sort_key is not None:
+        stmt = stmt.where(columns[0].is_not(None))
+    return stmt, columns
+
+
+def _to_json(value):
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+def _from_json(column: Column, value):
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(columns: list[Column], row) -> str:
+    """마지막 행의 정렬 컬럼 값을 URL에 그대로 쓸 수 있는 문자열로 만듭니다."""
+    payload = {"k": [column.name for column in columns], "v": [_to_json(getattr(row, column.key)) for column in columns]}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(columns: list[Column], cursor: str) -> list:
+    """커서를 정렬 컬럼 값 목록으로 되돌립니다 (정렬 순서가 다르면 InvalidCursorError)."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["k"] != [column.name for column in columns] or len(payload["v"]) != len(columns):
+            raise InvalidCursorError("다른 정렬 순서의 커서입니다.")
+        return [_from_json(column, value) for column, value in zip(columns, payload["v"])]
+    except InvalidCursorError:
+        raise
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError("잘못된 커서입니다.") from e
+
+
+def after(columns: list[Column], values: list):
+    """
+    (c1, c2, ...) > (v1, v2, ...) 조건.
+    행 값 비교를 지원하지 않거나 인덱스를 못 타는 DB가 있어 c1 > v1 OR (c1 = v1 AND c2 > v2) ... 로 풀어 쓰고,
+    첫 컬럼의 c1 >= v1을 함께 두어 인덱스 범위 조회가 되게 합니다.
+    """
+    branches = [
+        and_(*(column == value for column, value in zip(columns[:i], values[:i])), columns[i] > values[i])
+        for i in range(len(columns))
+    ]
+    return and_(columns[0] >= values[0], or_(*branches))
+
+
+def cursor_page(db: Session, stmt: Select, columns: list[Column], cursor: str | None,
+                page_size: int) -> tuple[list[object], str | None]:
+    """
+    커서 다음 위치부터 한 페이지를 조회합니다.
+
+    :param stmt: keyset_query로 만든 SELECT 문
+    :param columns: keyset_query가 반환한 정렬 컬럼
+    :param cursor: 이전 응답의 next_cursor (None이면 첫 페이지)
+    :return: (데이터 리스트, 다음 페이지 커서 - 마지막 페이지면 None) 튜플
+    """
+    if cursor:
+        stmt = stmt.where(after(columns, decode_cursor(columns, cursor)))
+    # 한 건 더 읽어 다음 페이지가 있는지 확인
+    rows = db.execute(stmt.order_by(*columns).limit(page_size + 1)).scalars().all()
+    if len(rows) <= page_size:
+        return rows, None
+    return rows[:page_size], encode_cursor(columns, rows[page_size - 1])
@@ -0,0 +1,120 @@
+"""
+저장소(repository)의 주요 조회 쿼리를 EXPLAIN으로 확인하여 전체 테이블 스캔을 찾아냅니다 (src 디렉터리에서 실행).
+
+    python -m database.explain            # 쿼리별 실행 계획 요약
+    python -m database.explain --strict   # 전체 스캔이 있으면 종료 코드 1
+
+행 수가 매우 적은 테이블은 인덱스가 있어도 옵티마이저가 스캔을 고를 수 있으므로
+실제 데이터가 쌓인 DB에서 확인해야 의미가 있습니다.
+"""
+import argparse
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+
+from database.connection import engine
+from database.orm import getRoadTrafficInfoList, getParkingPlaceInfoList, getParkingPlaceAvailabilityInfoList, getIncidentInfo
+from database.repository import road_traffic_query, parking_availability_query, incident_query
+
+
+@dataclass
+class PlanResult:
+    """쿼리 하나의 실행 계획 요약"""
+    name: str
+    full_scan: bool
+    indexes: list[str]
+    plan: list[str]
+
+
+def _sample(conn, column, default: str = "X"):
+    """조건에 넣을 실제 값을 테이블에서 하나 가져옵니다 (없으면 기본값)."""
+    value = conn.execute(select(column).where(column.is_not(None)).limit(1)).scalar()
+    return value if value is not None else default
+
+
+def _checks(conn) -> dict[str, Callable[[], Select]]:
+    """repository의 조회 경로별 대표 쿼리"""
+    route_id = _sample(conn, getRoadTrafficInfoList.routeId)
+    link_id = _sample(conn, getRoadTrafficInfoList.linkId)
+    lae_id = _sample(conn, getParkingPlaceInfoList.laeId)
+    pkplc_id = _sample(conn, getParkingPlaceAvailabilityInfoList.pkplcId)
+    day_ago = datetime.now() - timedelta(days=1)
+    return {
+        "도로별 교통 정보 (get_road_traffic_info_by_route)": lambda: road_traffic_query(route_id=route_id),
+        "도로별 교통 정보 + 기간": lambda: road_traffic_query(route_id=route_id, start_time=day_ago),
+        "링크별 교통 이력": lambda: road_traffic_query(link_id=link_id, start_time=day_ago),
+        "지역별 주차장 (get_parking_info_by_location)": lambda: select(getParkingPlaceInfoList).where(getParkingPlaceInfoList.laeId == lae_id),
+        "주차장별 이용가능 이력": lambda: parking_availability_query(pkplc_id=pkplc_id, since=day_ago),
+        "지역별 주차장 이용가능 정보": lambda: parking_availability_query(lae_id=lae_id),
+        "진행 중 돌발상황 (get_active_incidents)": lambda: incident_query(is_active=True),
+        "종료된 돌발상황": lambda: select(getIncidentInfo).where(getIncidentInfo.endDate <= datetime.now()),
+    }
+
+
+def explain(conn, stmt: Select) -> tuple[bool, list[str], list[str]]:
+    """
+    SELECT 문의 실행 계획을 조회합니다.
+
+    :return: (전체 스캔 여부, 사용된 인덱스 목록, 실행 계획 줄 목록) 튜플
+    """
+    dialect = conn.dialect.name
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}).string
+
+    if dialect == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+        plan = [row[-1] for row in rows]
+        full_scan = any(line.startswith("SCAN") and "USING" not in line for line in plan)
+        indexes = [line.split("USING ")[-1] for line in plan if "USING" in line and "INDEX" in line]
+        return full_scan, indexes, plan
+    if dialect == "mysql":
+        rows = conn.exec_driver_sql(f"EXPLAIN {sql}").mappings().all()
+        # partitions: 시각 조건이 있으면 파티션 프루닝으로 일부 파티션만 나열됨
+        plan = [f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} partitions={row.get('partitions')}" for row in rows]
+        full_scan = any(row["type"] == "ALL" for row in rows)
+        indexes = [row["key"] for row in rows if row["key"]]
+        return full_scan, indexes, plan
+    if dialect == "postgresql":
+        plan = [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {sql}").all()]
+        full_scan = any("Seq Scan" in line for line in plan)
+        indexes = [line.split(" using ")[-1].split(" on ")[0] for line in plan if " using " in line]
+        return full_scan, indexes, plan
+    raise ValueError(f"EXPLAIN을 지원하지 않는 데이터베이스입니다: {dialect}")
+
+
+def check_queries(bind: Engine = engine) -> list[PlanResult]:
+    """대표 쿼리들의 실행 계획을 확인합니다."""
+    results = []
+    with bind.connect() as conn:
+        for name, build in _checks(conn).items():
+            full_scan, indexes, plan = explain(conn, build())
+            results.append(PlanResult(name, full_scan, indexes, plan))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="repository 조회 쿼리의 실행 계획 확인")
+    parser.add_argument("--strict", action="store_true", help="전체 스캔이 있으면 종료 코드 1")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    args = parser.parse_args()
+
+    results = check_queries()
+    for result in results:
+        status = "전체 스캔" if result.full_scan else "OK"
+        print(f"[{status}] {result.name} - 인덱스: {', '.join(result.indexes) or '없음'}")
+        if args.verbose or result.full_scan:
+            for line in result.plan:
+                print(f"    {line}")
+
+    scans = sum(result.full_scan for result in results)
+    print(f"{len(results)}개 쿼리 중 전체 스캔 {scans}개")
+    if args.strict and scans:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
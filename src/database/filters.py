@@ -0,0 +1,144 @@
+"""
+/api/* 조회 조건을 SQL WHERE 절로 바꾸는 필터 빌더.
+
+요청 스키마(database/schema/request.py의 *PageRequest) 필드에 Annotated로 필터 표시를 붙이면
+값이 주어진 필드만 조건으로 모아 하나의 SELECT 문을 만듭니다.
+
+    class RoadInfoPageRequest(PaginationRequest):
+        routeNm: Annotated[str | None, Contains("routeNm")] = Field(None, alias="route_nm")
+
+    stmt = filtered_query(RoadInfoList, request)   # WHERE "routeNm" LIKE '%' || :값 || '%'
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import cache
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.sql import Select, ColumnElement
+
+from database.orm import RoadInfoList
+
+
+@dataclass(frozen=True)
+class Filter(ABC):
+    """필드 값 하나를 WHERE 조건으로 바꾸는 필터 표시 (column은 ORM 모델의 속성 이름)"""
+    column: str
+
+    @abstractmethod
+    def clause(self, model, value) -> ColumnElement | None:
+        """조건식을 반환합니다 (None이면 조건을 추가하지 않음)."""
+
+    def _column(self, model):
+        return getattr(model, self.column)
+
+
+class Eq(Filter):
+    """같은 값"""
+    def clause(self, model, value):
+        return self._column(model) == value
+
+
+class Prefix(Filter):
+    """앞부분 일치 (LIKE '값%', 인덱스 사용 가능)"""
+    def clause(self, model, value):
+        return self._column(model).startswith(value, autoescape=True)
+
+
+class Contains(Filter):
+    """부분 일치 (LIKE '%값%')"""
+    def clause(self, model, value):
+        return self._column(model).contains(value, autoescape=True)
+
+
+class Min(Filter):
+    """하한 (포함)"""
+    def clause(self, model, value):
+        return self._column(model) >= value
+
+
+class Max(Filter):
+    """상한 (포함)"""
+    def clause(self, model, value):
+        return self._column(model) <= value
+
+
+class Before(Filter):
+    """상한 (미포함) - 시각 범위의 끝"""
+    def clause(self, model, value):
+        return self._column(model) < value
+
+
+class DateFrom(Filter):
+    """DATETIME 컬럼이 이 날짜 0시 이후"""
+    def clause(self, model, value: date):
+        return self._column(model) >= datetime.combine(value, datetime.min.time())
+
+
+class DateTo(Filter):
+    """DATETIME 컬럼이 이 날짜까지 (해당 날짜 포함, 다음날 0시 미만으로 비교)"""
+    def clause(self, model, value: date):
+        return self._column(model) < datetime.combine(value + timedelta(days=1), datetime.min.time())
+
+
+class Active(Filter):
+    """True면 종료 시각이 없거나 미래인 것, False면 이미 종료된 것"""
+    def clause(self, model, value: bool):
+        end, now = self._column(model), datetime.now()
+        return (end.is_(None) | (end > now)) if value else (end <= now)
+
+
+class AtLeastOne(Filter):
+    """True일 때만 1 이상 (예: 이용가능한 주차장만)"""
+    def clause(self, model, value: bool):
+        return self._column(model) >= 1 if value else None
+
+
+class RouteName(Filter):
+    """도로 이름 부분 일치 - 이름은 road_info_list에만 있으므로 이름이 맞는 도로 ID로 거름"""
+    def __init__(self, column: str = "routeId"):
+        super().__init__(column)
+
+    def clause(self, model, value):
+        return self._column(model).in_(
+            select(RoadInfoList.routeId).where(RoadInfoList.routeNm.contains(value, autoescape=True))
+        )
+
+
+@cache
+def _field_filters(schema: type[BaseModel]) -> tuple[tuple[str, tuple[Filter, ...]], ...]:
+    """스키마 필드별 필터 표시 목록 (스키마 클래스마다 한 번만 계산)"""
+    return tuple(
+        (name, markers) for name, field in schema.model_fields.items()
+        if (markers := tuple(meta for meta in field.metadata if isinstance(meta, Filter)))
+    )
+
+
+def filter_clauses(model, request: BaseModel) -> list[ColumnElement]:
+    """
+    요청 스키마에서 값이 주어진 필드의 조건식을 모읍니다.
+
+    :param model: 조회할 ORM 모델
+    :param request: 필터 표시가 붙은 요청 스키마 인스턴스
+    """
+    clauses = []
+    for name, markers in _field_filters(type(request)):
+        value = getattr(request, name)
+        if value is None or value == "":
+            continue
+        for marker in markers:
+            clause = marker.clause(model, value)
+            if clause is not None:
+                clauses.append(clause)
+    return clauses
+
+
+def filtered_query(model, request: BaseModel) -> Select:
+    """요청 스키마의 조건을 모두 적용한 SELECT 문을 만듭니다 (페이지네이션은 repository._paginate에서)."""
+    return select(model).where(*filter_clauses(model, request))
+
+
+def applied_filters(request: BaseModel) -> dict:
+    """응답의 filters 항목 - 페이지 관련 값을 뺀 요청 값 (쿼리 파라미터 이름 기준)"""
+    return request.model_dump(by_alias=True, exclude={"page", "page_size", "pagination", "cursor", "count"})
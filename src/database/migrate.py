@@ -0,0 +1,442 @@
+"""
+DB 스키마 마이그레이션 도구 (src 디렉터리에서 실행).
+
+    python -m database.migrate status
+    python -m database.migrate convert-types [--table road_traffic_info_list] [--chunk-size 5000] [--keep-legacy]
+    python -m database.migrate sync-indexes
+    python -m database.migrate build-current [--chunk-size 5000]
+    python -m database.migrate dedupe [--table road_traffic_info_list] [--chunk-size 5000]
+    python -m database.migrate normalize [--chunk-size 5000] [--keep-legacy]
+
+convert-types는 ORM에서 숫자/날짜 타입으로 바뀐 컬럼이 DB에는 아직 문자열로 남아 있는 테이블을
+새 타입으로 다시 만들고 기존 행을 변환하여 옮깁니다 (기존 테이블은 <테이블>_legacy로 이름을 바꿔 두고 복사).
+새 테이블에는 자연키 유니크 인덱스가 있으므로 자연키가 같은 중복 행은 옮기면서 합칩니다 (dedupe를 먼저 실행할 필요 없음).
+이력 테이블에서 수집 시각을 해석할 수 없는 행은 파티션 키를 NULL로 둘 수 없으므로 <테이블>_quarantine에 원래 값 그대로 보관합니다.
+중간에 멈춰도 다시 실행하면 이미 옮긴 id 다음부터 이어서 복사합니다.
+sync-indexes는 ORM에 선언된 인덱스 중 DB에 없는 것을 생성합니다 (create_all은 기존 테이블에 인덱스를 추가하지 않음).
+dedupe는 자연키(linkId+collDate 등)가 같은 중복 행을 id 구간별 짧은 트랜잭션으로 지운 뒤(마지막으로 적재된 행만 남김)
+자연키 유니크 인덱스를 만들고 대체된 일반 인덱스를 삭제합니다. 유니크 인덱스가 생기기 전까지 적재는 중복을 막지 못하므로
+배포 후 한 번 실행해야 하며, 실행 중 수집이 중복을 다시 넣어 인덱스 생성이 실패하면 다시 실행하면 됩니다.
+normalize는 교통 정보 이력/최신 상태 테이블에서 빠진 도로 이름, 링크 속성, 헤더 컬럼을 정리합니다.
+이름/속성을 참조 테이블(road_info_list, road_link_info_list)에 없을 때만 옮겨 담은 뒤 테이블을 새 구조로 다시 만듭니다
+(MySQL에서 파티셔닝한 테이블은 다시 만든 뒤 python -m database.partition init을 다시 실행해야 함).
+build-current는 이미 쌓인 이력으로 최신 상태 테이블(link_traffic_current 등)을 채웁니다 (이후에는 적재 시 자동 갱신).
+컬럼 구성이 ORM과 다른 최신 상태 테이블(예: modelName 키가 추가되기 전의 link_traffic_current)은 새 구조로 다시 만든 뒤 채웁니다.
+"""
+import argparse
+import logging
+import time
+
+from sqlalchemy import MetaData, Table, delete, exists, func, insert, inspect, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from database.connection import engine, create_tables
+from database.converter import get_converter
+from database.orm import Base, RecordFingerprint
+from database.partition import QUARANTINE_SUFFIX, quarantine_table
+from database.repository import (MODEL_MAP, NATURAL_KEYS, CURRENT_STATE_MODELS, REFERENCE_COLUMNS, REFERENCE_SOURCE_MODELS,
+                                 HISTORY_TIME_COLUMNS, update_current_state, ensure_reference_rows, _has_unique_key,
+                                 _dedupe_rows, _native_upsert)
+
+
+logger = logging.getLogger(__name__)
+
+MIGRATE_CHUNK_SIZE = 5000
+LEGACY_SUFFIX = "_legacy"
+
+
+def _python_type(sql_type) -> type:
+    try:
+        return sql_type.python_type
+    except NotImplementedError:
+        return str
+
+
+def _mapped_models() -> dict[str, type]:
+    """테이블 이름 -> ORM 모델"""
+    return {mapper.class_.__table__.name: mapper.class_ for mapper in Base.registry.mappers}
+
+
+def find_type_mismatches(bind: Engine = engine) -> dict[str, list[str]]:
+    """ORM에서는 숫자/날짜 타입인데 DB에는 문자열로 남아 있는 컬럼을 테이블별로 찾습니다."""
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names())
+    mismatches = {}
+    for table_name, model in _mapped_models().items():
+        if table_name not in existing:
+            continue
+        db_types = {column["name"]: _python_type(column["type"]) for column in inspector.get_columns(table_name)}
+        columns = [
+            column.name for column in model.__table__.columns
+            if _python_type(column.type) is not str and db_types.get(column.name) is str
+        ]
+        if columns:
+            mismatches[table_name] = columns
+    return mismatches
+
+
+def _reset_sequence(conn, table_name: str):
+    """PostgreSQL은 id를 직접 넣으면 시퀀스가 따라오지 않으므로 최대 id로 맞춥니다."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), COALESCE((SELECT MAX(id) FROM {table_name}), 1))"
+        ))
+
+
+def rebuild_table(model, chunk_size: int = MIGRATE_CHUNK_SIZE, keep_legacy: bool = False, bind: Engine = engine) -> dict:
+    """
+    테이블을 ORM 정의대로 다시 만들고 기존 행을 타입 변환하여 옮깁니다.
+    새 테이블에는 자연키 유니크 인덱스가 있으므로, 기존 테이블의 자연키 중복 행은 옮기면서 합칩니다
+    (dedupe와 같이 id가 가장 큰 행, 즉 마지막으로 적재된 행의 id와 값이 남음).
+    이력 테이블에서 수집 시각(파티션 키)을 해석할 수 없는 행은 NULL로 옮기지 않고 원래 값 그대로 <테이블>_quarantine에 보관합니다.
+
+    :param model: 대상 ORM 모델
+    :param chunk_size: 한 번에 옮길 행 수 (청크마다 커밋)
+    :param keep_legacy: True면 복사가 끝난 뒤에도 <테이블>_legacy를 남겨 둠
+    :return: {"copied": 옮긴 행 수, "merged": 중복이라 합친 행 수, "quarantined": 격리한 행 수,
+              "nulled": 변환할 수 없어 비운 값 수, "elapsed_seconds": 소요 시간}
+    """
+    table = model.__table__
+    legacy_name = f"{table.name}{LEGACY_SUFFIX}"
+    converter = get_converter(model.__name__)
+    key_columns = NATURAL_KEYS.get(model.__name__)
+    unique_key = bool(key_columns) and _has_unique_key(table, key_columns)
+    time_column = HISTORY_TIME_COLUMNS.get(model.__name__)
+    started = time.perf_counter()
+
+    with bind.begin() as conn:
+        tables = set(inspect(conn).get_table_names())
+        if legacy_name not in tables:
+            conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {legacy_name}"))
+            # SQLite/PostgreSQL은 인덱스 이름이 DB 전체에서 유일해야 하므로 새 테이블과 겹치지 않게 기존 인덱스 삭제
+            for index in Table(legacy_name, MetaData(), autoload_with=conn).indexes:
+                index.drop(conn)
+        table.create(conn, checkfirst=True)
+        # 자연키에 날짜가 포함되어 해시가 달라지므로 변경 감지 인덱스를 비움 (다음 수집에서 다시 계산)
+        conn.execute(delete(RecordFingerprint.__table__).where(RecordFingerprint.modelName == model.__name__))
+
+    legacy = Table(legacy_name, MetaData(), autoload_with=bind)
+    columns = [column for column in legacy.columns if column.name in table.c]
+    copied = nulled = quarantined = 0
+    quarantine = None
+    if time_column:
+        with bind.begin() as conn:
+            quarantine = quarantine_table(conn, table.name, legacy.columns)
+
+    with bind.connect() as conn:
+        # 중간에 멈춘 뒤 다시 실행하면 새 테이블(과 격리 테이블)의 최대 id 다음부터 이어서 복사
+        last_id = conn.execute(select(func.max(table.c.id))).scalar() or 0
+        if quarantine is not None:
+            last_id = max(last_id, conn.execute(select(func.max(quarantine.c.id))).scalar() or 0)
+        rows_before = conn.execute(select(func.count()).select_from(table)).scalar()
+
+    with Session(bind) as db:
+        while True:
+            rows = [dict(row) for row in db.execute(
+                select(*columns).where(legacy.c.id > last_id).order_by(legacy.c.id).limit(chunk_size)
+            ).mappings()]
+            if not rows:
+                break
+            converted = converter.convert(rows)
+            for source, target in zip(rows, converted):
+                target["id"] = source["id"]
+                nulled += sum(
+                    1 for name, value in source.items()
+                    if value not in (None, "") and name in target and target[name] is None
+                )
+            if time_column:
+                untimed = [source for source, target in zip(rows, converted) if target.get(time_column) is None]
+                if untimed:
+                    db.execute(insert(quarantine), [
+                        {name: value for name, value in source.items() if name in quarantine.c} for source in untimed
+                    ])
+                    quarantined += len(untimed)
+                    converted = [target for target in converted if target.get(time_column) is not None]
+            if converted and unique_key:
+                # 청크 안의 중복은 마지막 행만 남기고, 앞 청크에서 옮긴 행과 겹치면 id와 값을 이 행으로 덮어씀
+                _native_upsert(db, table, _dedupe_rows(converted, key_columns), key_columns)
+            elif converted:
+                db.execute(insert(table), converted)
+            db.commit()
+            last_id = rows[-1]["id"]
+            copied += len(converted)
+            logger.info("%s: %d행 복사 (id <= %s)", table.name, copied, last_id)
+
+    with bind.begin() as conn:
+        rows_after = conn.execute(select(func.count()).select_from(table)).scalar()
+        _reset_sequence(conn, table.name)
+        if not keep_legacy:
+            conn.execute(text(f"DROP TABLE {legacy_name}"))
+        if quarantine is not None and not quarantined and not conn.execute(select(func.count()).select_from(quarantine)).scalar():
+            quarantine.drop(conn)
+
+    return {
+        "copied": copied,
+        # 복사 중에 수집이 새 테이블에 적재했다면 그만큼 적게 셈
+        "merged": max(copied - (rows_after - rows_before), 0),
+        "quarantined": quarantined,
+        "nulled": nulled,
+        "elapsed_seconds": round(time.perf_counter() - started, 2)
+    }
+
+
+def convert_types(table_names: list[str] | None = None, chunk_size: int = MIGRATE_CHUNK_SIZE,
+                  keep_legacy: bool = False, bind: Engine = engine) -> dict[str, dict]:
+    """타입이 다른 컬럼이 있는 테이블(또는 지정한 테이블)을 모두 다시 만듭니다."""
+    models = _mapped_models()
+    targets = table_names or list(find_type_mismatches(bind))
+    # 이전 실행이 중간에 멈춘 테이블도 이어서 처리
+    existing = set(inspect(bind).get_table_names())
+    targets += [
+        name[:-len(LEGACY_SUFFIX)] for name in existing
+        if name.endswith(LEGACY_SUFFIX) and name[:-len(LEGACY_SUFFIX)] in models and name[:-len(LEGACY_SUFFIX)] not in targets
+    ]
+    return {name: rebuild_table(models[name], chunk_size, keep_legacy, bind) for name in targets}
+
+
+def sync_indexes(bind: Engine = engine) -> dict[str, list[str]]:
+    """ORM에 선언되었지만 DB에 없는 인덱스를 생성하고, 테이블별로 생성한 인덱스 이름을 반환합니다."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    created = {}
+    for table_name, model in _mapped_models().items():
+        if table_name not in existing_tables:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        for index in model.__table__.indexes:
+            if index.name not in existing:
+                started = time.perf_counter()
+                index.create(bind)
+                created.setdefault(table_name, []).append(f"{index.name} ({time.perf_counter() - started:.1f}초)")
+    return created
+
+
+def _has_unique_index_in_db(inspector, table_name: str, key_columns: tuple[str, ...]) -> bool:
+    """DB에 자연키와 정확히 일치하는 유니크 인덱스/제약조건이 이미 있는지 확인합니다."""
+    keys = set(key_columns)
+    uniques = [index["column_names"] for index in inspector.get_indexes(table_name) if index["unique"]]
+    uniques += [constraint["column_names"] for constraint in inspector.get_unique_constraints(table_name)]
+    return any(set(columns) == keys for columns in uniques)
+
+
+def find_extra_columns(bind: Engine = engine) -> dict[str, list[str]]:
+    """DB에는 있지만 ORM에서는 빠진 컬럼을 테이블별로 찾습니다."""
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names())
+    extra = {}
+    for table_name, model in _mapped_models().items():
+        if table_name not in existing:
+            continue
+        columns = [column["name"] for column in inspector.get_columns(table_name) if column["name"] not in model.__table__.c]
+        if columns:
+            extra[table_name] = columns
+    return extra
+
+
+def normalize_names(chunk_size: int = MIGRATE_CHUNK_SIZE, keep_legacy: bool = False, bind: Engine = engine) -> dict[str, dict]:
+    """
+    교통 정보 이력 테이블의 도로 이름/링크 속성을 참조 테이블로 옮기고, 빠진 컬럼 없이 테이블을 다시 만듭니다.
+    최신 상태 테이블은 비우고 새 구조로 만든 뒤 이력으로 다시 채웁니다.
+
+    :return: 이력 테이블별 {"references": 추가한 참조 행 수, "copied": 옮긴 행 수, ...}
+    """
+    extra = find_extra_columns(bind)
+    reference_columns = {column for columns in REFERENCE_COLUMNS.values() for column in columns}
+    results = {}
+    for model_name in REFERENCE_SOURCE_MODELS:
+        model = MODEL_MAP[model_name]
+        table_name = model.__table__.name
+        if table_name not in extra:
+            continue
+        legacy = Table(table_name, MetaData(), autoload_with=bind)
+        columns = [column for column in legacy.columns if column.name in reference_columns]
+        last_id = added = 0
+        with Session(bind) as db:
+            while True:
+                rows = [dict(row) for row in db.execute(
+                    select(legacy.c.id, *columns).where(legacy.c.id > last_id).order_by(legacy.c.id).limit(chunk_size)
+                ).mappings()]
+                if not rows:
+                    break
+                added += ensure_reference_rows(db, model_name, rows)
+                db.commit()
+                last_id = rows[-1]["id"]
+        results[table_name] = {"references": added, **rebuild_table(model, chunk_size, keep_legacy, bind)}
+
+    current_tables = {model.__table__ for model in CURRENT_STATE_MODELS.values() if model.__table__.name in extra}
+    if current_tables:
+        for table in current_tables:
+            table.drop(bind)
+            table.create(bind)
+        build_current_state(chunk_size, bind)
+    return results
+
+
+def dedupe_table(model_name: str, chunk_size: int = MIGRATE_CHUNK_SIZE, bind: Engine = engine) -> int:
+    """
+    자연키가 같은 행 중 id가 가장 큰 행(마지막으로 적재된 행)만 남기고 나머지를 삭제합니다.
+    id 구간별로 지울 행을 찾아 삭제하고 구간마다 커밋하므로 테이블을 오래 잠그지 않습니다.
+    자연키가 비어 있는 행은 비교할 수 없으므로 그대로 둡니다.
+
+    :return: 삭제한 행 수
+    """
+    table = MODEL_MAP[model_name].__table__
+    newer = table.alias("newer")
+    key_columns = NATURAL_KEYS[model_name]
+    with bind.connect() as conn:
+        max_id = conn.execute(select(func.max(table.c.id))).scalar() or 0
+
+    deleted = 0
+    for low in range(0, max_id, chunk_size):
+        with bind.begin() as conn:
+            # 같은 자연키를 가진 더 나중 행이 있는 행 (자연키 인덱스로 조회)
+            ids = conn.execute(select(table.c.id).where(
+                table.c.id > low, table.c.id <= low + chunk_size,
+                exists().where(*(newer.c[column] == table.c[column] for column in key_columns), newer.c.id > table.c.id)
+            )).scalars().all()
+            if ids:
+                conn.execute(delete(table).where(table.c.id.in_(ids)))
+        deleted += len(ids)
+        if ids:
+            logger.info("%s: 중복 %d행 삭제 (id <= %s)", table.name, deleted, low + chunk_size)
+    return deleted
+
+
+def dedupe(table_names: list[str] | None = None, chunk_size: int = MIGRATE_CHUNK_SIZE, bind: Engine = engine) -> dict[str, int]:
+    """
+    ORM에 자연키 유니크 인덱스가 선언되었지만 DB에는 아직 없는 테이블의 중복을 지우고 유니크 인덱스를 만듭니다.
+    유니크 인덱스로 대체된 같은 컬럼의 일반 인덱스(ix_*)는 삭제합니다.
+
+    :return: 테이블별 삭제한 중복 행 수
+    """
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names())
+    results = {}
+    for model_name, model in MODEL_MAP.items():
+        table = model.__table__
+        key_columns = NATURAL_KEYS[model_name]
+        if table.name not in existing or (table_names and table.name not in table_names):
+            continue
+        if not _has_unique_key(table, key_columns) or _has_unique_index_in_db(inspector, table.name, key_columns):
+            continue
+        results[table.name] = dedupe_table(model_name, chunk_size, bind)
+
+        for index in table.indexes:
+            if index.unique and not _has_unique_index_in_db(inspect(bind), table.name, tuple(index.columns.keys())):
+                index.create(bind)
+        # 유니크 인덱스가 대신하는 기존 일반 인덱스 삭제
+        declared = {index.name for index in table.indexes}
+        for index in Table(table.name, MetaData(), autoload_with=bind).indexes:
+            if not index.unique and index.name not in declared and {column.name for column in index.columns} == set(key_columns):
+                index.drop(bind)
+    return results
+
+
+def find_stale_current_tables(bind: Engine = engine) -> list[str]:
+    """DB의 컬럼 구성이 ORM과 다른 최신 상태 테이블 (이력으로 다시 채울 수 있으므로 build-current가 다시 만듦)"""
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names())
+    return sorted(
+        table.name for table in {model.__table__ for model in CURRENT_STATE_MODELS.values()}
+        if table.name in existing and {column["name"] for column in inspector.get_columns(table.name)} != set(table.c.keys())
+    )
+
+
+def build_current_state(chunk_size: int = MIGRATE_CHUNK_SIZE, bind: Engine = engine) -> dict[str, int]:
+    """
+    이력 테이블 전체를 id 순 청크로 읽어 최신 상태 테이블을 채우고, 이력 테이블별로 읽은 행 수를 반환합니다.
+    컬럼 구성이 ORM과 다른 최신 상태 테이블은 먼저 새 구조로 다시 만듭니다.
+    """
+    stale = set(find_stale_current_tables(bind))
+    for table in {model.__table__ for model in CURRENT_STATE_MODELS.values() if model.__table__.name in stale}:
+        table.drop(bind)
+        logger.info("%s: 컬럼 구성이 바뀌어 다시 만듭니다", table.name)
+    create_tables()
+    existing = set(inspect(bind).get_table_names())
+    scanned = {}
+    for model_name in CURRENT_STATE_MODELS:
+        table = MODEL_MAP[model_name].__table__
+        if table.name not in existing:
+            continue
+        last_id, count = 0, 0
+        with Session(bind) as db:
+            while True:
+                rows = [dict(row) for row in db.execute(
+                    select(table).where(table.c.id > last_id).order_by(table.c.id).limit(chunk_size)
+                ).mappings()]
+                if not rows:
+                    break
+                # 청크마다 커밋 (수집 시각 비교로 갱신하므로 순서와 무관하게 최신 값이 남음)
+                update_current_state(db, model_name, rows)
+                db.commit()
+                last_id = rows[-1]["id"]
+                count += len(rows)
+        scanned[table.name] = count
+    return scanned
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션 도구")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="ORM과 타입이 다르거나 ORM에서 빠진 컬럼 확인")
+    convert = commands.add_parser("convert-types", help="문자열 컬럼을 숫자/날짜 타입으로 변환 (테이블 재생성 + 데이터 이관)")
+    convert.add_argument("--table", action="append", help="대상 테이블 (여러 번 지정 가능, 기본: 타입이 다른 모든 테이블)")
+    convert.add_argument("--chunk-size", type=int, default=MIGRATE_CHUNK_SIZE, help="한 번에 옮길 행 수")
+    convert.add_argument("--keep-legacy", action="store_true", help="복사 후 <테이블>_legacy를 삭제하지 않음")
+    commands.add_parser("sync-indexes", help="ORM에 선언된 인덱스 중 DB에 없는 것을 생성")
+    dedupe_parser = commands.add_parser("dedupe", help="자연키 중복 행 정리 후 유니크 인덱스 생성")
+    dedupe_parser.add_argument("--table", action="append", help="대상 테이블 (여러 번 지정 가능, 기본: 유니크 인덱스가 없는 모든 테이블)")
+    dedupe_parser.add_argument("--chunk-size", type=int, default=MIGRATE_CHUNK_SIZE, help="한 트랜잭션에서 검사할 id 구간 크기")
+    normalize = commands.add_parser("normalize", help="교통 정보 이력의 도로 이름/링크 속성을 참조 테이블로 분리")
+    normalize.add_argument("--chunk-size", type=int, default=MIGRATE_CHUNK_SIZE, help="한 번에 옮길 행 수")
+    normalize.add_argument("--keep-legacy", action="store_true", help="복사 후 <테이블>_legacy를 삭제하지 않음")
+    current = commands.add_parser("build-current", help="쌓인 이력으로 최신 상태 테이블 채우기")
+    current.add_argument("--chunk-size", type=int, default=MIGRATE_CHUNK_SIZE, help="한 번에 읽을 이력 행 수")
+    args = parser.parse_args()
+    # 청크별 진행 상황(logger.info)을 터미널에 표시
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
+
+    if args.command == "status":
+        mismatches = find_type_mismatches()
+        if not mismatches:
+            print("모든 테이블의 컬럼 타입이 ORM 정의와 일치합니다.")
+        for table_name, columns in mismatches.items():
+            print(f"{table_name}: {', '.join(columns)}")
+        for table_name, columns in find_extra_columns().items():
+            print(f"{table_name}: ORM에서 빠진 컬럼 {', '.join(columns)} (normalize 필요)")
+        for table_name in find_stale_current_tables():
+            print(f"{table_name}: 최신 상태 테이블의 컬럼 구성이 다름 (build-current 필요)")
+    elif args.command == "convert-types":
+        for table_name, result in convert_types(args.table, args.chunk_size, args.keep_legacy).items():
+            print(f"{table_name}: {result['copied']}행 이관 (중복 {result['merged']}행 합침), "
+                  f"변환 실패로 비운 값 {result['nulled']}개, {result['elapsed_seconds']}초")
+            if result["quarantined"]:
+                print(f"  수집 시각을 해석할 수 없는 {result['quarantined']}행은 {table_name}{QUARANTINE_SUFFIX}에 보관")
+        # 새로 추가된 테이블 생성
+        create_tables()
+    elif args.command == "sync-indexes":
+        created = sync_indexes()
+        if not created:
+            print("선언된 인덱스가 모두 존재합니다.")
+        for table_name, names in created.items():
+            print(f"{table_name}: {', '.join(names)} 생성")
+    elif args.command == "dedupe":
+        results = dedupe(args.table, args.chunk_size)
+        if not results:
+            print("모든 테이블에 자연키 유니크 인덱스가 있습니다.")
+        for table_name, deleted in results.items():
+            print(f"{table_name}: 중복 {deleted}행 삭제, 유니크 인덱스 생성")
+    elif args.command == "normalize":
+        results = normalize_names(args.chunk_size, args.keep_legacy)
+        if not results:
+            print("정리할 이력 테이블이 없습니다.")
+        for table_name, result in results.items():
+            print(f"{table_name}: 참조 행 {result['references']}개 추가, {result['copied']}행 이관, {result['elapsed_seconds']}초")
+    elif args.command == "build-current":
+        for table_name, count in build_current_state(args.chunk_size).items():
+            print(f"{table_name}: 이력 {count}행 반영")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, String, Boolean, Integer
+from sqlalchemy import Column, String, Boolean, Integer, SmallInteger, BigInteger, Numeric, DateTime, UniqueConstraint, Index, func
 from pydantic import BaseModel, Field
 
 
@@ -31,122 +31,110 @@ class getRoadLinkInfoList(CommonBase):
 
     id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key 추가
     routeWay = Column(String(20))  # 도로 방향
-    routeSeq = Column(String(20))  # 도로 순서
+    routeSeq = Column(Integer)  # 도로 순서
     linkId = Column(String(50), unique=True)  # 링크 ID (고유하지만 primary key는 아님)
     startNodeId = Column(String(50))  # 시작 노드 ID
     startNodeNm = Column(String(100))  # 시작 노드 이름
     endNodeId = Column(String(50))  # 끝 노드 ID
     endNodeNm = Column(String(100))  # 끝 노드 이름
-    linkLength = Column(String(20))  # 링크 길이
+    linkLength = Column(Numeric(10, 2))  # 링크 길이
 
     def __repr__(self):
         return f"<getRoadLinkInfoList(routeWay={self.routeWay}, routeSeq={self.routeSeq}, linkId={self.linkId}, startNodeId={self.startNodeId}, startNodeNm={self.startNodeNm}, endNodeId={self.endNodeId}, endNodeNm={self.endNodeNm}, linkLength={self.linkLength})>"
     
-class getRoadTrafficInfoList(CommonBase):
+class getRoadTrafficInfoList(Base):
     __tablename__ = "road_traffic_info_list"
 
     id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key 추가
-    routeId = Column(String(50))  # 도로 ID
-    routeNm = Column(String(100))  # 도로 이름
-    routeWay = Column(String(20))  # 도로 방향
-    routeSeq = Column(String(20))  # 도로 순서
-    linkId = Column(String(50))  # 링크 ID
-    startNodeId = Column(String(50))  # 시작 노드 ID
-    startNodeNm = Column(String(100))  # 시작 노드 이름
-    endNodeId = Column(String(50))  # 끝 노드 ID
-    endNodeNm = Column(String(100))  # 끝 노드 이름
-    collDate = Column(String(20))  # 수집 날짜
-    spd = Column(String(20))  # 속도
-    vol = Column(String(20))  # 교통량
-    trvlTime = Column(String(20))  # 여행 시간
-    linkDelayTime = Column(String(20))  # 링크 지연 시간
-    congGrade = Column(String(20))  # 혼잡 등급
-
-    def __repr__(self):
-        return (f"<getRoadTrafficInfoList(routeId={self.routeId}, routeNm={self.routeNm}, routeWay={self.routeWay}, "
-                f"routeSeq={self.routeSeq}, linkId={self.linkId}, startNodeId={self.startNodeId}, "
-                f"startNodeNm={self.startNodeNm}, endNodeId={self.endNodeId}, endNodeNm={self.endNodeNm}, "
-                f"collDate={self.collDate}, spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime}, "
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    linkId = Column(String(50))  # 링크 ID (도로 방향/순서, 노드 정보는 road_link_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+    linkDelayTime = Column(Integer)  # 링크 지연 시간
+    congGrade = Column(SmallInteger)  # 혼잡 등급
+
+    __table_args__ = (
+        Index("ix_road_traffic_info_list_route_coll", "routeId", "collDate"),  # 도로별 조회 (get_road_traffic_info_by_route, 기간 조회)
+        Index("uq_road_traffic_info_list_link_coll", "linkId", "collDate", unique=True),  # 자연키 (같은 스냅샷 중복 적재 방지), 링크별 이력 조회
+        Index("ix_road_traffic_info_list_coll", "collDate"),  # 조건 없는 이력 조회의 커서 페이지네이션 (수집 시각 순)
+    )
+
+    def __repr__(self):
+        return (f"<getRoadTrafficInfoList(routeId={self.routeId}, linkId={self.linkId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime}, "
                 f"linkDelayTime={self.linkDelayTime}, congGrade={self.congGrade})>")
 
-class getRoadLinkTrafficInfoList(CommonBase):
+class getRoadLinkTrafficInfoList(Base):
     __tablename__ = "road_link_traffic_info_list"
 
     id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key 추가
-    routeId = Column(String(50))  # 도로 ID
-    routeNm = Column(String(100))  # 도로 이름
-    routeWay = Column(String(20))  # 도로 방향
-    routeSeq = Column(String(20))  # 도로 순서
-    linkId = Column(String(50))  # 링크 ID
-    startNodeId = Column(String(50))  # 시작 노드 ID
-    startNodeNm = Column(String(100))  # 시작 노드 이름
-    endNodeId = Column(String(50))  # 끝 노드 ID
-    endNodeNm = Column(String(100))  # 끝 노드 이름
-    collDate = Column(String(20))  # 수집 날짜
-    spd = Column(String(20))  # 속도
-    vol = Column(String(20))  # 교통량
-    trvlTime = Column(String(20))  # 여행 시간
-    linkDelayTime = Column(String(20))  # 링크 지연 시간
-    congGrade = Column(String(20))  # 혼잡 등급(0:정보없음, 1:원활, 2:지체, 3:정체)
-
-    def __repr__(self):
-        return (f"<getRoadLinkTrafficInfoList(routeId={self.routeId}, routeNm={self.routeNm}, routeWay={self.routeWay}, "
-                f"routeSeq={self.routeSeq}, linkId={self.linkId}, startNodeId={self.startNodeId}, "
-                f"startNodeNm={self.startNodeNm}, endNodeId={self.endNodeId}, endNodeNm={self.endNodeNm}, "
-                f"collDate={self.collDate}, spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime}, "
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    linkId = Column(String(50))  # 링크 ID (도로 방향/순서, 노드 정보는 road_link_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+    linkDelayTime = Column(Integer)  # 링크 지연 시간
+    congGrade = Column(SmallInteger)  # 혼잡 등급(0:정보없음, 1:원활, 2:지체, 3:정체)
+
+    __table_args__ = (
+        Index("ix_road_link_traffic_info_list_route_coll", "routeId", "collDate"),  # 도로별 조회, 기간 조회
+        Index("uq_road_link_traffic_info_list_link_coll", "linkId", "collDate", unique=True),  # 자연키 (같은 스냅샷 중복 적재 방지), 링크별 이력 조회
+        Index("ix_road_link_traffic_info_list_coll", "collDate"),  # 조건 없는 이력 조회의 커서 페이지네이션 (수집 시각 순)
+    )
+
+    def __repr__(self):
+        return (f"<getRoadLinkTrafficInfoList(routeId={self.routeId}, linkId={self.linkId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime}, "
                 f"linkDelayTime={self.linkDelayTime}, congGrade={self.congGrade})>")
 
-class getRoadLinkTrafficInfo(CommonBase):
+class getRoadLinkTrafficInfo(Base):
     __tablename__ = "road_link_traffic_info"
 
     id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key 추가
-    routeId = Column(String(50))  # 도로 ID
-    routeNm = Column(String(100))  # 도로 이름
-    routeWay = Column(String(20))  # 도로 방향
-    routeSeq = Column(String(20))  # 도로 순서
-    linkId = Column(String(50))  # 링크 ID
-    startNodeId = Column(String(50))  # 시작 노드 ID
-    startNodeNm = Column(String(100))  # 시작 노드 이름
-    endNodeId = Column(String(50))  # 끝 노드 ID
-    endNodeNm = Column(String(100))  # 끝 노드 이름
-    collDate = Column(String(20))  # 수집 날짜
-    spd = Column(String(20))  # 속도
-    vol = Column(String(20))  # 교통량
-    trvlTime = Column(String(20))  # 여행 시간
-    linkDelayTime = Column(String(20))  # 링크 지연 시간
-    congGrade = Column(String(20))  # 혼잡 등급(0:정보없음, 1:원활, 2:지체, 3:정체)
-
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    linkId = Column(String(50))  # 링크 ID (도로 방향/순서, 노드 정보는 road_link_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+    linkDelayTime = Column(Integer)  # 링크 지연 시간
+    congGrade = Column(SmallInteger)  # 혼잡 등급(0:정보없음, 1:원활, 2:지체, 3:정체)
+
+
+    __table_args__ = (
+        Index("ix_road_link_traffic_info_route_coll", "routeId", "collDate"),  # 도로별 조회, 기간 조회
+        Index("uq_road_link_traffic_info_link_coll", "linkId", "collDate", unique=True),  # 자연키 (같은 스냅샷 중복 적재 방지), 링크별 이력 조회
+        Index("ix_road_link_traffic_info_coll", "collDate"),  # 조건 없는 이력 조회의 커서 페이지네이션 (수집 시각 순)
+    )
 
     def __repr__(self):
-        return (f"<getRoadLinkTrafficInfo(routeId={self.routeId}, routeNm={self.routeNm}, routeWay={self.routeWay}, "
-                f"routeSeq={self.routeSeq}, linkId={self.linkId}, startNodeId={self.startNodeId}, "
-                f"startNodeNm={self.startNodeNm}, endNodeId={self.endNodeId}, endNodeNm={self.endNodeNm}, "
-                f"collDate={self.collDate}, spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime})>")
+        return (f"<getRoadLinkTrafficInfo(routeId={self.routeId}, linkId={self.linkId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime})>")
     
 
-class getRoadLinkCongestInfo(CommonBase):
+class getRoadLinkCongestInfo(Base):
     __tablename__ = "road_link_congest_info"
 
     id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key 추가
-    routeId = Column(String(50))  # 도로 ID
-    routeNm = Column(String(100))  # 도로 이름
-    routeWay = Column(String(20))  # 도로 방향
-    routeSeq = Column(String(20))  # 도로 순서
-    linkId = Column(String(50))  # 링크 ID
-    startNodeId = Column(String(50))  # 시작 노드 ID
-    startNodeNm = Column(String(100))  # 시작 노드 이름
-    endNodeId = Column(String(50))  # 끝 노드 ID
-    endNodeNm = Column(String(100))  # 끝 노드 이름
-    collDate = Column(String(20))  # 수집 날짜
-    spd = Column(String(20))  # 속도
-    vol = Column(String(20))  # 교통량
-    trvlTime = Column(String(20))  # 여행 시간
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    linkId = Column(String(50))  # 링크 ID (도로 방향/순서, 노드 정보는 road_link_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+
+    __table_args__ = (
+        Index("ix_road_link_congest_info_route_coll", "routeId", "collDate"),  # 도로별 조회, 기간 조회
+        Index("uq_road_link_congest_info_link_coll", "linkId", "collDate", unique=True),  # 자연키 (같은 스냅샷 중복 적재 방지), 링크별 이력 조회
+        Index("ix_road_link_congest_info_coll", "collDate"),  # 조건 없는 이력 조회의 커서 페이지네이션 (수집 시각 순)
+    )
 
     def __repr__(self):
-        return (f"<getRoadLinkCongestInfo(routeId={self.routeId}, routeNm={self.routeNm}, routeWay={self.routeWay}, "
-                f"routeSeq={self.routeSeq}, linkId={self.linkId}, startNodeId={self.startNodeId}, "
-                f"startNodeNm={self.startNodeNm}, endNodeId={self.endNodeId}, endNodeNm={self.endNodeNm}, "
-                f"collDate={self.collDate}, spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime})>")
+        return (f"<getRoadLinkCongestInfo(routeId={self.routeId}, linkId={self.linkId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime})>")
 
 class getIncidentInfo(CommonBase):
     __tablename__ = "incident_info"
@@ -156,16 +144,21 @@ class getIncidentInfo(CommonBase):
     linkId = Column(String(50))  # 표준링크 ID
     spotId = Column(String(50))  # 지점 ID
     regSeq  = Column(String(20))  # 돌발상황 고유번호
-    confirmDate = Column(String(20))  # 감지 시간
-    startDate = Column(String(20))  # 시작 시간
-    estEndDate = Column(String(20))  # 예상 종료 시간
-    endDate = Column(String(20))  # 종료 시간
+    confirmDate = Column(DateTime)  # 감지 시간
+    startDate = Column(DateTime)  # 시작 시간
+    estEndDate = Column(DateTime)  # 예상 종료 시간
+    endDate = Column(DateTime)  # 종료 시간
     restrictType = Column(String(20))  # 제한 유형
     inciDesc = Column(String(200))  # 돌발 상황 설명
     inciplace1 = Column(String(100))  # 돌발 장소1
     inciplace2 = Column(String(100))  # 돌발 장소2
-    coord_x = Column(String(20))  # 좌표 X
-    coord_y = Column(String(20))  # 좌표 Y
+    coord_x = Column(Numeric(12, 8))  # 좌표 X
+    coord_y = Column(Numeric(12, 8))  # 좌표 Y
+
+    __table_args__ = (
+        Index("ix_incident_info_end_date", "endDate"),  # 진행 중 돌발상황 조회 (get_active_incidents)
+        Index("uq_incident_info_reg_seq", "regSeq", unique=True),  # 자연키 (돌발상황 고유번호)
+    )
 
     def __repr__(self):
         return (f"<getIncidentInfo(routeId={self.routeId}, linkId={self.linkId}, spotId={self.spotId}, "
@@ -195,17 +188,17 @@ class getParkingPlaceInfoList(CommonBase):
     pkplcNm = Column(String(100))  # 주차장명
     pkplcDivNm = Column(String(50))  # 주차장 구분
     pkplcTypeNm = Column(String(50))  # 주차장 유형
-    latCrdn = Column(String(30))  # 위도
-    lonCrdn = Column(String(30))  # 경도
+    latCrdn = Column(Numeric(12, 8))  # 위도
+    lonCrdn = Column(Numeric(12, 8))  # 경도
     roadNmZip = Column(String(10))  # 도로명 우편번호
     roadNmAddr = Column(String(200))  # 도로명 주소
     lotnoAddr = Column(String(200))  # 지번 주소
-    pklotCnt = Column(String(10))  # 주차구획 수
-    sbcmpctPklotCnt = Column(String(10))  # 경차 주차구획 수
-    pwdbsPrvusePklotCnt = Column(String(10))  # 장애인전용 주차구획 수
-    femalePrfncPklotCnt = Column(String(10))  # 여성우대 주차구획 수
-    olmanPrfncPklotCnt = Column(String(10))  # 노인우대 주차구획 수
-    evPklotCnt = Column(String(10))  # 전기차 주차구획 수
+    pklotCnt = Column(Integer)  # 주차구획 수
+    sbcmpctPklotCnt = Column(Integer)  # 경차 주차구획 수
+    pwdbsPrvusePklotCnt = Column(Integer)  # 장애인전용 주차구획 수
+    femalePrfncPklotCnt = Column(Integer)  # 여성우대 주차구획 수
+    olmanPrfncPklotCnt = Column(Integer)  # 노인우대 주차구획 수
+    evPklotCnt = Column(Integer)  # 전기차 주차구획 수
     lndlvDivNm = Column(String(10))  # 급지
     wkdayOprtStartTime = Column(String(10))  # 평일 운영 시작
     wkdayOprtEndTime = Column(String(10))  # 평일 운영 종료
@@ -213,13 +206,17 @@ class getParkingPlaceInfoList(CommonBase):
     satOprtEndTime = Column(String(10))  # 토요일 운영 종료
     hldyOprtStartTime = Column(String(10))  # 휴일 운영 시작
     hldyOprtEndTime = Column(String(10))  # 휴일 운영 종료
-    parkingBscTime = Column(String(10))  # 기본 시간
-    parkingBscFare = Column(String(10))  # 기본 요금
-    addUnitTime = Column(String(10))  # 추가 단위 시간
-    addUnitFare = Column(String(10))  # 추가 단위 요금
-    ddPktckFareAplcnTime = Column(String(10))  # 일 주차권 적용 시간
-    ddPktckFare = Column(String(10))  # 일 주차권 요금
-    mmCmmtktFare = Column(String(10))  # 월 정기권 요금
+    parkingBscTime = Column(Integer)  # 기본 시간
+    parkingBscFare = Column(Integer)  # 기본 요금
+    addUnitTime = Column(Integer)  # 추가 단위 시간
+    addUnitFare = Column(Integer)  # 추가 단위 요금
+    ddPktckFareAplcnTime = Column(Integer)  # 일 주차권 적용 시간
+    ddPktckFare = Column(Integer)  # 일 주차권 요금
+    mmCmmtktFare = Column(Integer)  # 월 정기권 요금
+
+    __table_args__ = (
+        Index("ix_parking_place_info_list_lae", "laeId"),  # 지역별 조회 (get_parking_info_by_location)
+    )
 
     def __repr__(self):
         return (f"<getParkingPlaceInfoList(laeId={self.laeId}, laeNm={self.laeNm}, pkplcId={self.pkplcId}, "
@@ -244,11 +241,171 @@ class getParkingPlaceAvailabilityInfoList(CommonBase):
     laeNm = Column(String(50))  # 지방자치단체명
     pkplcId = Column(String(50))  # 주차장ID
     pkplcNm = Column(String(100))  # 주차장명
-    pklotCnt = Column(String(20))  # 주차구획 수
-    avblPklotCnt = Column(String(20))  # 가용 주차구획 수
-    ocrnDt = Column(String(20))  # 제공시간
+    pklotCnt = Column(Integer)  # 주차구획 수
+    avblPklotCnt = Column(Integer)  # 가용 주차구획 수
+    ocrnDt = Column(DateTime)  # 제공시간
+
+    __table_args__ = (
+        Index("uq_parking_place_availability_info_list_pkplc_ocrn", "pkplcId", "ocrnDt", unique=True),  # 자연키 (같은 스냅샷 중복 적재 방지), 주차장별 이력 조회
+        Index("ix_parking_place_availability_info_list_lae", "laeId"),  # 지역별 조회
+        Index("ix_parking_place_availability_info_list_ocrn", "ocrnDt"),  # 조건 없는 이력 조회의 커서 페이지네이션 (제공 시각 순)
+    )
 
     def __repr__(self):
         return (f"<getParkingPlaceAvailabilityInfoList(laeId={self.laeId}, laeNm={self.laeNm}, "
                 f"pkplcId={self.pkplcId}, pkplcNm={self.pkplcNm}, pklotCnt={self.pklotCnt}, "
-                f"avblPklotCnt={self.avblPklotCnt}, ocrnDt={self.ocrnDt})>")
\ No newline at end of file
+                f"avblPklotCnt={self.avblPklotCnt}, ocrnDt={self.ocrnDt})>")
+
+
+
+class LinkTrafficCurrent(Base):
+    """
+    링크별 최신 교통 정보 (도로/링크 교통 정보 이력에서 수집 시각이 가장 최근인 행만 유지).
+    세 이력 모델이 함께 쓰므로 원본 모델 이름을 키에 넣어 데이터셋마다 따로 유지합니다.
+    """
+    __tablename__ = "link_traffic_current"
+
+    modelName = Column(String(50), primary_key=True)  # 원본 이력 모델 이름
+    linkId = Column(String(50), primary_key=True)  # 링크 ID
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+    linkDelayTime = Column(Integer)  # 링크 지연 시간
+    congGrade = Column(SmallInteger)  # 혼잡 등급(0:정보없음, 1:원활, 2:지체, 3:정체)
+
+    __table_args__ = (
+        Index("ix_link_traffic_current_route", "modelName", "routeId"),  # 데이터셋의 도로별 현재 상태 조회
+    )
+
+    def __repr__(self):
+        return (f"<LinkTrafficCurrent(modelName={self.modelName}, linkId={self.linkId}, routeId={self.routeId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime}, congGrade={self.congGrade})>")
+
+
+class LinkCongestCurrent(Base):
+    """링크별 최신 혼잡 정보 (road_link_congest_info에서 수집 시각이 가장 최근인 행만 유지)"""
+    __tablename__ = "link_congest_current"
+
+    linkId = Column(String(50), primary_key=True)  # 링크 ID
+    routeId = Column(String(50))  # 도로 ID (도로 이름은 road_info_list)
+    collDate = Column(DateTime)  # 수집 날짜
+    spd = Column(SmallInteger)  # 속도
+    vol = Column(Integer)  # 교통량
+    trvlTime = Column(Integer)  # 여행 시간
+
+    __table_args__ = (
+        Index("ix_link_congest_current_route", "routeId"),  # 도로별 현재 상태 조회
+    )
+
+    def __repr__(self):
+        return (f"<LinkCongestCurrent(linkId={self.linkId}, routeId={self.routeId}, collDate={self.collDate}, "
+                f"spd={self.spd}, vol={self.vol}, trvlTime={self.trvlTime})>")
+
+
+class ParkingAvailabilityCurrent(Base):
+    """주차장별 최신 이용가능 정보 (parking_place_availability_info_list에서 제공 시각이 가장 최근인 행만 유지)"""
+    __tablename__ = "parking_availability_current"
+
+    pkplcId = Column(String(50), primary_key=True)  # 주차장ID
+    laeId = Column(String(20))  # 지방자치단체ID
+    laeNm = Column(String(50))  # 지방자치단체명
+    pkplcNm = Column(String(100))  # 주차장명
+    pklotCnt = Column(Integer)  # 주차구획 수
+    avblPklotCnt = Column(Integer)  # 가용 주차구획 수
+    ocrnDt = Column(DateTime)  # 제공시간
+
+    __table_args__ = (
+        Index("ix_parking_availability_current_lae", "laeId"),  # 지역별 현재 상태 조회
+    )
+
+    def __repr__(self):
+        return (f"<ParkingAvailabilityCurrent(pkplcId={self.pkplcId}, laeId={self.laeId}, pkplcNm={self.pkplcNm}, "
+                f"pklotCnt={self.pklotCnt}, avblPklotCnt={self.avblPklotCnt}, ocrnDt={self.ocrnDt})>")
+
+
+class TrafficRollup(Base):
+    """링크/도로별 교통 정보 집계 (5분, 1시간, 1일 단위 버킷)"""
+    __tablename__ = "traffic_rollup"
+
+    modelName = Column(String(50), primary_key=True)  # 원본 이력 모델 이름
+    grain = Column(String(3), primary_key=True)  # 집계 단위 (5m, 1h, 1d)
+    scope = Column(String(5), primary_key=True)  # 집계 기준 (link, route)
+    scopeId = Column(String(50), primary_key=True)  # 링크 ID 또는 도로 ID
+    bucketStart = Column(DateTime, primary_key=True)  # 버킷 시작 시각
+    sampleCount = Column(Integer, nullable=False, default=0)  # 원본 행 수
+    spdCount = Column(Integer, nullable=False, default=0)  # 속도 값이 있는 행 수
+    spdSum = Column(Integer, nullable=False, default=0)  # 속도 합계
+    spdMin = Column(SmallInteger)  # 최저 속도
+    spdMax = Column(SmallInteger)  # 최고 속도
+    volSum = Column(BigInteger, nullable=False, default=0)  # 교통량 합계
+    trvlTimeCount = Column(Integer, nullable=False, default=0)  # 여행 시간 값이 있는 행 수
+    trvlTimeSum = Column(BigInteger, nullable=False, default=0)  # 여행 시간 합계
+    congGrade0 = Column(Integer, nullable=False, default=0)  # 혼잡 등급별 행 수 (0:정보없음)
+    congGrade1 = Column(Integer, nullable=False, default=0)  # 1:원활
+    congGrade2 = Column(Integer, nullable=False, default=0)  # 2:지체
+    congGrade3 = Column(Integer, nullable=False, default=0)  # 3:정체
+
+    def __repr__(self):
+        return (f"<TrafficRollup(modelName={self.modelName}, grain={self.grain}, scope={self.scope}, "
+                f"scopeId={self.scopeId}, bucketStart={self.bucketStart}, sampleCount={self.sampleCount})>")
+
+
+class RollupDirty(Base):
+    """적재 후 다시 집계해야 하는 5분 버킷 (집계 작업이 처리하고 삭제)"""
+    __tablename__ = "rollup_dirty"
+
+    modelName = Column(String(50), primary_key=True)  # 원본 이력 모델 이름
+    scope = Column(String(5), primary_key=True)  # 집계 기준 (link, route)
+    scopeId = Column(String(50), primary_key=True)  # 링크 ID 또는 도로 ID
+    bucketStart = Column(DateTime, primary_key=True)  # 5분 버킷 시작 시각
+    markedAt = Column(BigInteger, nullable=False)  # 마지막으로 표시한 시각 (나노초, 처리 중 다시 표시된 버킷을 구분)
+
+    def __repr__(self):
+        return (f"<RollupDirty(modelName={self.modelName}, scope={self.scope}, scopeId={self.scopeId}, "
+                f"bucketStart={self.bucketStart})>")
+
+class RecordFingerprint(Base):
+    __tablename__ = "record_fingerprint"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key
+    modelName = Column(String(50), nullable=False)  # 대상 모델 이름
+    recordKey = Column(String(32), nullable=False)  # 자연키 해시
+    fingerprint = Column(String(32), nullable=False)  # 레코드 내용 해시
+
+    __table_args__ = (UniqueConstraint("modelName", "recordKey", name="uq_record_fingerprint_key"),)
+
+    def __repr__(self):
+        return f"<RecordFingerprint(modelName={self.modelName}, recordKey={self.recordKey}, fingerprint={self.fingerprint})>"
+
+
+
+class DataVersion(Base):
+    """테이블별 데이터 버전 - 쓰기가 커밋될 때 같은 트랜잭션에서 1씩 올림 (조회 캐시 키와 ETag에 사용, database.version)"""
+    __tablename__ = "data_version"
+
+    tableName = Column(String(64), primary_key=True)  # 테이블 이름
+    version = Column(BigInteger, nullable=False, default=0)  # 쓰기 커밋 횟수
+    modifiedAt = Column(BigInteger, nullable=False)  # 마지막 쓰기 커밋 시각 (나노초)
+
+    def __repr__(self):
+        return f"<DataVersion(tableName={self.tableName}, version={self.version}, modifiedAt={self.modifiedAt})>"
+
+
+class CrawlCheckpoint(Base):
+    __tablename__ = "crawl_checkpoint"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)  # 기본 primary key
+    endpoint = Column(String(50), nullable=False)  # 수집 대상 API
+    paramValue = Column(String(50), nullable=False)  # 호출 파라미터 값 (routeId, linkId, laeId 등)
+    runId = Column(String(20), nullable=False)  # 크롤링 실행 ID
+    status = Column(String(10), nullable=False)  # 처리 결과 (done, failed)
+    rowCount = Column(Integer, default=0)  # 수집된 레코드 수
+    updatedAt = Column(DateTime, server_default=func.now(), onupdate=func.now())  # 마지막 처리 시각
+
+    __table_args__ = (UniqueConstraint("endpoint", "paramValue", name="uq_crawl_checkpoint_param"),)
+
+    def __repr__(self):
+        return (f"<CrawlCheckpoint(endpoint={self.endpoint}, paramValue={self.paramValue}, runId={self.runId}, "
+                f"status={self.status}, rowCount={self.rowCount})>")
@@ -0,0 +1,330 @@
+"""
+이력(append-only) 테이블의 수집 시각 기준 파티션 관리 (src 디렉터리에서 실행).
+
+    python -m database.partition status
+    python -m database.partition init [--table road_traffic_info_list]   # MySQL: 기존 테이블을 RANGE 파티션으로 전환
+    python -m database.partition maintain                                 # 미래 파티션 생성 + 보관 기간이 지난 파티션 삭제
+
+MySQL에서는 이력 테이블을 수집 시각 컬럼(collDate, ocrnDt)으로 RANGE COLUMNS 파티셔닝하고,
+보관 기간이 지난 데이터는 DELETE 대신 DROP PARTITION으로 지웁니다. 시각 조건이 있는 조회는 파티션 프루닝이 적용됩니다.
+MySQL 파티션 테이블은 모든 유니크 키(기본키 포함)에 파티션 컬럼이 있어야 하므로
+init은 기본키를 (id, 시각 컬럼)으로 바꾸고 시각 컬럼을 NOT NULL로 바꿉니다.
+시각이 비어 있는 행은 어느 구간에도 넣을 수 없으므로 <테이블>_quarantine으로 옮겨 두고 파티셔닝합니다.
+그 밖의 DB(SQLite 등)나 아직 파티셔닝하지 않은 테이블은 오래된 행을 청크 단위 DELETE로 지웁니다.
+"""
+import argparse
+import logging
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, MetaData, Table, delete, func, insert, inspect, select, text
+from sqlalchemy.engine import Engine
+
+from database.connection import engine
+from database.orm import RecordFingerprint
+from database.repository import MODEL_MAP, HISTORY_TIME_COLUMNS
+from database.version import bump_data_version
+
+
+logger = logging.getLogger(__name__)
+
+# 파티션 단위: "daily" 또는 "monthly"
+PARTITION_INTERVAL = os.getenv("PARTITION_INTERVAL", "monthly").strip().lower()
+# 현재 구간 이후로 미리 만들어 둘 파티션 수
+PARTITION_PRECREATE = int(os.getenv("PARTITION_PRECREATE", "3"))
+# 이력 데이터 보관 기간 (일, 0이면 삭제하지 않음)
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", "90"))
+# 파티션 유지보수 작업 실행 간격 (초, 0이면 스케줄러에 등록하지 않음)
+PARTITION_MAINTENANCE_INTERVAL = float(os.getenv("PARTITION_MAINTENANCE_INTERVAL", "3600"))
+# 파티션이 없는 테이블에서 오래된 행을 지울 때 한 번에 삭제할 행 수
+PURGE_CHUNK_SIZE = int(os.getenv("PURGE_CHUNK_SIZE", "5000"))
+
+# 마지막 구간 이후의 모든 값을 받는 파티션
+FUTURE_PARTITION = "p_future"
+# 수집 시각이 없어 파티션에 넣을 수 없는 행을 옮겨 두는 테이블 이름 접미사
+QUARANTINE_SUFFIX = "_quarantine"
+
+
+def get_retention_days() -> dict[str, int]:
+    """
+    모델별 보관 기간(일)을 반환합니다.
+    HISTORY_RETENTION="getRoadLinkCongestInfo=30,getParkingPlaceAvailabilityInfoList=7" 처럼 모델별로 덮어쓸 수 있습니다.
+    """
+    retention = {model_name: HISTORY_RETENTION_DAYS for model_name in HISTORY_TIME_COLUMNS}
+    for entry in os.getenv("HISTORY_RETENTION", "").split(","):
+        name, _, days = entry.partition("=")
+        if days and name.strip() in retention:
+            retention[name.strip()] = int(days)
+    return retention
+
+
+def period_start(value: datetime, interval: str = PARTITION_INTERVAL) -> datetime:
+    """시각이 속한 파티션 구간의 시작 시각"""
+    if interval == "daily":
+        return datetime(value.year, value.month, value.day)
+    if interval == "monthly":
+        return datetime(value.year, value.month, 1)
+    raise ValueError(f"지원하지 않는 파티션 단위입니다: {interval}")
+
+
+def next_period(start: datetime, interval: str = PARTITION_INTERVAL) -> datetime:
+    """다음 파티션 구간의 시작 시각"""
+    if interval == "daily":
+        return start + timedelta(days=1)
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def partition_name(start: datetime, interval: str = PARTITION_INTERVAL) -> str:
+    """구간 시작 시각으로 만든 파티션 이름 (p20250801 / p202508)"""
+    return start.strftime("p%Y%m%d" if interval == "daily" else "p%Y%m")
+
+
+def parse_partition_name(name: str) -> tuple[datetime, datetime] | None:
+    """파티션 이름에서 (구간 시작, 구간 끝) 을 구합니다 (이 모듈이 만든 이름이 아니면 None)."""
+    # strptime은 자릿수가 모자라도 받아들이므로 (p202612 -> 2026-01-02) 길이로 단위를 구분
+    for fmt, interval, length in (("p%Y%m%d", "daily", 9), ("p%Y%m", "monthly", 7)):
+        if len(name) != length:
+            continue
+        try:
+            start = datetime.strptime(name, fmt)
+        except ValueError:
+            continue
+        return start, next_period(start, interval)
+    return None
+
+
+def _periods(start: datetime, until: datetime) -> list[datetime]:
+    """start 구간부터 until 이전에 시작하는 구간들의 시작 시각 목록"""
+    periods = []
+    while start < until:
+        periods.append(start)
+        start = next_period(start)
+    return periods
+
+
+def _horizon(now: datetime) -> datetime:
+    """미리 만들어 둘 파티션의 끝 (현재 구간 + PARTITION_PRECREATE개 구간)"""
+    end = next_period(period_start(now))
+    for _ in range(PARTITION_PRECREATE):
+        end = next_period(end)
+    return end
+
+
+def _partition_ddl(starts: list[datetime]) -> str:
+    definitions = [
+        f"PARTITION {partition_name(start)} VALUES LESS THAN ('{next_period(start):%Y-%m-%d %H:%M:%S}')"
+        for start in starts
+    ]
+    definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ", ".join(definitions)
+
+
+def get_partitions(conn, table_name: str) -> list[str]:
+    """MySQL 테이블의 파티션 이름 목록 (파티셔닝하지 않은 테이블이면 빈 목록)"""
+    return list(conn.execute(text(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION"
+    ), {"table_name": table_name}).scalars())
+
+
+def quarantine_table(conn, table_name: str, columns) -> Table:
+    """
+    수집 시각이 없거나 해석할 수 없는 행을 원래 값 그대로 보관하는 <테이블>_quarantine 테이블 (없으면 생성).
+    확인 후 시각을 고쳐 다시 넣거나 테이블을 삭제하면 됩니다.
+
+    :param columns: 테이블을 새로 만들 때 쓸 컬럼 (이름과 타입만 복사, 키/인덱스 없음)
+    """
+    name = f"{table_name}{QUARANTINE_SUFFIX}"
+    if not inspect(conn).has_table(name):
+        Table(name, MetaData(), *(Column(column.name, column.type) for column in columns)).create(conn)
+    return Table(name, MetaData(), autoload_with=conn)
+
+
+def partition_table(model_name: str, bind: Engine = engine, now: datetime | None = None) -> list[str]:
+    """
+    MySQL의 기존 이력 테이블을 수집 시각 기준 RANGE COLUMNS 파티션 테이블로 전환합니다.
+    테이블을 다시 쓰는 작업이므로 데이터가 많으면 오래 걸립니다 (이미 파티셔닝된 테이블은 건너뜀).
+
+    :param model_name: 대상 이력 모델 이름
+    :param bind: 대상 엔진
+    :param now: 기준 시각 (기본: 현재)
+    :return: 생성한 파티션 이름 목록 (수집 시각이 없는 행은 <테이블>_quarantine으로 옮김)
+    """
+    if bind.dialect.name != "mysql":
+        raise ValueError(f"파티셔닝은 MySQL에서만 지원합니다: {bind.dialect.name}")
+    table = MODEL_MAP[model_name].__table__
+    time_column = HISTORY_TIME_COLUMNS[model_name]
+    now = now or datetime.now()
+
+    with bind.begin() as conn:
+        if get_partitions(conn, table.name):
+            return []
+        # NULL은 RANGE COLUMNS에서 가장 낮은 파티션에 들어가고 NOT NULL 변경도 막으므로 격리 테이블로 옮김
+        untimed = table.c[time_column].is_(None)
+        missing = conn.execute(select(func.count()).where(untimed)).scalar()
+        if missing:
+            quarantine = quarantine_table(conn, table.name, table.columns)
+            names = [column.name for column in table.columns if column.name in quarantine.c]
+            conn.execute(insert(quarantine).from_select(names, select(*(table.c[name] for name in names)).where(untimed)))
+            conn.execute(delete(table).where(untimed))
+            logger.warning("%s: %s가 비어 있는 행 %d개를 %s로 옮겼습니다", table.name, time_column, missing, quarantine.name)
+        oldest = conn.execute(select(func.min(table.c[time_column]))).scalar() or now
+        starts = _periods(period_start(oldest), _horizon(now))
+        # 파티션 컬럼이 모든 유니크 키에 포함되어야 하므로 기본키를 (id, 시각 컬럼)으로 변경
+        conn.execute(text(
+            f"ALTER TABLE {table.name} MODIFY {time_column} DATETIME NOT NULL, "
+            f"DROP PRIMARY KEY, ADD PRIMARY KEY (id, {time_column})"
+        ))
+        conn.execute(text(
+            f"ALTER TABLE {table.name} PARTITION BY RANGE COLUMNS({time_column}) ({_partition_ddl(starts)})"
+        ))
+    return [partition_name(start) for start in starts]
+
+
+def create_future_partitions(conn, table_name: str, partitions: list[str], now: datetime) -> list[str]:
+    """p_future를 쪼개어 앞으로 쓸 구간의 파티션을 미리 만듭니다 (p_future는 보통 비어 있어 빠름)."""
+    ranges = [parse_partition_name(name) for name in partitions]
+    last_end = max((end for _, end in filter(None, ranges)), default=period_start(now))
+    starts = _periods(last_end, _horizon(now))
+    if starts:
+        conn.execute(text(
+            f"ALTER TABLE {table_name} REORGANIZE PARTITION {FUTURE_PARTITION} INTO ({_partition_ddl(starts)})"
+        ))
+    return [partition_name(start) for start in starts]
+
+
+def drop_expired_partitions(conn, table_name: str, partitions: list[str], cutoff: datetime) -> list[str]:
+    """구간 전체가 보관 기준 시각(cutoff) 이전인 파티션을 삭제합니다."""
+    expired = [
+        name for name in partitions
+        if (bounds := parse_partition_name(name)) and bounds[1] <= cutoff
+    ]
+    if expired:
+        conn.execute(text(f"ALTER TABLE {table_name} DROP PARTITION {', '.join(expired)}"))
+    return expired
+
+
+def purge_expired_rows(model_name: str, cutoff: datetime, bind: Engine = engine,
+                       chunk_size: int = PURGE_CHUNK_SIZE) -> int:
+    """
+    파티션이 없는 테이블에서 보관 기준 시각 이전의 행을 청크 단위로 삭제합니다 (청크마다 커밋하여 긴 잠금을 피함).
+
+    :return: 삭제한 행 수
+    """
+    table = MODEL_MAP[model_name].__table__
+    time_column = table.c[HISTORY_TIME_COLUMNS[model_name]]
+    deleted = 0
+    while True:
+        with bind.begin() as conn:
+            # 오래된 행은 id가 작으므로 id 순으로 찾으면 앞부분만 읽고 끝남
+            ids = conn.execute(
+                select(table.c.id).where(time_column < cutoff).order_by(table.c.id).limit(chunk_size)
+            ).scalars().all()
+            if not ids:
+                break
+            conn.execute(delete(table).where(table.c.id.in_(ids)))
+        deleted += len(ids)
+    return deleted
+
+
+def purge_history_fingerprints(model_name: str, bind: Engine = engine, chunk_size: int = PURGE_CHUNK_SIZE) -> int:
+    """
+    이력 모델의 변경 감지 지문(record_fingerprint)을 청크 단위로 삭제합니다.
+    이력은 지문 없이 자연키 유니크 인덱스로 중복을 거르므로(repository.ingest_incremental), 남아 있는 지문은
+    이전 버전이 쓴 것입니다. 보관 기간이 지나 삭제된 행의 지문이 남으면 다시 적재/재생할 때 그 행이 "변경 없음"으로 건너뛰어집니다.
+
+    :return: 삭제한 지문 수
+    """
+    table = RecordFingerprint.__table__
+    deleted = 0
+    while True:
+        with bind.begin() as conn:
+            ids = conn.execute(
+                select(table.c.id).where(table.c.modelName == model_name).limit(chunk_size)
+            ).scalars().all()
+            if not ids:
+                break
+            conn.execute(delete(table).where(table.c.id.in_(ids)))
+        deleted += len(ids)
+    return deleted
+
+
+def run_maintenance(bind: Engine = engine, now: datetime | None = None) -> dict[str, dict]:
+    """
+    모든 이력 테이블에 대해 미래 파티션을 만들고 보관 기간이 지난 데이터를 삭제합니다.
+    이력 모델의 남은 변경 감지 지문도 함께 지웁니다 (purge_history_fingerprints).
+
+    :return: 테이블별 {"created": 생성한 파티션, "dropped": 삭제한 파티션, "deleted": DELETE로 지운 행 수,
+             "fingerprints": 삭제한 지문 수}
+    """
+    now = now or datetime.now()
+    existing = set(inspect(bind).get_table_names())
+    retention = get_retention_days()
+    results = {}
+    for model_name in HISTORY_TIME_COLUMNS:
+        table_name = MODEL_MAP[model_name].__table__.name
+        if table_name not in existing:
+            continue
+        days = retention[model_name]
+        cutoff = now - timedelta(days=days)
+        result = {"created": [], "dropped": [], "deleted": 0, "fingerprints": 0}
+
+        partitions = []
+        if bind.dialect.name == "mysql":
+            with bind.connect() as conn:
+                partitions = get_partitions(conn, table_name)
+        if partitions:
+            with bind.begin() as conn:
+                result["created"] = create_future_partitions(conn, table_name, partitions, now)
+                if days > 0:
+                    result["dropped"] = drop_expired_partitions(conn, table_name, partitions, cutoff)
+        elif days > 0:
+            result["deleted"] = purge_expired_rows(model_name, cutoff, bind)
+        if RecordFingerprint.__table__.name in existing:
+            result["fingerprints"] = purge_history_fingerprints(model_name, bind)
+
+        if result["dropped"] or result["deleted"]:
+            # 세션 밖에서 지웠으므로 조회 캐시가 다시 읽도록 직접 버전을 올림
+            bump_data_version(table_name)
+        if any(result.values()):
+            logger.info("%s 파티션 유지보수: %s", table_name, result)
+        results[table_name] = result
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이력 테이블 파티션 관리")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="테이블별 파티션과 보관 기간 확인")
+    init = commands.add_parser("init", help="MySQL 이력 테이블을 수집 시각 기준 파티션 테이블로 전환")
+    init.add_argument("--table", action="append", help="대상 테이블 (여러 번 지정 가능, 기본: 모든 이력 테이블)")
+    commands.add_parser("maintain", help="미래 파티션 생성 + 보관 기간이 지난 데이터 삭제")
+    args = parser.parse_args()
+
+    retention = get_retention_days()
+    if args.command == "status":
+        existing = set(inspect(engine).get_table_names())
+        for model_name in HISTORY_TIME_COLUMNS:
+            table_name = MODEL_MAP[model_name].__table__.name
+            partitions = []
+            if engine.dialect.name == "mysql" and table_name in existing:
+                with engine.connect() as conn:
+                    partitions = get_partitions(conn, table_name)
+            layout = f"파티션 {len(partitions)}개 ({partitions[0]} ~ {partitions[-1]})" if partitions else "파티션 없음"
+            print(f"{table_name}: {layout}, 보관 기간 {retention[model_name] or '무제한'}일")
+    elif args.command == "init":
+        for model_name in HISTORY_TIME_COLUMNS:
+            table_name = MODEL_MAP[model_name].__table__.name
+            if args.table and table_name not in args.table:
+                continue
+            created = partition_table(model_name)
+            print(f"{table_name}: {'파티션 ' + str(len(created)) + '개 생성' if created else '이미 파티셔닝됨'}")
+    elif args.command == "maintain":
+        for table_name, result in run_maintenance().items():
+            print(f"{table_name}: 생성 {result['created'] or '-'}, 삭제 {result['dropped'] or '-'}, "
+                  f"행 삭제 {result['deleted']}개, 지문 삭제 {result['fingerprints']}개")
+
+
+if __name__ == "__main__":
+    main()
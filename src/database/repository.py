@@ -1,12 +1,31 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from sqlalchemy.sql import Select
+from sqlalchemy import select, delete, insert, update, tuple_, func, case, or_, UniqueConstraint, PrimaryKeyConstraint
+from sqlalchemy.dialects import mysql, sqlite, postgresql
+from database.converter import convert_records
+from database.counting import CountMode, count_rows
+from database.cursor import keyset_query, cursor_page
+from database.filters import filtered_query
+from database.schema.request import (PaginationRequest, RoadInfoPageRequest, RoadTrafficInfoPageRequest, ParkingPlaceInfoPageRequest,
+                                     IncidentInfoPageRequest, ParkingAvailabilityPageRequest)
 from database.orm import (getParkingPlaceAvailabilityInfoList, getIncidentInfo,
                           getRoadLinkInfoList, RoadInfoList,
                           getRoadTrafficInfoList, getRoadLinkTrafficInfoList,
                           getRoadLinkTrafficInfo, getRoadLinkCongestInfo,
-                          getParkingPlaceInfoList, associatedParkingPlaceInfoList)
+                          getParkingPlaceInfoList, associatedParkingPlaceInfoList,
+                          LinkTrafficCurrent, LinkCongestCurrent, ParkingAvailabilityCurrent,
+                          RollupDirty, RecordFingerprint, CrawlCheckpoint)
 
 
+logger = logging.getLogger(__name__)
+
 MODEL_MAP = {
     "getParkingPlaceAvailabilityInfoList": getParkingPlaceAvailabilityInfoList,
     "getIncidentInfo": getIncidentInfo,
@@ -20,25 +39,120 @@ MODEL_MAP = {
     "associatedParkingPlaceInfoList": associatedParkingPlaceInfoList
 }
 
-def insert_data(db: Session, model_name: str, data: list[dict]):
+# 모델별 자연키 (업스트림 데이터가 실제로 갖고 있는 식별자, 업서트 기준)
+NATURAL_KEYS = {
+    "RoadInfoList": ("routeId",),
+    "getRoadLinkInfoList": ("linkId",),
+    "getRoadTrafficInfoList": ("linkId", "collDate"),
+    "getRoadLinkTrafficInfoList": ("linkId", "collDate"),
+    "getRoadLinkTrafficInfo": ("linkId", "collDate"),
+    "getRoadLinkCongestInfo": ("linkId", "collDate"),
+    "getIncidentInfo": ("regSeq",),
+    "getParkingPlaceInfoList": ("pkplcId",),
+    "getParkingPlaceAvailabilityInfoList": ("pkplcId", "ocrnDt"),
+    "associatedParkingPlaceInfoList": ("laeId",)
+}
+
+# 수집 시각 컬럼을 가진 이력(append-only) 모델과 그 시각 컬럼
+HISTORY_TIME_COLUMNS = {
+    "getRoadTrafficInfoList": "collDate",
+    "getRoadLinkTrafficInfoList": "collDate",
+    "getRoadLinkTrafficInfo": "collDate",
+    "getRoadLinkCongestInfo": "collDate",
+    "getParkingPlaceAvailabilityInfoList": "ocrnDt"
+}
+
+# 이력 모델별로 함께 갱신하는 최신 상태 테이블 (키당 수집 시각이 가장 최근인 행 하나만 유지)
+# 여러 이력 모델이 함께 쓰는 테이블은 modelName을 기본키에 두어 데이터셋마다 따로 유지
+CURRENT_STATE_MODELS = {
+    "getRoadTrafficInfoList": LinkTrafficCurrent,
+    "getRoadLinkTrafficInfoList": LinkTrafficCurrent,
+    "getRoadLinkTrafficInfo": LinkTrafficCurrent,
+    "getRoadLinkCongestInfo": LinkCongestCurrent,
+    "getParkingPlaceAvailabilityInfoList": ParkingAvailabilityCurrent
+}
+
+# 이력에는 키와 측정값만 저장하고, 수집 행에 함께 들어오는 이름/링크 속성은 참조 테이블에 둠
+# 참조 모델 -> 교통 정보 수집 행에서 옮겨 담을 컬럼 (첫 번째가 자연키)
+REFERENCE_COLUMNS = {
+    "RoadInfoList": ("routeId", "routeNm"),
+    "getRoadLinkInfoList": ("linkId", "routeWay", "routeSeq", "startNodeId", "startNodeNm", "endNodeId", "endNodeNm")
+}
+# 교통 정보 응답에 road_link_info_list에서 채워 넣는 링크 속성
+LINK_ATTRIBUTE_COLUMNS = REFERENCE_COLUMNS["getRoadLinkInfoList"][1:]
+# 이름을 참조 테이블로 분리한 이력 모델
+REFERENCE_SOURCE_MODELS = ("getRoadTrafficInfoList", "getRoadLinkTrafficInfoList", "getRoadLinkTrafficInfo", "getRoadLinkCongestInfo")
+
+# 링크/도로별 교통 집계(traffic_rollup)를 만드는 이력 모델
+ROLLUP_MODELS = ("getRoadTrafficInfoList", "getRoadLinkTrafficInfoList", "getRoadLinkTrafficInfo", "getRoadLinkCongestInfo")
+# 집계 기준과 원본 컬럼
+ROLLUP_SCOPES = {"link": "linkId", "route": "routeId"}
+# 가장 작은 집계 단위 (적재 시 이 단위의 버킷을 다시 집계 대상으로 표시)
+ROLLUP_BASE_MINUTES = 5
+
+# 대량 삽입 시 한 번의 INSERT 문(executemany)으로 보낼 행 수
+BULK_INSERT_CHUNK_SIZE = int(os.getenv("BULK_INSERT_CHUNK_SIZE", "5000"))
+
+
+def _clean_rows(model, data: list[dict]) -> list[dict]:
     """
-    데이터베이스에 데이터를 삽입합니다.
+    모델 컬럼에 없는 키와 auto-increment id를 제거하고, 모든 행이 같은 키를 갖도록 맞춥니다.
+    (executemany는 모든 행의 키 구성이 같아야 함)
+    """
+    columns = set(model.__table__.columns.keys()) - {"id"}
+    rows = [{k: v for k, v in item.items() if k in columns} for item in data]
+    keys = set().union(*rows) if rows else set()
+    return [{key: row.get(key) for key in keys} for row in rows]
+
+
+def bulk_insert_data(db: Session, model_name: str, data: list[dict],
+                     chunk_size: int = BULK_INSERT_CHUNK_SIZE, commit_per_chunk: bool = False, commit: bool = True) -> int:
+    """
+    ORM 객체를 만들지 않고 Core INSERT(executemany)로 데이터를 대량 삽입합니다.
+    PyMySQL은 executemany를 다중 행 INSERT ... VALUES (...), (...) 로 묶어서 전송합니다.
     
     :param db: SQLAlchemy 세션 객체
     :param model_name: 삽입할 모델의 이름
-    :param data: 삽입할 데이터 리스트
+    :param data: 삽입할 데이터 리스트 (모델에 없는 키는 무시)
+    :param chunk_size: INSERT 문 하나에 담을 행 수
+    :param commit_per_chunk: True면 청크마다 커밋, False면 전체를 하나의 트랜잭션으로 커밋
+    :param commit: False면 마지막 커밋을 호출한 쪽에 맡김
+    :return: 삽입한 행 수 (자연키가 이미 있어 건너뛴 행 제외)
     """
     if model_name not in MODEL_MAP:
         raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
 
     model = MODEL_MAP[model_name]
+    table = model.__table__
+    # 자연키에 유니크 인덱스가 있으면 이미 있는 스냅샷은 건너뜀 (같은 수집 결과를 여러 번 적재해도 중복되지 않음)
+    key_columns = NATURAL_KEYS.get(model_name)
+    skip_duplicates = bool(key_columns) and _has_unique_key(table, key_columns)
+    inserted = 0
+
+    for start in range(0, len(data), chunk_size):
+        rows = _clean_rows(model, data[start:start + chunk_size])
+        if rows and skip_duplicates:
+            inserted += _insert_ignore(db, table, rows, key_columns)
+        elif rows:
+            db.execute(insert(table), rows)
+            inserted += len(rows)
+        if commit_per_chunk:
+            db.commit()
+
+    if commit:
+        db.commit()
+    return inserted
+
+
+def insert_data(db: Session, model_name: str, data: list[dict]):
+    """
+    데이터베이스에 데이터를 삽입합니다.
     
-    for item in data:
-        # id 필드가 있다면 제거 (auto-increment이므로)
-        clean_item = {k: v for k, v in item.items() if k != 'id'}
-        db.add(model(**clean_item))
-    
-    db.commit()
+    :param db: SQLAlchemy 세션 객체
+    :param model_name: 삽입할 모델의 이름
+    :param data: 삽입할 데이터 리스트
+    """
+    bulk_insert_data(db, model_name, data)
 
 
 def get_all_data(db: Session, model_name: str) -> list[object]:
@@ -87,16 +201,9 @@ def get_paginated_data(db: Session, model_name: str, page: int = 1, page_size: i
     if model_name not in MODEL_MAP:
         raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
     
-    model = MODEL_MAP[model_name]
-    
-    # 전체 데이터 수 조회
-    total_count = db.query(model).count()
-    
-    # 페이지네이션 적용하여 데이터 조회
-    offset = (page - 1) * page_size
-    data = db.query(model).offset(offset).limit(page_size).all()
-    
-    return data, total_count
+    # 전체 데이터 수는 데이터 버전별로 캐시된 COUNT 사용 (적재가 커밋되면 다시 셈)
+    result = _paginate(db, select(MODEL_MAP[model_name]), page, page_size)
+    return result.items, result.total_count
 
 
 def delete_all_data(db: Session, model_name: str) -> int:
@@ -111,44 +218,414 @@ def delete_all_data(db: Session, model_name: str) -> int:
         raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
     
     model = MODEL_MAP[model_name]
-    deleted_count = db.query(model).delete()
+    # ORM 객체를 불러오지 않고 DELETE 문 하나로 삭제 (이력 테이블의 오래된 데이터는 database.partition이 정리)
+    deleted_count = db.execute(delete(model.__table__)).rowcount
+    # 변경 감지 인덱스도 함께 비워야 다음 수집 때 다시 적재됨
+    db.execute(delete(RecordFingerprint.__table__).where(RecordFingerprint.modelName == model_name))
     db.commit()
     return deleted_count
 
 
+def _has_unique_key(table, key_columns: tuple[str, ...]) -> bool:
+    """자연키와 정확히 일치하는 유니크 제약조건/인덱스가 테이블에 있는지 확인합니다."""
+    keys = set(key_columns)
+    for constraint in table.constraints:
+        if isinstance(constraint, (UniqueConstraint, PrimaryKeyConstraint)) and set(constraint.columns.keys()) == keys:
+            return True
+    return any(index.unique and {column.name for column in index.columns} == keys for index in table.indexes)
+
+
+def _dedupe_rows(rows: list[dict], key_columns: tuple[str, ...]) -> list[dict]:
+    """같은 배치 안에서 자연키가 겹치는 행은 마지막 행만 남깁니다 (자연키가 비어 있는 행은 그대로 유지)."""
+    deduped = {}
+    for index, row in enumerate(rows):
+        key = tuple(row.get(column) for column in key_columns)
+        deduped[key if None not in key else ("__nokey__", index)] = row
+    return list(deduped.values())
+
+
+def _native_upsert(db: Session, table, rows: list[dict], key_columns: tuple[str, ...]):
+    """DB 방언의 업서트 구문(MySQL ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL ON CONFLICT)으로 한 번에 씁니다."""
+    dialect = db.get_bind().dialect.name
+    update_columns = [column for column in rows[0] if column not in key_columns]
+
+    if dialect == "mysql":
+        stmt = mysql.insert(table)
+        # 갱신할 컬럼이 없으면 자연키를 자기 자신으로 갱신하여 중복만 무시
+        assignments = {column: stmt.inserted[column] for column in update_columns} or {key_columns[0]: table.c[key_columns[0]]}
+        stmt = stmt.on_duplicate_key_update(assignments)
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={column: stmt.excluded[column] for column in update_columns}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(key_columns))
+    else:
+        raise ValueError(f"업서트를 지원하지 않는 데이터베이스입니다: {dialect}")
+
+    db.execute(stmt, rows)
+
+
+def _insert_ignore(db: Session, table, rows: list[dict], key_columns: tuple[str, ...]) -> int:
+    """자연키가 이미 있는 행은 건너뛰고 삽입한 뒤, 실제로 삽입된 행 수를 반환합니다."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        # ON DUPLICATE KEY UPDATE로 무시하면 영향 행 수에 중복도 포함되므로 IGNORE 사용
+        stmt = mysql.insert(table).prefix_with("IGNORE")
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite if dialect == "sqlite" else postgresql).insert(table).on_conflict_do_nothing(
+            index_elements=list(key_columns)
+        )
+    else:
+        raise ValueError(f"업서트를 지원하지 않는 데이터베이스입니다: {dialect}")
+    rowcount = db.execute(stmt, rows).rowcount
+    return rowcount if rowcount >= 0 else len(rows)
+
+
+def _set_based_upsert(db: Session, model, rows: list[dict], key_columns: tuple[str, ...]):
+    """
+    자연키에 유니크 제약조건이 없는 테이블용 업서트.
+    기존 행을 자연키 IN 조회 한 번으로 찾은 뒤, 갱신(bulk UPDATE by id)과 삽입(executemany)을 각각 한 번씩 실행합니다.
+    """
+    table = model.__table__
+    key_cols = [table.c[column] for column in key_columns]
+    keys = {tuple(row[column] for column in key_columns) for row in rows if None not in (row[column] for column in key_columns)}
+
+    existing_ids = {}
+    if keys:
+        key_expr = key_cols[0] if len(key_cols) == 1 else tuple_(*key_cols)
+        values = [key[0] for key in keys] if len(key_cols) == 1 else list(keys)
+        for existing_id, *key in db.execute(select(table.c.id, *key_cols).where(key_expr.in_(values))):
+            existing_ids[tuple(key)] = existing_id
+
+    updates, inserts = [], []
+    for row in rows:
+        existing_id = existing_ids.get(tuple(row[column] for column in key_columns))
+        if existing_id is None:
+            inserts.append(row)
+        else:
+            updates.append({"id": existing_id, **row})
+
+    if updates:
+        db.execute(update(model), updates)
+    if inserts:
+        db.execute(insert(table), inserts)
+
+
+def _prepare_keyed_rows(model_name: str, data: list[dict]) -> list[dict]:
+    """모델 컬럼만 남기고, 자연키 컬럼을 항상 포함시킨 뒤 배치 내 자연키 중복을 제거합니다."""
+    key_columns = NATURAL_KEYS[model_name]
+    rows = _clean_rows(MODEL_MAP[model_name], data)
+    # 자연키 컬럼이 없는 행도 같은 키 구성을 갖도록 보정
+    return _dedupe_rows([{**{column: None for column in key_columns}, **row} for row in rows], key_columns)
+
+
+def _upsert_rows(db: Session, model_name: str, rows: list[dict]):
+    """정리된 행들을 커밋 없이 업서트합니다."""
+    if not rows:
+        return
+    model = MODEL_MAP[model_name]
+    key_columns = NATURAL_KEYS[model_name]
+    if _has_unique_key(model.__table__, key_columns):
+        _native_upsert(db, model.__table__, rows, key_columns)
+    else:
+        _set_based_upsert(db, model, rows, key_columns)
+
+
+def upsert_data(db: Session, model_name: str, data: list[dict],
+                chunk_size: int = BULK_INSERT_CHUNK_SIZE, commit: bool = True) -> int:
+    """
+    자연키(NATURAL_KEYS) 기준으로 데이터를 일괄 업서트합니다.
+    자연키에 유니크 제약조건이 있으면 DB 방언의 업서트 구문을, 없으면 집합 기반 조회+갱신/삽입을 사용하므로
+    행마다 SELECT 하지 않고 청크당 몇 개의 문장으로 처리됩니다.
+    
+    :param db: SQLAlchemy 세션 객체
+    :param model_name: 대상 모델의 이름
+    :param data: 업데이트/삽입할 데이터 리스트 (모델에 없는 키는 무시)
+    :param chunk_size: 한 번에 처리할 행 수
+    :param commit: True면 처리 후 커밋
+    :return: 처리한 행 수
+    """
+    if model_name not in MODEL_MAP:
+        raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
+
+    count = 0
+    for start in range(0, len(data), chunk_size):
+        rows = _prepare_keyed_rows(model_name, data[start:start + chunk_size])
+        _upsert_rows(db, model_name, rows)
+        count += len(rows)
+
+    if commit:
+        db.commit()
+    return count
+
+
 def update_or_insert_data(db: Session, model_name: str, data: list[dict]):
     """
     데이터를 업데이트하거나 삽입합니다 (Upsert).
     기존 데이터가 있으면 업데이트하고, 없으면 새로 삽입합니다.
+    기존 데이터 여부는 자연키(NATURAL_KEYS) 기준으로 판단합니다.
     
     :param db: SQLAlchemy 세션 객체
     :param model_name: 대상 모델의 이름
     :param data: 업데이트/삽입할 데이터 리스트
     """
+    upsert_data(db, model_name, data)
+
+
+def _hash(values: list) -> str:
+    """값 목록의 안정적인 해시(128비트 hex)를 만듭니다."""
+    encoded = json.dumps(values, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def ingest_incremental(db: Session, model_name: str, data: list[dict],
+                       chunk_size: int = BULK_INSERT_CHUNK_SIZE, commit: bool = True) -> dict:
+    """
+    변경 감지 기반 증분 적재.
+    레코드마다 컬럼 값의 해시(fingerprint)를 계산해 record_fingerprint 인덱스와 비교하고,
+    새로 들어왔거나 내용이 바뀐 레코드만 업서트합니다. 변하지 않은 레코드는 쓰지 않습니다.
+    지문은 내용이 바뀔 수 있는 참조/돌발상황 테이블에만 저장하고, 이력 테이블(HISTORY_TIME_COLUMNS)은
+    (키, 수집 시각)마다 한 번 들어오는 스냅샷이므로 자연키 유니크 인덱스로 이미 있는 행만 건너뜁니다.
+    (이력마다 지문 행을 하나씩 더 쓰면 쓰기가 두 배가 되고, 보관 기간이 지나 삭제된 이력의 지문이 계속 남음)
+    
+    :param db: SQLAlchemy 세션 객체
+    :param model_name: 대상 모델의 이름
+    :param data: 적재할 데이터 리스트
+    :param chunk_size: 한 번에 처리할 행 수
+    :param commit: True면 처리 후 커밋
+    :return: {"inserted": 신규 건수, "updated": 변경 건수, "unchanged": 변경 없음 건수}
+    """
     if model_name not in MODEL_MAP:
         raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
 
+    if model_name in HISTORY_TIME_COLUMNS:
+        inserted = bulk_insert_data(db, model_name, data, chunk_size, commit=commit)
+        return {"inserted": inserted, "updated": 0, "unchanged": len(data) - inserted}
+
     model = MODEL_MAP[model_name]
-    primary_key_col = list(model.__table__.primary_key.columns)[0]
-    
-    for item in data:
-        # Primary key 값으로 기존 레코드 찾기
-        pk_value = item.get(primary_key_col.name)
-        if pk_value:
-            existing_record = db.query(model).filter(primary_key_col == pk_value).first()
-            
-            if existing_record:
-                # 기존 레코드 업데이트
-                for key, value in item.items():
-                    setattr(existing_record, key, value)
-            else:
-                # 새 레코드 삽입
-                db.add(model(**item))
-        else:
-            # Primary key가 없으면 새 레코드 삽입
-            db.add(model(**item))
+    key_columns = NATURAL_KEYS[model_name]
+    value_columns = sorted(column for column in model.__table__.columns.keys() if column != "id")
+    fingerprint_table = RecordFingerprint.__table__
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+
+    for start in range(0, len(data), chunk_size):
+        rows = _prepare_keyed_rows(model_name, data[start:start + chunk_size])
+        if not rows:
+            continue
+
+        keyed, changed, fingerprints = {}, [], []
+        for row in rows:
+            key = [row[column] for column in key_columns]
+            if None in key:
+                # 자연키가 없는 레코드는 추적할 수 없으므로 항상 새 레코드로 취급
+                changed.append(row)
+                counts["inserted"] += 1
+                continue
+            keyed[_hash(key)] = (row, _hash([row.get(column) for column in value_columns]))
+
+        known = dict(db.execute(
+            select(fingerprint_table.c.recordKey, fingerprint_table.c.fingerprint).where(
+                fingerprint_table.c.modelName == model_name,
+                fingerprint_table.c.recordKey.in_(list(keyed))
+            )
+        ).all()) if keyed else {}
+
+        for record_key, (row, fingerprint) in keyed.items():
+            previous = known.get(record_key)
+            if previous == fingerprint:
+                counts["unchanged"] += 1
+                continue
+            counts["inserted" if previous is None else "updated"] += 1
+            changed.append(row)
+            fingerprints.append({"modelName": model_name, "recordKey": record_key, "fingerprint": fingerprint})
+
+        _upsert_rows(db, model_name, changed)
+        if fingerprints:
+            _native_upsert(db, fingerprint_table, fingerprints, ("modelName", "recordKey"))
+
+    if commit:
+        db.commit()
+    return counts
+
+
+def _newer_wins_upsert(db: Session, table, rows: list[dict], time_column: str):
+    """
+    기본키 기준 업서트하되, 들어온 행의 시각이 저장된 시각보다 같거나 새로울 때만 덮어씁니다.
+    늦게 도착한 과거 데이터가 최신 상태를 되돌리지 않습니다.
+    """
+    dialect = db.get_bind().dialect.name
+    key_columns = [column.name for column in table.primary_key.columns]
+    update_columns = [column for column in rows[0] if column not in key_columns]
+
+    if dialect == "mysql":
+        stmt = mysql.insert(table)
+        newer = or_(table.c[time_column].is_(None), stmt.inserted[time_column] >= table.c[time_column])
+        # MySQL은 갱신을 왼쪽부터 적용하므로 비교 기준인 시각 컬럼을 마지막에 갱신
+        ordered = [column for column in update_columns if column != time_column] + [time_column]
+        stmt = stmt.on_duplicate_key_update([
+            (column, case((newer, stmt.inserted[column]), else_=table.c[column])) for column in ordered
+        ])
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column: stmt.excluded[column] for column in update_columns},
+            where=or_(table.c[time_column].is_(None), stmt.excluded[time_column] >= table.c[time_column])
+        )
+    else:
+        raise ValueError(f"업서트를 지원하지 않는 데이터베이스입니다: {dialect}")
+
+    db.execute(stmt, rows)
+
+
+def update_current_state(db: Session, model_name: str, data: list[dict]) -> int:
+    """
+    이력 데이터로 최신 상태 테이블(CURRENT_STATE_MODELS)을 커밋 없이 갱신합니다.
+    배치 안에서 키별로 가장 최근 행만 골라 집합 기반 업서트 한 번으로 씁니다.
+
+    :param db: SQLAlchemy 세션 객체
+    :param model_name: 이력 모델 이름
+    :param data: 변환된 이력 데이터 리스트
+    :return: 최신 상태 테이블에 반영을 시도한 키 수
+    """
+    current_model = CURRENT_STATE_MODELS.get(model_name)
+    if current_model is None or not data:
+        return 0
+    table = current_model.__table__
+    key_columns = [column.name for column in table.primary_key.columns if column.name != "modelName"]
+    time_column = HISTORY_TIME_COLUMNS[model_name]
+
+    latest = {}
+    for row in _clean_rows(current_model, data):
+        key, collected = tuple(row.get(column) for column in key_columns), row.get(time_column)
+        if None in key or collected is None:
+            continue
+        if key not in latest or collected >= latest[key][time_column]:
+            latest[key] = row
+
+    rows = list(latest.values())
+    if "modelName" in table.c:
+        rows = [{**row, "modelName": model_name} for row in rows]
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        _newer_wins_upsert(db, table, rows[start:start + BULK_INSERT_CHUNK_SIZE], time_column)
+    return len(rows)
+
+
+def rollup_base_bucket(value: datetime) -> datetime:
+    """시각이 속한 가장 작은 집계 버킷(5분)의 시작 시각"""
+    return value.replace(minute=value.minute - value.minute % ROLLUP_BASE_MINUTES, second=0, microsecond=0)
+
+
+def mark_rollup_dirty(db: Session, model_name: str, data: list[dict]) -> int:
+    """
+    적재한 행이 속한 링크/도로별 5분 버킷을 다시 집계 대상(rollup_dirty)으로 커밋 없이 표시합니다.
+    집계는 database.rollup.refresh_rollups가 커밋된 원본으로 다시 계산하므로 늦게 도착하거나 다시 수집된 데이터도 중복 없이 반영됩니다.
+
+    :return: 표시한 버킷 수
+    """
+    if model_name not in ROLLUP_MODELS:
+        return 0
+    marked_at = time.time_ns()
+    buckets = {
+        (scope, row[column], rollup_base_bucket(row["collDate"]))
+        for row in data if row.get("collDate") is not None
+        for scope, column in ROLLUP_SCOPES.items() if row.get(column) is not None
+    }
+    rows = [
+        {"modelName": model_name, "scope": scope, "scopeId": scope_id, "bucketStart": bucket, "markedAt": marked_at}
+        for scope, scope_id, bucket in buckets
+    ]
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        _native_upsert(db, RollupDirty.__table__, rows[start:start + BULK_INSERT_CHUNK_SIZE],
+                       ("modelName", "scope", "scopeId", "bucketStart"))
+    return len(rows)
+
+
+def ensure_reference_rows(db: Session, model_name: str, data: list[dict]) -> int:
+    """
+    교통 정보 수집 행에 들어 있는 도로 이름/링크 속성을 참조 테이블(road_info_list, road_link_info_list)에
+    없을 때만 커밋 없이 추가합니다. 이미 있는 참조 행은 전용 수집 API 값을 유지하도록 덮어쓰지 않습니다.
+
+    :param data: 변환 전 수집 데이터 리스트 (이력 모델로 변환하면 이름 컬럼이 빠지므로 변환 전에 호출)
+    :return: 새로 추가한 참조 행 수
+    """
+    if model_name not in REFERENCE_SOURCE_MODELS:
+        return 0
+    added = 0
+    for reference_name, columns in REFERENCE_COLUMNS.items():
+        key = columns[0]
+        candidates = {row[key]: {column: row.get(column) for column in columns} for row in data if row.get(key)}
+        if not candidates:
+            continue
+        table = MODEL_MAP[reference_name].__table__
+        existing = set(db.execute(select(table.c[key]).where(table.c[key].in_(list(candidates)))).scalars())
+        missing = [row for value, row in candidates.items() if value not in existing]
+        if missing:
+            # 동시에 다른 적재가 같은 키를 넣었을 수 있으므로 중복은 건너뜀
+            added += _insert_ignore(db, table, convert_records(reference_name, missing), (key,))
+    return added
+
+
+def get_route_names(db: Session, route_ids) -> dict[str, str]:
+    """도로 ID 목록에 해당하는 도로 이름을 road_info_list에서 한 번에 조회합니다."""
+    route_ids = [route_id for route_id in set(route_ids) if route_id]
+    if not route_ids:
+        return {}
+    return dict(db.execute(
+        select(RoadInfoList.routeId, RoadInfoList.routeNm).where(RoadInfoList.routeId.in_(route_ids))
+    ).all())
+
+
+def get_link_attributes(db: Session, link_ids) -> dict[str, dict]:
+    """링크 ID 목록에 해당하는 도로 방향/순서와 시작/끝 노드를 road_link_info_list에서 한 번에 조회합니다."""
+    link_ids = [link_id for link_id in set(link_ids) if link_id]
+    if not link_ids:
+        return {}
+    table = getRoadLinkInfoList.__table__
+    rows = db.execute(
+        select(table.c.linkId, *(table.c[column] for column in LINK_ATTRIBUTE_COLUMNS)).where(table.c.linkId.in_(link_ids))
+    )
+    return {row[0]: dict(zip(LINK_ATTRIBUTE_COLUMNS, row[1:])) for row in rows}
+
+
+def ingest_data(db: Session, model_name: str, data: list[dict], mode: str = "incremental") -> dict:
+    """
+    수집한 데이터를 적재 방식(mode)에 맞게 저장합니다.
     
+    :param db: SQLAlchemy 세션 객체
+    :param model_name: 대상 모델의 이름
+    :param data: 적재할 데이터 리스트
+    :param mode: "incremental"(변경분만 업서트) 또는 "append"(추가, 자연키가 이미 있는 행은 건너뜀)
+                 - 이력 테이블은 두 방식 모두 이미 있는 스냅샷을 건너뜀
+    :return: {"inserted": 신규 건수, "updated": 변경 건수, "unchanged": 변경 없음 건수}
+    """
+    # 도로 이름/링크 속성은 이력에 저장하지 않고 참조 테이블에 없을 때만 추가
+    ensure_reference_rows(db, model_name, data)
+    # 태그 -> 컬럼 매핑, 빈 값/숫자/소수/날짜 변환을 묶음 단위로 한 번에 수행
+    data = convert_records(model_name, data)
+    time_column = HISTORY_TIME_COLUMNS.get(model_name)
+    if time_column:
+        # 이력 테이블은 수집 시각으로 파티셔닝/보관 기간 관리를 하므로 시각이 없는 행은 저장하지 않음
+        timed = [row for row in data if row.get(time_column) is not None]
+        if len(timed) != len(data):
+            logger.warning("%s: %s가 없는 레코드 %d개를 건너뜁니다", model_name, time_column, len(data) - len(timed))
+        data = timed
+    if mode == "incremental":
+        counts = ingest_incremental(db, model_name, data, commit=False)
+    elif mode == "append":
+        inserted = bulk_insert_data(db, model_name, data, commit=False)
+        counts = {"inserted": inserted, "updated": 0, "unchanged": len(data) - inserted}
+    else:
+        raise ValueError(f"지원하지 않는 적재 방식입니다: {mode}")
+    # 최신 상태 테이블과 집계 대상 표시는 이력과 같은 트랜잭션에서 갱신하여 둘이 어긋나지 않게 함
+    update_current_state(db, model_name, data)
+    mark_rollup_dirty(db, model_name, data)
     db.commit()
+    return counts
 
 
 # 특정 모델에 대한 전용 함수들
@@ -170,5 +647,158 @@ def get_available_parking_spaces(db: Session, min_spaces: int = 1) -> list[getPa
 
 
 def get_active_incidents(db: Session) -> list[getIncidentInfo]:
-    """진행 중인 돌발상황을 조회합니다."""
-    return db.query(getIncidentInfo).filter(getIncidentInfo.endDate.is_(None)).all()
\ No newline at end of file
+    """진행 중인 돌발상황(종료 시각이 없거나 아직 지나지 않은 것)을 조회합니다."""
+    return db.query(getIncidentInfo).filter(
+        (getIncidentInfo.endDate.is_(None)) | (getIncidentInfo.endDate > datetime.now())
+    ).all()
+
+
+@dataclass
+class Page:
+    """목록 조회 한 페이지"""
+    items: list[object]
+    total_count: int | None  # count_mode가 none이면 None
+    count_mode: str  # total_count를 만든 방식 (exact / approx / none)
+    has_more: bool  # 다음 페이지가 있는지 (건수와 무관하게 한 건 더 읽어서 확인)
+    next_cursor: str | None = None  # 커서 방식의 다음 페이지 커서
+
+
+def _paginate(db: Session, stmt, page: int, page_size: int, *, cursor: str | None = None,
+              use_cursor: bool = False, sort_key: str | None = None, count_mode: CountMode = "exact") -> Page:
+    """
+    조건이 적용된 SELECT 문을 페이지네이션합니다.
+    offset 방식은 기본키 순, 커서 방식은 (정렬 키, 기본키) 순으로 커서 다음 위치부터 조회합니다.
+
+    :param cursor: 이전 페이지의 next_cursor (use_cursor일 때, None이면 첫 페이지)
+    :param sort_key: 커서 방식의 정렬 키 컬럼 이름 (인덱스 뒤쪽 컬럼이어야 필터와 함께 범위 조회가 됨, None이면 기본키 순)
+    :param count_mode: 전체 건수 계산 방식 (exact: 캐시된 COUNT, approx: 통계 추정치, none: 세지 않음)
+    """
+    if use_cursor or cursor:
+        stmt, columns = keyset_query(stmt, sort_key)
+        data, next_cursor = cursor_page(db, stmt, columns, cursor, page_size)
+        has_more = next_cursor is not None
+    else:
+        entity = stmt.column_descriptions[0]["entity"]
+        rows = db.execute(
+            stmt.order_by(*entity.__mapper__.primary_key).offset((page - 1) * page_size).limit(page_size + 1)
+        ).scalars().all()
+        data, next_cursor, has_more = rows[:page_size], None, len(rows) > page_size
+    total_count, count_mode = count_rows(db, stmt, count_mode)
+    return Page(data, total_count, count_mode, has_more, next_cursor)
+
+
+def _paginate_request(db: Session, stmt, request: PaginationRequest, sort_key: str | None = None) -> Page:
+    """요청 스키마의 페이지 번호/크기/커서/건수 방식으로 _paginate를 호출합니다."""
+    return _paginate(db, stmt, request.page, request.page_size, cursor=request.cursor,
+                     use_cursor=request.uses_cursor, sort_key=sort_key, count_mode=request.count)
+
+
+def road_traffic_query(request: RoadTrafficInfoPageRequest | None = None, *,
+                       model_name: str = "getRoadTrafficInfoList", **filters) -> Select:
+    """
+    도로 교통 정보 조회 조건을 SELECT 문으로 만듭니다 (조건은 RoadTrafficInfoPageRequest의 필터 표시 참고).
+    속도/혼잡 등급은 숫자 비교, 수집 시각은 DATETIME 범위 비교로 DB에서 처리됩니다.
+    
+    :param request: 조회 조건 (없으면 filters로 만듦, 예: route_id="...", start_time=...)
+    :param model_name: 조회할 교통 이력 모델 (request.source가 "current"면 그 모델의 최신 상태 테이블)
+    """
+    request = request or RoadTrafficInfoPageRequest(**filters)
+    if request.source == "history":
+        return filtered_query(MODEL_MAP[model_name], request)
+    model = CURRENT_STATE_MODELS[model_name]
+    stmt = filtered_query(model, request)
+    # 여러 이력 모델이 함께 쓰는 최신 상태 테이블은 이 모델에서 온 행만
+    return stmt.where(model.modelName == model_name) if "modelName" in model.__table__.c else stmt
+
+
+def get_road_traffic_page(db: Session, request: RoadTrafficInfoPageRequest) -> Page:
+    """도로 교통 정보를 DB에서 필터링하여 페이지 단위로 조회합니다."""
+    # 이력은 수집 시각 순 (도로/링크 + 수집 시각 인덱스, 조건이 없으면 수집 시각 인덱스), 최신 상태는 링크 ID 순
+    sort_key = "collDate" if request.source == "history" else None
+    return _paginate_request(db, road_traffic_query(request), request, sort_key)
+
+
+def parking_availability_query(request: ParkingAvailabilityPageRequest | None = None, **filters) -> Select:
+    """
+    주차장 이용가능 정보 조회 조건을 SELECT 문으로 만듭니다 (조건은 ParkingAvailabilityPageRequest의 필터 표시 참고).
+    가용 주차구획 수는 정수 비교, 제공 시각(ocrnDt)은 DATETIME 범위 비교로 DB에서 처리됩니다.
+
+    :param request: 조회 조건 (없으면 filters로 만듦, 예: pkplc_id="...", since=...)
+    """
+    request = request or ParkingAvailabilityPageRequest(**filters)
+    model = ParkingAvailabilityCurrent if request.source == "current" else getParkingPlaceAvailabilityInfoList
+    return filtered_query(model, request)
+
+
+def get_parking_availability_page(db: Session, request: ParkingAvailabilityPageRequest) -> Page:
+    """주차장 이용가능 정보를 DB에서 필터링하여 페이지 단위로 조회합니다."""
+    sort_key = "ocrnDt" if request.source == "history" else None
+    return _paginate_request(db, parking_availability_query(request), request, sort_key)
+
+
+def incident_query(request: IncidentInfoPageRequest | None = None, **filters) -> Select:
+    """
+    돌발상황 정보 조회 조건을 SELECT 문으로 만듭니다 (조건은 IncidentInfoPageRequest의 필터 표시 참고).
+    진행 여부는 종료 시각(endDate), 기간은 시작 시각(startDate)의 DATETIME 비교로 처리됩니다.
+
+    :param request: 조회 조건 (없으면 filters로 만듦, 예: is_active=True)
+    """
+    return filtered_query(getIncidentInfo, request or IncidentInfoPageRequest(**filters))
+
+
+def get_incident_page(db: Session, request: IncidentInfoPageRequest) -> Page:
+    """돌발상황 정보를 DB에서 필터링하여 페이지 단위로 조회합니다."""
+    return _paginate_request(db, incident_query(request), request)
+
+
+def get_road_info_page(db: Session, request: RoadInfoPageRequest) -> Page:
+    """도로 정보를 DB에서 필터링하여 페이지 단위로 조회합니다."""
+    return _paginate_request(db, filtered_query(RoadInfoList, request), request)
+
+
+def get_parking_info_page(db: Session, request: ParkingPlaceInfoPageRequest) -> Page:
+    """주차장 정보를 DB에서 필터링하여 페이지 단위로 조회합니다."""
+    return _paginate_request(db, filtered_query(getParkingPlaceInfoList, request), request)
+
+
+def get_distinct_values(db: Session, model_name: str, column: str) -> list:
+    """특정 모델 컬럼의 중복 없는 값 목록을 조회합니다 (NULL 제외)."""
+    if model_name not in MODEL_MAP:
+        raise ValueError(f"지원하지 않는 모델 이름입니다: {model_name}")
+
+    col = MODEL_MAP[model_name].__table__.c[column]
+    return list(db.execute(select(col).where(col.is_not(None)).distinct().order_by(col)).scalars())
+
+
+def get_crawl_progress(db: Session, endpoint: str) -> tuple[str | None, set[str]]:
+    """
+    크롤링의 마지막 실행 ID와 그 실행에서 완료된 파라미터 값들을 조회합니다.
+    
+    :return: (마지막 실행 ID, 완료된 파라미터 값 집합) 튜플
+    """
+    run_id = db.execute(
+        select(func.max(CrawlCheckpoint.runId)).where(CrawlCheckpoint.endpoint == endpoint)
+    ).scalar()
+    if run_id is None:
+        return None, set()
+    done = db.execute(
+        select(CrawlCheckpoint.paramValue).where(
+            CrawlCheckpoint.endpoint == endpoint,
+            CrawlCheckpoint.runId == run_id,
+            CrawlCheckpoint.status == "done"
+        )
+    ).scalars()
+    return run_id, set(done)
+
+
+def save_crawl_checkpoint(db: Session, endpoint: str, run_id: str, param_value: str, status: str, row_count: int = 0):
+    """크롤링 파라미터 하나의 처리 결과를 기록합니다."""
+    _native_upsert(db, CrawlCheckpoint.__table__, [{
+        "endpoint": endpoint,
+        "paramValue": str(param_value),
+        "runId": run_id,
+        "status": status,
+        "rowCount": row_count,
+        "updatedAt": datetime.now()
+    }], ("endpoint", "paramValue"))
+    db.commit()
@@ -0,0 +1,277 @@
+"""
+링크/도로별 교통 정보 집계 (5분, 1시간, 1일 단위) - src 디렉터리에서 실행.
+
+    python -m database.rollup refresh                       # 적재 후 표시된 버킷을 다시 집계
+    python -m database.rollup rebuild [--since 2025-08-01]   # 쌓인 이력 전체(또는 지정 시각 이후)를 다시 집계
+
+적재(ingest_data)는 새로 들어온 행이 속한 5분 버킷만 rollup_dirty에 표시하고,
+refresh_rollups가 커밋된 원본 행으로 5분 버킷을 다시 계산한 뒤 5분 -> 1시간 -> 1일 순으로 상위 버킷을 다시 합칩니다.
+버킷을 매번 원본에서 다시 계산하므로 늦게 도착한 데이터나 재수집된 데이터를 여러 번 반영해도 결과가 같습니다.
+갱신은 스케줄러(rollup-refresh 작업)가 실행하고, 스케줄러가 꺼져 있으면 API 서버가 적재가 끝날 때마다 실행합니다
+(POST /collect/rollups/refresh 또는 위 refresh 명령으로 직접 실행할 수도 있음).
+평균은 합계/개수로 저장하여 조회 시 계산합니다.
+"""
+import argparse
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from database.connection import engine, create_tables
+from database.orm import TrafficRollup, RollupDirty
+from database.repository import (MODEL_MAP, ROLLUP_MODELS, ROLLUP_SCOPES, ROLLUP_BASE_MINUTES, BULK_INSERT_CHUNK_SIZE,
+                                 rollup_base_bucket, mark_rollup_dirty, _native_upsert, _paginate, Page)
+
+
+logger = logging.getLogger(__name__)
+
+# 집계 단위와 버킷 길이 (앞 단위의 버킷을 합쳐 다음 단위를 만듦)
+GRAINS = {
+    "5m": timedelta(minutes=ROLLUP_BASE_MINUTES),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1)
+}
+# 집계 갱신 작업 실행 간격 (초, 0이면 스케줄러에 등록하지 않음)
+ROLLUP_REFRESH_INTERVAL = float(os.getenv("ROLLUP_REFRESH_INTERVAL", "60"))
+# 한 번에 처리할 표시된 버킷 수 (한 트랜잭션 단위)
+ROLLUP_REFRESH_BATCH = int(os.getenv("ROLLUP_REFRESH_BATCH", "5000"))
+
+# 같은 프로세스 안에서 갱신이 겹쳐 실행되지 않도록 함
+_refresh_lock = threading.Lock()
+
+ROLLUP_KEY = ("modelName", "grain", "scope", "scopeId", "bucketStart")
+SUM_COLUMNS = ("sampleCount", "spdCount", "spdSum", "volSum", "trvlTimeCount", "trvlTimeSum",
+               "congGrade0", "congGrade1", "congGrade2", "congGrade3")
+
+
+def bucket_start(value: datetime, grain: str) -> datetime:
+    """시각이 속한 집계 버킷의 시작 시각"""
+    if grain == "5m":
+        return rollup_base_bucket(value)
+    if grain == "1h":
+        return value.replace(minute=0, second=0, microsecond=0)
+    if grain == "1d":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"지원하지 않는 집계 단위입니다: {grain}")
+
+
+def _empty() -> dict:
+    return {**{column: 0 for column in SUM_COLUMNS}, "spdMin": None, "spdMax": None}
+
+
+def _add_sample(aggregate: dict, row) -> None:
+    """원본 이력 행 하나를 집계에 더합니다."""
+    aggregate["sampleCount"] += 1
+    spd = row.get("spd")
+    if spd is not None:
+        aggregate["spdCount"] += 1
+        aggregate["spdSum"] += spd
+        aggregate["spdMin"] = spd if aggregate["spdMin"] is None else min(aggregate["spdMin"], spd)
+        aggregate["spdMax"] = spd if aggregate["spdMax"] is None else max(aggregate["spdMax"], spd)
+    aggregate["volSum"] += row.get("vol") or 0
+    if row.get("trvlTime") is not None:
+        aggregate["trvlTimeCount"] += 1
+        aggregate["trvlTimeSum"] += row["trvlTime"]
+    if row.get("congGrade") in (0, 1, 2, 3):
+        aggregate[f"congGrade{row['congGrade']}"] += 1
+
+
+def _merge(aggregate: dict, part) -> None:
+    """하위 단위 버킷 하나를 집계에 합칩니다."""
+    for column in SUM_COLUMNS:
+        aggregate[column] += part[column]
+    for column, pick in (("spdMin", min), ("spdMax", max)):
+        if part[column] is not None:
+            aggregate[column] = part[column] if aggregate[column] is None else pick(aggregate[column], part[column])
+
+
+def _aggregate_base(db: Session, model_name: str, scope: str, start: datetime, scope_ids: list[str]) -> dict[str, dict]:
+    """5분 버킷 하나를 원본 이력 행으로 다시 계산합니다 (링크/도로 + 수집 시각 인덱스 사용)."""
+    model = MODEL_MAP[model_name]
+    key = getattr(model, ROLLUP_SCOPES[scope])
+    columns = [key.label("scopeId")] + [
+        getattr(model, name) for name in ("spd", "vol", "trvlTime", "congGrade") if hasattr(model, name)
+    ]
+    aggregates = {scope_id: _empty() for scope_id in scope_ids}
+    rows = db.execute(select(*columns).where(
+        key.in_(scope_ids), model.collDate >= start, model.collDate < start + GRAINS["5m"]
+    )).mappings()
+    for row in rows:
+        _add_sample(aggregates[row["scopeId"]], row)
+    return aggregates
+
+
+def _aggregate_children(db: Session, model_name: str, scope: str, grain: str, child_grain: str,
+                        start: datetime, scope_ids: list[str]) -> dict[str, dict]:
+    """상위 단위 버킷 하나를 하위 단위 버킷들을 합쳐 다시 계산합니다."""
+    table = TrafficRollup.__table__
+    aggregates = {scope_id: _empty() for scope_id in scope_ids}
+    rows = db.execute(select(table).where(
+        table.c.modelName == model_name, table.c.grain == child_grain, table.c.scope == scope,
+        table.c.scopeId.in_(scope_ids),
+        table.c.bucketStart >= start, table.c.bucketStart < start + GRAINS[grain]
+    )).mappings()
+    for row in rows:
+        _merge(aggregates[row["scopeId"]], row)
+    return aggregates
+
+
+def _write_buckets(db: Session, model_name: str, scope: str, grain: str, start: datetime, aggregates: dict[str, dict]):
+    """다시 계산한 버킷을 덮어쓰고, 원본이 사라져 비게 된 버킷은 삭제합니다."""
+    table = TrafficRollup.__table__
+    key = {"modelName": model_name, "grain": grain, "scope": scope, "bucketStart": start}
+    rows = [{**key, "scopeId": scope_id, **aggregate} for scope_id, aggregate in aggregates.items() if aggregate["sampleCount"]]
+    empty = [scope_id for scope_id, aggregate in aggregates.items() if not aggregate["sampleCount"]]
+    for offset in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        _native_upsert(db, table, rows[offset:offset + BULK_INSERT_CHUNK_SIZE], ROLLUP_KEY)
+    if empty:
+        db.execute(delete(table).where(
+            *(table.c[column] == value for column, value in key.items()), table.c.scopeId.in_(empty)
+        ))
+
+
+def refresh_rollups(bind: Engine = engine, batch_size: int = ROLLUP_REFRESH_BATCH) -> dict:
+    """
+    rollup_dirty에 표시된 5분 버킷과 그 상위 1시간/1일 버킷을 다시 집계합니다.
+    한 프로세스 안에서는 잠금으로 하나씩 실행합니다. 여러 프로세스에서 동시에 실행해도 버킷을 원본에서 다시 계산하고
+    처리 중 다시 표시된 버킷은 남겨 두므로 결과는 같지만, 같은 버킷을 중복으로 계산하게 됩니다.
+
+    :param bind: 대상 엔진
+    :param batch_size: 한 트랜잭션에서 처리할 표시된 버킷 수
+    :return: {"buckets": 다시 집계한 버킷 수 (단위별), "rounds": 트랜잭션 수}
+    """
+    dirty_table = RollupDirty.__table__
+    # 실행 중에 새로 표시된 버킷은 다음 실행에서 처리 (적재가 계속되어도 끝나도록)
+    started = time.time_ns()
+    totals = {"buckets": {grain: 0 for grain in GRAINS}, "rounds": 0}
+
+    while True:
+        with _refresh_lock, Session(bind) as db:
+            dirty = db.execute(
+                select(dirty_table).where(dirty_table.c.markedAt <= started).limit(batch_size)
+            ).mappings().all()
+            if not dirty:
+                break
+
+            pending: dict[tuple, set[str]] = {}
+            for row in dirty:
+                pending.setdefault((row["modelName"], row["scope"], row["bucketStart"]), set()).add(row["scopeId"])
+
+            grains = list(GRAINS)
+            for level, grain in enumerate(grains):
+                for (model_name, scope, start), scope_ids in pending.items():
+                    ids = sorted(scope_ids)
+                    if level == 0:
+                        aggregates = _aggregate_base(db, model_name, scope, start, ids)
+                    else:
+                        aggregates = _aggregate_children(db, model_name, scope, grain, grains[level - 1], start, ids)
+                    _write_buckets(db, model_name, scope, grain, start, aggregates)
+                    totals["buckets"][grain] += len(ids)
+                if level + 1 < len(grains):
+                    # 다음 단위에서 다시 합칠 상위 버킷
+                    parents: dict[tuple, set[str]] = {}
+                    for (model_name, scope, start), scope_ids in pending.items():
+                        parents.setdefault((model_name, scope, bucket_start(start, grains[level + 1])), set()).update(scope_ids)
+                    pending = parents
+
+            # 처리하는 동안 다시 표시된 버킷(markedAt이 바뀜)은 남겨 둠
+            db.execute(delete(dirty_table).where(
+                dirty_table.c.modelName == bindparam("m"), dirty_table.c.scope == bindparam("s"),
+                dirty_table.c.scopeId == bindparam("i"), dirty_table.c.bucketStart == bindparam("b"),
+                dirty_table.c.markedAt <= bindparam("t")
+            ), [
+                {"m": row["modelName"], "s": row["scope"], "i": row["scopeId"], "b": row["bucketStart"], "t": row["markedAt"]}
+                for row in dirty
+            ])
+            db.commit()
+        totals["rounds"] += 1
+
+    if totals["rounds"]:
+        logger.info("교통 집계 갱신: %s", totals)
+    return totals
+
+
+def rebuild_rollups(since: datetime | None = None, chunk_size: int = BULK_INSERT_CHUNK_SIZE, bind: Engine = engine) -> dict:
+    """쌓인 이력(또는 since 이후)을 모두 다시 집계 대상으로 표시한 뒤 집계합니다."""
+    create_tables()
+    for model_name in ROLLUP_MODELS:
+        table = MODEL_MAP[model_name].__table__
+        last_id = 0
+        with Session(bind) as db:
+            while True:
+                stmt = select(table.c.id, table.c.linkId, table.c.routeId, table.c.collDate).where(table.c.id > last_id)
+                if since:
+                    stmt = stmt.where(table.c.collDate >= since)
+                rows = [dict(row) for row in db.execute(stmt.order_by(table.c.id).limit(chunk_size)).mappings()]
+                if not rows:
+                    break
+                mark_rollup_dirty(db, model_name, rows)
+                db.commit()
+                last_id = rows[-1]["id"]
+    return refresh_rollups(bind)
+
+
+def rollup_query(*, model_name: str = "getRoadLinkTrafficInfoList", grain: str = "1h", scope: str = "route",
+                 scope_id: str | None = None, start_time: datetime | None = None, end_time: datetime | None = None) -> Select:
+    """
+    교통 집계 조회 조건을 SELECT 문으로 만듭니다 (기본키 순서 그대로라 인덱스 범위 조회).
+
+    :param start_time: 버킷 시작 시각 하한 (포함)
+    :param end_time: 버킷 시작 시각 상한 (미포함)
+    """
+    model = TrafficRollup
+    stmt = select(model).where(model.modelName == model_name, model.grain == grain, model.scope == scope)
+    if scope_id:
+        stmt = stmt.where(model.scopeId == scope_id)
+    if start_time:
+        stmt = stmt.where(model.bucketStart >= start_time)
+    if end_time:
+        stmt = stmt.where(model.bucketStart < end_time)
+    return stmt
+
+
+def get_rollup_page(db: Session, page: int = 1, page_size: int = 100, cursor: str | None = None,
+                    use_cursor: bool = False, count_mode: str = "exact", **filters) -> Page:
+    """
+    교통 집계를 링크/도로 ID, 버킷 시각 순으로 페이지 단위 조회합니다 (조건은 rollup_query 참고).
+    커서 방식도 같은 기본키 순서라 인덱스에서 이어 읽습니다.
+    """
+    return _paginate(db, rollup_query(**filters), page, page_size, cursor=cursor,
+                     use_cursor=use_cursor, count_mode=count_mode)
+
+
+def summarize(bucket: TrafficRollup) -> dict:
+    """집계 행을 평균/합계/혼잡 등급 분포로 풀어 반환합니다."""
+    return {
+        "scopeId": bucket.scopeId,
+        "bucketStart": bucket.bucketStart,
+        "sampleCount": bucket.sampleCount,
+        "spdAvg": round(bucket.spdSum / bucket.spdCount, 1) if bucket.spdCount else None,
+        "spdMin": bucket.spdMin,
+        "spdMax": bucket.spdMax,
+        "volSum": bucket.volSum,
+        "trvlTimeAvg": round(bucket.trvlTimeSum / bucket.trvlTimeCount, 1) if bucket.trvlTimeCount else None,
+        "congGrades": {str(grade): getattr(bucket, f"congGrade{grade}") for grade in range(4)}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교통 정보 집계 관리")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("refresh", help="적재 후 표시된 버킷 다시 집계")
+    rebuild = commands.add_parser("rebuild", help="쌓인 이력을 모두 다시 집계")
+    rebuild.add_argument("--since", type=datetime.fromisoformat, help="이 시각 이후의 이력만 (예: 2025-08-01)")
+    args = parser.parse_args()
+
+    result = refresh_rollups() if args.command == "refresh" else rebuild_rollups(args.since)
+    print(f"다시 집계한 버킷: {result['buckets']}, 트랜잭션 {result['rounds']}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,27 @@
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from database.filters import Eq, Contains, Min, Max, Before, DateFrom, DateTo, Active, AtLeastOne, RouteName
 
 # 공통 페이지네이션 베이스 클래스
 class PaginationRequest(BaseModel):
     """페이지네이션 공통 요청 파라미터"""
+    # 쿼리 파라미터 별칭(route_id)과 필드 이름(routeId) 둘 다로 만들 수 있음
+    model_config = ConfigDict(populate_by_name=True)
+
     page: int = Field(1, description="페이지 번호 (1부터 시작)", ge=1, le=9999)
     page_size: int = Field(10, description="페이지 크기", ge=1, le=100)
+    # 커서 방식은 이전 응답의 next_cursor 다음부터 조회 (깊은 페이지도 첫 페이지와 비용이 같고, 적재 중에도 행이 밀리지 않음)
+    pagination: Literal["offset", "cursor"] = Field("offset", description="페이지네이션 방식 (offset: page 번호, cursor: next_cursor 이어받기)")
+    cursor: str | None = Field(None, description="이전 응답의 next_cursor (주면 cursor 방식으로 조회, page는 무시)")
+    # 전체 건수 계산 방식 - 이력 테이블의 COUNT(*)는 응답 시간의 대부분을 차지하므로 필요에 맞게 선택
+    count: Literal["exact", "approx", "none"] = Field("exact", description="전체 건수 계산 방식 (exact: 정확한 건수 - 적재 전까지 캐시, approx: 통계 기반 추정치, none: 세지 않고 has_more만)")
+
+    @property
+    def uses_cursor(self) -> bool:
+        return self.pagination == "cursor" or bool(self.cursor)
 
 
 # OpenAPI 요청 스키마들
@@ -69,42 +86,57 @@ class RoadLinkCongestInfoRequest(BaseModel):
     linkId: str | None = Field(None, description="링크 ID (선택)")
 
 
-# 페이지네이션이 필요한 요청들 (OpenAPI + 페이지네이션)
+# 페이지네이션이 필요한 요청들 (/api/* 조회 조건)
+# 필드 이름은 DB 컬럼과 같게, 쿼리 파라미터는 snake_case 별칭으로 받음
+# Annotated의 필터 표시(database.filters)가 붙은 필드는 값이 있으면 SQL WHERE 조건이 됨
+ReadSource = Literal["history", "current"]
+
+
 class RoadInfoPageRequest(PaginationRequest):
     """도로 정보 페이지네이션 요청 스키마"""
-    serviceKey: str = Field(..., description="발급받은 키값")
-    # 필터링 옵션들
-    roadRank: str | None = Field(None, description="도로 등급 필터")
-    routeTp: str | None = Field(None, description="도로 종류 필터")
+    roadRank: Annotated[str | None, Eq("roadRank")] = Field(None, alias="road_rank", description="도로 등급 필터")
+    routeTp: Annotated[str | None, Eq("routeTp")] = Field(None, alias="route_tp", description="도로 종류 필터")
+    routeNm: Annotated[str | None, Contains("routeNm")] = Field(None, alias="route_nm", description="도로명 검색 (부분 일치)")
 
 
 class RoadTrafficInfoPageRequest(PaginationRequest):
     """도로 교통 정보 페이지네이션 요청 스키마"""
-    serviceKey: str = Field(..., description="발급받은 키값")
-    routeId: str | None = Field(None, description="도로 ID 필터")
-    routeNm: str | None = Field(None, description="도로 이름 필터")
-    congGrade: str | None = Field(None, description="혼잡 등급 필터 (0:정보없음, 1:원활, 2:지체, 3:정체)")
-    min_speed: int | None = Field(None, description="최소 속도 필터", ge=0, le=300)
-    max_speed: int | None = Field(None, description="최대 속도 필터", ge=0, le=300)
+    routeId: Annotated[str | None, Eq("routeId")] = Field(None, alias="route_id", description="도로 ID 필터")
+    linkId: Annotated[str | None, Eq("linkId")] = Field(None, alias="link_id", description="링크 ID 필터")
+    routeNm: Annotated[str | None, RouteName()] = Field(None, alias="route_nm", description="도로 이름 필터 (부분 일치)")
+    congGrade: Annotated[int | None, Eq("congGrade")] = Field(None, alias="cong_grade", ge=0, le=3, description="혼잡 등급 필터 (0:정보없음, 1:원활, 2:지체, 3:정체)")
+    min_speed: Annotated[int | None, Min("spd")] = Field(None, description="최소 속도 필터", ge=0, le=300)
+    max_speed: Annotated[int | None, Max("spd")] = Field(None, description="최대 속도 필터", ge=0, le=300)
+    start_time: Annotated[datetime | None, Min("collDate")] = Field(None, description="수집 시각 하한 (예: 2025-08-01T09:00:00)")
+    end_time: Annotated[datetime | None, Before("collDate")] = Field(None, description="수집 시각 상한 (미포함)")
+    source: ReadSource = Field("history", description="조회 대상 (history: 수집 이력 전체, current: 링크별 최신 값만)")
 
 
 class ParkingPlaceInfoPageRequest(PaginationRequest):
     """주차장 정보 페이지네이션 요청 스키마"""
-    serviceKey: str = Field(..., description="발급받은 키값")
-    laeId: str | None = Field(None, description="지방자치단체ID 필터")
-    laeNm: str | None = Field(None, description="지방자치단체명 필터")
-    pkplcNm: str | None = Field(None, description="주차장명 검색 (부분 일치)")
-    pkplcTypeNm: str | None = Field(None, description="주차장 유형 필터")
+    laeId: Annotated[str | None, Eq("laeId")] = Field(None, alias="lae_id", description="지방자치단체ID 필터")
+    laeNm: Annotated[str | None, Contains("laeNm")] = Field(None, alias="lae_nm", description="지방자치단체명 필터 (부분 일치)")
+    pkplcNm: Annotated[str | None, Contains("pkplcNm")] = Field(None, alias="pkplc_nm", description="주차장명 검색 (부분 일치)")
+    pkplcTypeNm: Annotated[str | None, Eq("pkplcTypeNm")] = Field(None, alias="pkplc_type_nm", description="주차장 유형 필터")
 
 
 class IncidentInfoPageRequest(PaginationRequest):
     """돌발상황 정보 페이지네이션 요청 스키마"""
-    serviceKey: str = Field(..., description="발급받은 키값")
-    routeId: str | None = Field(None, description="도로 ID 필터")
-    restrictType: str | None = Field(None, description="제한 유형 필터")
-    is_active: bool | None = Field(None, description="진행중인 돌발상황만 조회")
-    start_date: str | None = Field(None, description="시작 날짜 필터 (YYYY-MM-DD)")
-    end_date: str | None = Field(None, description="종료 날짜 필터 (YYYY-MM-DD)")
-
-
-
+    routeId: Annotated[str | None, Eq("routeId")] = Field(None, alias="route_id", description="도로 ID 필터")
+    restrictType: Annotated[str | None, Eq("restrictType")] = Field(None, alias="restrict_type", description="제한 유형 필터")
+    is_active: Annotated[bool | None, Active("endDate")] = Field(None, description="진행중인 돌발상황만 조회")
+    start_date: Annotated[date | None, DateFrom("startDate")] = Field(None, description="시작 날짜 필터 (YYYY-MM-DD)")
+    end_date: Annotated[date | None, DateTo("startDate")] = Field(None, description="종료 날짜 필터 (YYYY-MM-DD, 해당 날짜 포함)")
+
+
+class ParkingAvailabilityPageRequest(PaginationRequest):
+    """주차장 이용가능 정보 페이지네이션 요청 스키마"""
+    pkplcId: Annotated[str | None, Eq("pkplcId")] = Field(None, alias="pkplc_id", description="주차장 ID 필터")
+    laeId: Annotated[str | None, Eq("laeId")] = Field(None, alias="lae_id", description="지방자치단체ID 필터")
+    pkplcNm: Annotated[str | None, Contains("pkplcNm")] = Field(None, alias="pkplc_nm", description="주차장명 검색 (부분 일치)")
+    min_spaces: Annotated[int | None, Min("avblPklotCnt")] = Field(None, ge=0, description="최소 이용가능 공간 수")
+    max_spaces: Annotated[int | None, Max("avblPklotCnt")] = Field(None, ge=0, description="최대 이용가능 공간 수")
+    only_available: Annotated[bool, AtLeastOne("avblPklotCnt")] = Field(False, description="이용가능한 주차장만 조회")
+    since: Annotated[datetime | None, Min("ocrnDt")] = Field(None, description="제공 시각 하한 (예: 2025-08-01T09:00:00)")
+    until: Annotated[datetime | None, Before("ocrnDt")] = Field(None, description="제공 시각 상한 (미포함)")
+    source: ReadSource = Field("history", description="조회 대상 (history: 수집 이력 전체, current: 주차장별 최신 값만)")
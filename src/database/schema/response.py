@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
+from decimal import Decimal
 
 
 # 공통 베이스 응답 스키마
@@ -25,49 +26,55 @@ class RoadInfoResponse(CommonBaseResponse):
 class RoadLinkInfoResponse(CommonBaseResponse):
     """도로 링크 정보 응답 스키마 - ORM getRoadLinkInfoList와 1:1 매칭"""
     routeWay: str | None = Field(None, description="도로 방향")
-    routeSeq: str | None = Field(None, description="도로 순서")
+    routeSeq: int | None = Field(None, description="도로 순서")
     linkId: str = Field(..., description="링크 ID")
     startNodeId: str | None = Field(None, description="시작 노드 ID")
     startNodeNm: str | None = Field(None, description="시작 노드 이름")
     endNodeId: str | None = Field(None, description="끝 노드 ID")
     endNodeNm: str | None = Field(None, description="끝 노드 이름")
-    linkLength: str | None = Field(None, description="링크 길이")
+    linkLength: Decimal | None = Field(None, description="링크 길이")
 
 
 class RoadTrafficInfoResponse(CommonBaseResponse):
-    """도로 교통 정보 응답 스키마 - ORM getRoadTrafficInfoList와 1:1 매칭"""
+    """
+    도로 교통 정보 응답 스키마 - ORM getRoadTrafficInfoList 컬럼에 참조 테이블 값을 더함
+    (routeNm은 road_info_list, 도로 방향/순서와 시작/끝 노드는 road_link_info_list에서 채우며 참조 행이 없으면 null)
+    """
     routeId: str = Field(..., description="도로 ID")
     routeNm: str | None = Field(None, description="도로 이름")
     routeWay: str | None = Field(None, description="도로 방향")
-    routeSeq: str | None = Field(None, description="도로 순서")
+    routeSeq: int | None = Field(None, description="도로 순서")
     linkId: str | None = Field(None, description="링크 ID")
     startNodeId: str | None = Field(None, description="시작 노드 ID")
     startNodeNm: str | None = Field(None, description="시작 노드 이름")
     endNodeId: str | None = Field(None, description="끝 노드 ID")
     endNodeNm: str | None = Field(None, description="끝 노드 이름")
-    collDate: str | None = Field(None, description="수집 날짜")
-    spd: str | None = Field(None, description="속도", ge=0)
-    vol: str | None = Field(None, description="교통량", ge=0)
-    trvlTime: str | None = Field(None, description="여행 시간", ge=0)
-    linkDelayTime: str | None = Field(None, description="링크 지연 시간", ge=0)
-    congGrade: str | None = Field(None, description="혼잡 등급 (0:정보없음, 1:원활, 2:지체, 3:정체)")
+    collDate: datetime | None = Field(None, description="수집 날짜")
+    spd: int | None = Field(None, description="속도", ge=0)
+    vol: int | None = Field(None, description="교통량", ge=0)
+    trvlTime: int | None = Field(None, description="여행 시간", ge=0)
+    linkDelayTime: int | None = Field(None, description="링크 지연 시간", ge=0)
+    congGrade: int | None = Field(None, description="혼잡 등급 (0:정보없음, 1:원활, 2:지체, 3:정체)")
 
 
 class RoadLinkCongestInfoResponse(CommonBaseResponse):
-    """도로 링크 혼잡 정보 응답 스키마 - ORM getRoadLinkCongestInfo와 1:1 매칭"""
+    """
+    도로 링크 혼잡 정보 응답 스키마 - ORM getRoadLinkCongestInfo 컬럼에 참조 테이블 값을 더함
+    (routeNm은 road_info_list, 도로 방향/순서와 시작/끝 노드는 road_link_info_list에서 채우며 참조 행이 없으면 null)
+    """
     routeId: str = Field(..., description="도로 ID")
     routeNm: str | None = Field(None, description="도로 이름")
     routeWay: str | None = Field(None, description="도로 방향")
-    routeSeq: str | None = Field(None, description="도로 순서")
+    routeSeq: int | None = Field(None, description="도로 순서")
     linkId: str | None = Field(None, description="링크 ID")
     startNodeId: str | None = Field(None, description="시작 노드 ID")
     startNodeNm: str | None = Field(None, description="시작 노드 이름")
     endNodeId: str | None = Field(None, description="끝 노드 ID")
     endNodeNm: str | None = Field(None, description="끝 노드 이름")
-    collDate: str | None = Field(None, description="수집 날짜")
-    spd: str | None = Field(None, description="속도", ge=0)
-    vol: str | None = Field(None, description="교통량", ge=0)
-    trvlTime: str | None = Field(None, description="여행 시간", ge=0)
+    collDate: datetime | None = Field(None, description="수집 날짜")
+    spd: int | None = Field(None, description="속도", ge=0)
+    vol: int | None = Field(None, description="교통량", ge=0)
+    trvlTime: int | None = Field(None, description="여행 시간", ge=0)
 
 
 # 돌발상황 정보 응답 스키마
@@ -77,16 +84,16 @@ class IncidentInfoResponse(CommonBaseResponse):
     linkId: str | None = Field(None, description="표준링크 ID")
     spotId: str | None = Field(None, description="지점 ID")
     regSeq: str | None = Field(None, description="돌발상황 고유번호")
-    confirmDate: str | None = Field(None, description="감지 시간")
-    startDate: str | None = Field(None, description="시작 시간")
-    estEndDate: str | None = Field(None, description="예상 종료 시간")
-    endDate: str | None = Field(None, description="종료 시간")
+    confirmDate: datetime | None = Field(None, description="감지 시간")
+    startDate: datetime | None = Field(None, description="시작 시간")
+    estEndDate: datetime | None = Field(None, description="예상 종료 시간")
+    endDate: datetime | None = Field(None, description="종료 시간")
     restrictType: str | None = Field(None, description="제한 유형")
     inciDesc: str | None = Field(None, description="돌발 상황 설명")
     inciplace1: str | None = Field(None, description="돌발 장소1")
     inciplace2: str | None = Field(None, description="돌발 장소2")
-    coord_x: str | None = Field(None, description="좌표 X")
-    coord_y: str | None = Field(None, description="좌표 Y")
+    coord_x: Decimal | None = Field(None, description="좌표 X")
+    coord_y: Decimal | None = Field(None, description="좌표 Y")
 
 
 # 주차장 정보 연계 지자체ID 응답 스키마
@@ -106,17 +113,17 @@ class ParkingPlaceInfoResponse(CommonBaseResponse):
     pkplcNm: str | None = Field(None, description="주차장명")
     pkplcDivNm: str | None = Field(None, description="주차장 구분")
     pkplcTypeNm: str | None = Field(None, description="주차장 유형")
-    latCrdn: str | None = Field(None, description="위도")
-    lonCrdn: str | None = Field(None, description="경도")
+    latCrdn: Decimal | None = Field(None, description="위도")
+    lonCrdn: Decimal | None = Field(None, description="경도")
     roadNmZip: str | None = Field(None, description="도로명 우편번호")
     roadNmAddr: str | None = Field(None, description="도로명 주소")
     lotnoAddr: str | None = Field(None, description="지번 주소")
-    pklotCnt: str | None = Field(None, description="주차구획 수")
-    sbcmpctPklotCnt: str | None = Field(None, description="경차 주차구획 수")
-    pwdbsPrvusePklotCnt: str | None = Field(None, description="장애인전용 주차구획 수")
-    femalePrfncPklotCnt: str | None = Field(None, description="여성우대 주차구획 수")
-    olmanPrfncPklotCnt: str | None = Field(None, description="노인우대 주차구획 수")
-    evPklotCnt: str | None = Field(None, description="전기차 주차구획 수")
+    pklotCnt: int | None = Field(None, description="주차구획 수")
+    sbcmpctPklotCnt: int | None = Field(None, description="경차 주차구획 수")
+    pwdbsPrvusePklotCnt: int | None = Field(None, description="장애인전용 주차구획 수")
+    femalePrfncPklotCnt: int | None = Field(None, description="여성우대 주차구획 수")
+    olmanPrfncPklotCnt: int | None = Field(None, description="노인우대 주차구획 수")
+    evPklotCnt: int | None = Field(None, description="전기차 주차구획 수")
     lndlvDivNm: str | None = Field(None, description="급지")
     wkdayOprtStartTime: str | None = Field(None, description="평일 운영 시작")
     wkdayOprtEndTime: str | None = Field(None, description="평일 운영 종료")
@@ -124,13 +131,13 @@ class ParkingPlaceInfoResponse(CommonBaseResponse):
     satOprtEndTime: str | None = Field(None, description="토요일 운영 종료")
     hldyOprtStartTime: str | None = Field(None, description="휴일 운영 시작")
     hldyOprtEndTime: str | None = Field(None, description="휴일 운영 종료")
-    parkingBscTime: str | None = Field(None, description="기본 시간")
-    parkingBscFare: str | None = Field(None, description="기본 요금")
-    addUnitTime: str | None = Field(None, description="추가 단위 시간")
-    addUnitFare: str | None = Field(None, description="추가 단위 요금")
-    ddPktckFareAplcnTime: str | None = Field(None, description="일 주차권 적용 시간")
-    ddPktckFare: str | None = Field(None, description="일 주차권 요금")
-    mmCmmtktFare: str | None = Field(None, description="월 정기권 요금")
+    parkingBscTime: int | None = Field(None, description="기본 시간")
+    parkingBscFare: int | None = Field(None, description="기본 요금")
+    addUnitTime: int | None = Field(None, description="추가 단위 시간")
+    addUnitFare: int | None = Field(None, description="추가 단위 요금")
+    ddPktckFareAplcnTime: int | None = Field(None, description="일 주차권 적용 시간")
+    ddPktckFare: int | None = Field(None, description="일 주차권 요금")
+    mmCmmtktFare: int | None = Field(None, description="월 정기권 요금")
 
 
 class ParkingPlaceAvailabilityInfoResponse(CommonBaseResponse):
@@ -139,18 +146,18 @@ class ParkingPlaceAvailabilityInfoResponse(CommonBaseResponse):
     laeNm: str | None = Field(None, description="지방자치단체명")
     pkplcId: str = Field(..., description="주차장ID")
     pkplcNm: str | None = Field(None, description="주차장명")
-    pklotCnt: str | None = Field(None, description="주차구획 수", ge=0)
-    avblPklotCnt: str | None = Field(None, description="가용 주차구획 수", ge=0)
-    ocrnDt: str | None = Field(None, description="제공시간")
+    pklotCnt: int | None = Field(None, description="주차구획 수", ge=0)
+    avblPklotCnt: int | None = Field(None, description="가용 주차구획 수", ge=0)
+    ocrnDt: datetime | None = Field(None, description="제공시간")
 
 
 # 페이지네이션 컨테이너 스키마들 (명확한 네이밍)
 class RoadInfoPageResponse(BaseModel):
     """도로 정보 페이지네이션 응답 컨테이너"""
     items: list[RoadInfoResponse] = Field(default_factory=list, description="도로 정보 목록")
-    total_count: str = Field(0, description="전체 항목 수")
-    page: str = Field(1, description="현재 페이지")
-    page_size: str = Field(10, description="페이지 크기")
+    total_count: int = Field(0, description="전체 항목 수")
+    page: int = Field(1, description="현재 페이지")
+    page_size: int = Field(10, description="페이지 크기")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -158,9 +165,9 @@ class RoadInfoPageResponse(BaseModel):
 class RoadTrafficInfoPageResponse(BaseModel):
     """도로 교통 정보 페이지네이션 응답 컨테이너"""
     items: list[RoadTrafficInfoResponse] = Field(default_factory=list, description="도로 교통 정보 목록")
-    total_count: str = Field(0, description="전체 항목 수")
-    page: str = Field(1, description="현재 페이지")
-    page_size: str = Field(10, description="페이지 크기")
+    total_count: int = Field(0, description="전체 항목 수")
+    page: int = Field(1, description="현재 페이지")
+    page_size: int = Field(10, description="페이지 크기")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -168,9 +175,9 @@ class RoadTrafficInfoPageResponse(BaseModel):
 class ParkingPlaceInfoPageResponse(BaseModel):
     """주차장 정보 페이지네이션 응답 컨테이너"""
     items: list[ParkingPlaceInfoResponse] = Field(default_factory=list, description="주차장 정보 목록")
-    total_count: str = Field(0, description="전체 항목 수")
-    page: str = Field(1, description="현재 페이지")
-    page_size: str = Field(10, description="페이지 크기")
+    total_count: int = Field(0, description="전체 항목 수")
+    page: int = Field(1, description="현재 페이지")
+    page_size: int = Field(10, description="페이지 크기")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -178,9 +185,9 @@ class ParkingPlaceInfoPageResponse(BaseModel):
 class IncidentInfoPageResponse(BaseModel):
     """돌발상황 정보 페이지네이션 응답 컨테이너"""
     items: list[IncidentInfoResponse] = Field(default_factory=list, description="돌발상황 정보 목록")
-    total_count: str = Field(0, description="전체 항목 수")
-    page: str = Field(1, description="현재 페이지")
-    page_size: str = Field(10, description="페이지 크기")
+    total_count: int = Field(0, description="전체 항목 수")
+    page: int = Field(1, description="현재 페이지")
+    page_size: int = Field(10, description="페이지 크기")
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,159 @@
+"""
+데이터 버전 - 쓰기가 있었던 세션이 커밋될 때 쓴 테이블의 버전을 같은 트랜잭션에서 1씩 올립니다.
+
+조회 결과를 캐시하는 곳(전체 건수 캐시, /api/* 응답 캐시와 ETag)은 캐시 키에 버전을 넣어
+적재가 커밋되면 이전 결과를 자동으로 쓰지 않게 합니다.
+버전은 data_version 테이블에 있으므로 여러 워커(uvicorn --workers)와 스케줄러 리더가 같은 값을 봅니다.
+매 요청마다 읽지 않도록 DATA_VERSION_CACHE_TTL초 동안 프로세스 안에 보관하며,
+이 프로세스에서 커밋한 쓰기는 바로 반영하고 다른 프로세스의 쓰기는 최대 그 시간 뒤에 반영됩니다.
+"""
+import os
+import threading
+import time
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects import mysql, sqlite, postgresql
+from sqlalchemy.orm import Session
+
+from database.connection import engine
+from database.orm import DataVersion, RollupDirty, RecordFingerprint, CrawlCheckpoint
+
+
+# DB에서 읽은 버전을 보관하는 시간 (초, 0이면 매번 DB에서 읽음)
+DATA_VERSION_CACHE_TTL = float(os.getenv("DATA_VERSION_CACHE_TTL", "1"))
+
+# 조회 캐시가 읽지 않는 작업 기록 테이블 - 적재 트랜잭션마다 쓰이므로 버전 행을 갱신(잠금)하지 않음
+UNVERSIONED_TABLES = {RollupDirty.__tablename__, RecordFingerprint.__tablename__, CrawlCheckpoint.__tablename__}
+
+_lock = threading.Lock()
+# 테이블 이름 -> (버전, 마지막 쓰기 시각(나노초, 없으면 None), 읽은 시각)
+_cached: dict[str, tuple[int, int | None, float]] = {}
+_version_table = DataVersion.__table__
+
+
+def _load(table_names: tuple[str, ...]) -> dict[str, tuple[int, int | None]]:
+    """테이블별 (버전, 마지막 쓰기 시각) - 보관 시간이 지난 것만 기본(쓰기) DB에서 한 번에 읽음"""
+    now = time.monotonic()
+    with _lock:
+        fresh = {
+            name: _cached[name][:2] for name in table_names
+            if name in _cached and now - _cached[name][2] < DATA_VERSION_CACHE_TTL
+        }
+    stale = [name for name in dict.fromkeys(table_names) if name not in fresh]
+    if stale:
+        with engine.connect() as conn:
+            rows = {
+                name: (version, modified) for name, version, modified in conn.execute(
+                    select(_version_table.c.tableName, _version_table.c.version, _version_table.c.modifiedAt)
+                    .where(_version_table.c.tableName.in_(stale))
+                )
+            }
+        with _lock:
+            for name in stale:
+                fresh[name] = rows.get(name, (0, None))
+                _cached[name] = (*fresh[name], now)
+    return fresh
+
+
+def table_versions(*table_names: str) -> tuple[int, ...]:
+    """테이블별 데이터 버전 (인자 순서대로)"""
+    loaded = _load(table_names)
+    return tuple(loaded[name][0] for name in table_names)
+
+
+def last_modified(*table_names: str) -> float | None:
+    """테이블들의 마지막 쓰기 커밋 시각 (epoch 초, 쓰기 기록이 없으면 None)"""
+    loaded = _load(table_names)
+    modified = [loaded[name][1] for name in table_names if loaded[name][1] is not None]
+    return max(modified) / 1e9 if modified else None
+
+
+def all_versions() -> dict[str, int]:
+    """모든 테이블의 데이터 버전 (DB에서 바로 읽음, 상태 확인용)"""
+    with engine.connect() as conn:
+        return dict(conn.execute(select(_version_table.c.tableName, _version_table.c.version)).all())
+
+
+def invalidate_versions(*table_names: str):
+    """보관 중인 버전을 버려 다음 조회 때 DB에서 다시 읽게 합니다 (인자가 없으면 전체)."""
+    with _lock:
+        if not table_names:
+            _cached.clear()
+        for name in table_names:
+            _cached.pop(name, None)
+
+
+def _bump(conn, table_names) -> None:
+    """연결의 현재 트랜잭션에서 테이블 버전을 올립니다 (행이 없으면 만듦)."""
+    # 여러 트랜잭션이 같은 행들을 잠글 때 교착 상태가 생기지 않도록 항상 이름 순으로 갱신
+    rows = [{"tableName": name, "version": 1, "modifiedAt": time.time_ns()} for name in sorted(set(table_names))]
+    dialect = conn.dialect.name
+    if dialect == "mysql":
+        stmt = mysql.insert(_version_table)
+        stmt = stmt.on_duplicate_key_update(version=_version_table.c.version + 1, modifiedAt=stmt.inserted.modifiedAt)
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = (sqlite if dialect == "sqlite" else postgresql).insert(_version_table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tableName"],
+            set_={"version": _version_table.c.version + 1, "modifiedAt": stmt.excluded.modifiedAt}
+        )
+    else:
+        raise ValueError(f"데이터 버전을 지원하지 않는 데이터베이스입니다: {dialect}")
+    conn.execute(stmt, rows)
+
+
+def bump_data_version(*table_names: str, conn=None):
+    """
+    데이터 버전을 올립니다 (세션 밖에서 직접 쓰기를 한 경우 호출).
+
+    :param table_names: 쓰기가 있었던 테이블
+    :param conn: 쓰기를 한 연결 (주면 그 트랜잭션에서 함께 커밋, 없으면 따로 커밋)
+    """
+    if not table_names:
+        return
+    if conn is not None:
+        _bump(conn, table_names)
+    else:
+        with engine.begin() as own:
+            _bump(own, table_names)
+    invalidate_versions(*table_names)
+
+
+def _written(session: Session) -> set[str]:
+    return session.info.setdefault("written_tables", set())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state):
+    """session.execute()로 실행한 INSERT/UPDATE/DELETE의 대상 테이블 기록 (Core 문 포함)"""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _written(orm_execute_state.session).add(orm_execute_state.statement.table.name)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    """session.add() 등 ORM 객체 변경의 대상 테이블 기록"""
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        _written(session).add(instance.__table__.name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session):
+    """쓴 테이블의 버전을 커밋할 트랜잭션 안에서 올림 (데이터와 버전이 함께 커밋되거나 함께 롤백됨)"""
+    # 커밋 때 플러시될 ORM 변경도 기록되도록 먼저 플러시
+    session.flush()
+    tables = session.info.get("written_tables", set()) - UNVERSIONED_TABLES
+    if tables:
+        _bump(session.connection(), tables)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_on_commit(session):
+    tables = session.info.pop("written_tables", None)
+    if tables:
+        invalidate_versions(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_on_rollback(session):
+    session.info.pop("written_tables", None)
@@ -1,31 +1,104 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
-import requests
+import asyncio
+import logging
+import math
 import os
-from dotenv import load_dotenv
-from urllib.parse import quote_plus
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Annotated, Literal
+from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+import httpx
 from sqlalchemy.orm import Session
 import xml.etree.ElementTree as ET
 
-from database.connection import get_db, create_tables
+from collector.client import (
+    API_URL, SERVICE_KEY, API_MODEL_MAPPING, build_url, open_http_client, close_http_client,
+    call_with_retry, upstream_stats
+)
+from collector.breaker import CircuitOpenError
+from collector.source import open_payload, upstream_cache
+from collector.parser import ItemListParser, UpstreamResultError, aiter_batches
+from collector.scheduler import SCHEDULER_ENABLED, Scheduler, get_intervals
+from collector.crawler import CRAWL_SPECS, CRAWL_CONCURRENCY, CRAWL_RATE_PER_SEC, CrawlSourceEmptyError, crawl
+from collector.pipeline import IngestPipeline, PipelineJob
+from response_cache import api_cache, cached_api
+from database.connection import get_read_db, create_tables
+from database.partition import PARTITION_MAINTENANCE_INTERVAL, run_maintenance
+from database.rollup import ROLLUP_REFRESH_INTERVAL, refresh_rollups, get_rollup_page, summarize
 from database.repository import (
-    insert_data, get_all_data, get_paginated_data, 
-    get_road_traffic_info_by_route, get_parking_info_by_location
+    ROLLUP_MODELS, LINK_ATTRIBUTE_COLUMNS, Page, ingest_data, get_all_data,
+    get_road_info_page, get_parking_info_page,
+    get_road_traffic_page, get_parking_availability_page, get_incident_page, get_route_names,
+    get_link_attributes
+)
+from database.cursor import InvalidCursorError
+from database.filters import applied_filters
+from database.counting import count_cache
+from database.version import all_versions
+from database.orm import (
+    RoadInfoList, getRoadLinkInfoList, getRoadTrafficInfoList, LinkTrafficCurrent, getParkingPlaceInfoList,
+    getIncidentInfo, getParkingPlaceAvailabilityInfoList, ParkingAvailabilityCurrent, TrafficRollup
+)
+from database.schema.request import (
+    RoadInfoPageRequest, RoadTrafficInfoPageRequest, ParkingPlaceInfoPageRequest,
+    IncidentInfoPageRequest, ParkingAvailabilityPageRequest
 )
 
-load_dotenv()
 
-# 애플리케이션 시작 시 테이블 생성
-create_tables()
+logger = logging.getLogger(__name__)
+
+# 주기 수집 스케줄러 (SCHEDULER_ENABLED=true 일 때 lifespan에서 시작)
+scheduler = Scheduler()
+# 수집 -> 파싱 -> 적재 파이프라인 (/collect/* 요청이 작업을 제출)
+pipeline = IngestPipeline(on_job_done=lambda job: _after_ingest(job.api_endpoint, job.stats))
+# 스케줄러가 집계를 갱신하지 않으면(SCHEDULER_ENABLED=false 또는 ROLLUP_REFRESH_INTERVAL=0) 적재가 끝날 때마다 갱신
+ROLLUP_REFRESH_AFTER_INGEST = not (SCHEDULER_ENABLED and ROLLUP_REFRESH_INTERVAL > 0)
+_rollup_refresh: asyncio.Task | None = None
+_rollup_refresh_pending = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작 시 테이블을 생성하고 공용 HTTP 클라이언트와 스케줄러를 시작합니다."""
+    create_tables()
+    await open_http_client()
+    await pipeline.start()
+    if SCHEDULER_ENABLED:
+        for endpoint, interval in get_intervals().items():
+            if endpoint in API_MODEL_MAPPING:
+                scheduler.add_job(endpoint, interval, lambda endpoint=endpoint: _collect_endpoint(endpoint))
+        if PARTITION_MAINTENANCE_INTERVAL > 0:
+            # 이력 테이블의 미래 파티션 생성 + 보관 기간이 지난 데이터 삭제
+            scheduler.add_job("partition-maintenance", PARTITION_MAINTENANCE_INTERVAL, lambda: run_in_threadpool(run_maintenance))
+        if ROLLUP_REFRESH_INTERVAL > 0:
+            # 적재 후 표시된 버킷을 다시 집계 (스케줄러 리더 프로세스에서만 실행)
+            scheduler.add_job("rollup-refresh", ROLLUP_REFRESH_INTERVAL, lambda: run_in_threadpool(refresh_rollups))
+        await scheduler.start()
+    try:
+        yield
+    finally:
+        await scheduler.stop()
+        await pipeline.stop()
+        if _rollup_refresh:
+            _rollup_refresh.cancel()
+        await close_http_client()
 
-API_URL = os.getenv("API_URL", "").strip()
-SERVICE_KEY = os.getenv("SERVICE_KEY", "").strip()
 
 app = FastAPI(
     title="경기도 교통정보 API",
     description="경기도 교통정보 및 주차장 정보 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request, exc: InvalidCursorError):
+    """잘못된 커서는 400으로 응답 (커서는 같은 엔드포인트의 next_cursor만 사용 가능)"""
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 # API 엔드포인트 목록
 api_key = [
     'getRoadInfoList', 'getRoadLinkInfoList',
@@ -35,18 +108,37 @@ api_key = [
     'getParkingPlaceAvailabilityInfoList'
 ]
 
-# API 엔드포인트와 ORM 모델 매핑
-API_MODEL_MAPPING = {
-    'getRoadInfoList': 'RoadInfoList',
-    'getRoadLinkInfoList': 'getRoadLinkInfoList',
-    'getRoadTrafficInfoList': 'getRoadTrafficInfoList',
-    'getRoadLinkTrafficInfoList': 'getRoadLinkTrafficInfoList',
-    'getRoadLinkTrafficInfo': 'getRoadLinkTrafficInfo',
-    'getRoadLinkCongestInfo': 'getRoadLinkCongestInfo',
-    'getIncidentInfo': 'getIncidentInfo',
-    'getParkingPlaceInfoList': 'getParkingPlaceInfoList',
-    'getParkingPlaceAvailabilityInfoList': 'getParkingPlaceAvailabilityInfoList'
-}
+# /collect/all 기본 수집 대상
+MAIN_APIS = [
+    api_key[0],  # getRoadInfoList
+    api_key[2],  # getRoadTrafficInfoList
+    api_key[6],  # getIncidentInfo
+    api_key[7],  # getParkingPlaceInfoList
+    api_key[8]   # getParkingPlaceAvailabilityInfoList
+]
+
+# 시간이 오래 걸려 기본 수집 대상에서 제외된 API (include_slow=true 로 포함)
+# routeId/linkId가 필요한 링크 API(CRAWL_SPECS)는 파라미터 없이 호출할 수 없으므로 /collect/crawl/{api_endpoint}와 같이
+# DB에 저장된 ID마다 호출합니다. 앞 API가 적재한 ID가 다음 API의 파라미터가 되므로 이 순서대로 하나씩 수집합니다.
+SLOW_APIS = [
+    api_key[1],  # getRoadLinkInfoList
+    api_key[3],  # getRoadLinkTrafficInfoList
+    api_key[4],  # getRoadLinkTrafficInfo
+    api_key[5]   # getRoadLinkCongestInfo
+]
+
+# /collect/all 동시 수집 개수 기본값
+COLLECT_ALL_CONCURRENCY = int(os.getenv("COLLECT_ALL_CONCURRENCY", "4"))
+
+# 적재 방식: incremental(변경분만 업서트) / append(추가, 같은 자연키는 건너뜀)
+IngestMode = Literal["incremental", "append"]
+MODE_QUERY = Query("incremental", description="적재 방식 (incremental: 변경된 레코드만 저장, append: 추가하되 이미 있는 스냅샷은 건너뜀)")
+
+# 수집 작업 완료까지 기다릴지 여부 (false면 작업 ID를 바로 반환)
+WAIT_QUERY = Query(True, description="수집이 끝날 때까지 기다림 (false면 202와 작업 ID를 바로 반환, /collect/jobs/{job_id}로 조회)")
+
+# 스트리밍 파싱 후 한 번에 DB에 저장할 레코드 수
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
 
 
 @app.get("/")
@@ -60,377 +152,406 @@ def health_check():
 # =======================
 
 @app.post("/collect/road-info")
-async def collect_road_info(db: Session = Depends(get_db)):
+async def collect_road_info(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[0], db)  # getRoadInfoList
+    return await _submit_collect(api_key[0], mode, wait)  # getRoadInfoList
 
 
 @app.post("/collect/road-link-info")
-async def collect_road_link_info(db: Session = Depends(get_db)):
+async def collect_road_link_info(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 링크 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[1], db)  # getRoadLinkInfoList
+    return await _submit_collect(api_key[1], mode, wait)  # getRoadLinkInfoList
 
 
 @app.post("/collect/road-traffic")
-async def collect_road_traffic(db: Session = Depends(get_db)):
+async def collect_road_traffic(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 교통 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[2], db)  # getRoadTrafficInfoList
+    return await _submit_collect(api_key[2], mode, wait)  # getRoadTrafficInfoList
 
 @app.post("/collect/road-link-traffic")
-async def collect_road_link_traffic(db: Session = Depends(get_db)):
+async def collect_road_link_traffic(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 링크 교통 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[3], db)  # getRoadLinkTrafficInfoList  
+    return await _submit_collect(api_key[3], mode, wait)  # getRoadLinkTrafficInfoList  
 
 @app.post("/collect/road-link-traffic-info")
-async def collect_road_link_traffic_info(db: Session = Depends(get_db)):
+async def collect_road_link_traffic_info(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 링크 교통 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[4], db)  # getRoadLinkTrafficInfo
+    return await _submit_collect(api_key[4], mode, wait)  # getRoadLinkTrafficInfo
 
 @app.post("/collect/road-link-congest")
-async def collect_road_link_congest(db: Session = Depends(get_db)):
+async def collect_road_link_congest(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 도로 링크 혼잡 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[5], db)
+    return await _submit_collect(api_key[5], mode, wait)
 
 
 @app.post("/collect/incident-info")
-async def collect_incident_info(db: Session = Depends(get_db)):
+async def collect_incident_info(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 돌발상황 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[6], db)  # getIncidentInfo
+    return await _submit_collect(api_key[6], mode, wait)  # getIncidentInfo
 
 
 @app.post("/collect/parking-info")
-async def collect_parking_info(db: Session = Depends(get_db)):
+async def collect_parking_info(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 주차장 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[7], db)  # getParkingPlaceInfoList
+    return await _submit_collect(api_key[7], mode, wait)  # getParkingPlaceInfoList
 
 
 @app.post("/collect/parking-availability")
-async def collect_parking_availability(db: Session = Depends(get_db)):
+async def collect_parking_availability(mode: IngestMode = MODE_QUERY, wait: bool = WAIT_QUERY):
     """외부 API에서 주차장 이용가능 정보를 수집하여 DB에 저장"""
-    return await _collect_and_store_data(api_key[8], db)  # getParkingPlaceAvailabilityInfoList
+    return await _submit_collect(api_key[8], mode, wait)  # getParkingPlaceAvailabilityInfoList
 
 
 @app.post("/collect/all")
-async def collect_all_data(db: Session = Depends(get_db)):
-    """모든 외부 API 데이터를 수집하여 DB에 저장"""
-    results = []
-    
-    # 주요 API만 수집 (너무 많으면 시간이 오래 걸림)
-    main_apis = [
-        api_key[0],  # getRoadInfoList
-        api_key[2],  # getRoadTrafficInfoList  
-        api_key[6],  # getIncidentInfo
-        api_key[7],  # getParkingPlaceInfoList
-        api_key[8]   # getParkingPlaceAvailabilityInfoList
-    ]
+async def collect_all_data(
+    include_slow: bool = Query(False, description="오래 걸리는 도로 링크 계열 API도 함께 수집"),
+    concurrency: int = Query(COLLECT_ALL_CONCURRENCY, ge=1, le=len(api_key), description="동시에 수집할 API 수"),
+    mode: IngestMode = MODE_QUERY,
+):
+    """
+    모든 외부 API 데이터를 수집 파이프라인으로 동시에 수집하여 DB에 저장 (적재 묶음별 세션/트랜잭션 분리).
+    include_slow=true면 기본 API를 모두 수집한 뒤 링크 API를 SLOW_APIS 순서대로 수집합니다
+    (파라미터가 필요한 API는 DB에 저장된 routeId/linkId마다 호출).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def collect_one(endpoint: str) -> dict:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await _collect_endpoint(endpoint, mode)
+                # 크롤링은 일부 파라미터만 실패해도 결과를 반환하므로 실패 건수로 판단
+                failed = result.get("failed", 0) + result.get("aborted", 0)
+                return {
+                    "endpoint": endpoint,
+                    "status": "error" if failed else "success",
+                    "count": result.get("count", 0),
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                    **({"error": f"파라미터 {failed}/{result['total']}개 수집 실패"} if failed else {}),
+                    "result": result
+                }
+            except Exception as e:
+                return {
+                    "endpoint": endpoint,
+                    "status": "error",
+                    "count": 0,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                    "error": e.detail if isinstance(e, HTTPException) else str(e)
+                }
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(collect_one(endpoint) for endpoint in MAIN_APIS))
+    if include_slow:
+        for endpoint in SLOW_APIS:
+            results.append(await collect_one(endpoint))
+
+    return {
+        "message": "전체 데이터 수집 완료",
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "concurrency": concurrency,
+        "succeeded": sum(1 for result in results if result["status"] == "success"),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+        "total_count": sum(result["count"] for result in results),
+        "results": results
+    }
+
+
+@app.post("/collect/crawl/{api_endpoint}")
+async def collect_by_crawling(
+    api_endpoint: str,
+    mode: IngestMode = MODE_QUERY,
+    resume: bool = Query(False, description="마지막 실행에서 완료되지 않은 파라미터만 이어서 수집"),
+    concurrency: int = Query(CRAWL_CONCURRENCY, ge=1, le=32, description="동시에 진행할 호출 수"),
+    rate: float = Query(CRAWL_RATE_PER_SEC, gt=0, le=100, description="초당 최대 호출 수"),
+):
+    """routeId/linkId/laeId 파라미터가 필요한 API를 DB에 저장된 ID마다 호출하여 수집"""
+    if api_endpoint not in CRAWL_SPECS:
+        raise HTTPException(status_code=404, detail=f"파라미터 크롤링을 지원하지 않는 API입니다: {api_endpoint} (지원: {', '.join(CRAWL_SPECS)})")
     
-    for endpoint in main_apis:
-        try:
-            result = await _collect_and_store_data(endpoint, db)
-            results.append({"endpoint": endpoint, "result": result})
-        except Exception as e:
-            results.append({"endpoint": endpoint, "error": str(e)})
+    if not API_URL or not SERVICE_KEY:
+        raise HTTPException(status_code=500, detail="환경 변수(API_URL, SERVICE_KEY) 설정이 필요합니다.")
     
-    return {"message": "전체 데이터 수집 완료", "results": results}
+    try:
+        result = await crawl(api_endpoint, _collect_and_store_data, mode=mode, resume=resume,
+                             concurrency=concurrency, rate=rate)
+    except CrawlSourceEmptyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    _after_ingest(api_endpoint, result)
+    return result
+
+
+@app.get("/collect/jobs/{job_id}")
+def get_collect_job(job_id: str):
+    """파이프라인에 제출된 수집 작업의 진행 상태와 결과 조회"""
+    job = pipeline.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"수집 작업을 찾을 수 없습니다: {job_id}")
+    return job.to_dict()
+
+
+@app.get("/collect/pipeline/stats")
+def get_pipeline_stats():
+    """수집 파이프라인의 큐 깊이와 단계별 처리량 조회"""
+    return pipeline.stats()
+
+
+@app.post("/collect/rollups/refresh")
+async def refresh_traffic_rollups():
+    """적재 후 표시된 집계 버킷을 지금 다시 집계 (python -m database.rollup refresh와 같음)"""
+    started = time.perf_counter()
+    result = await run_in_threadpool(refresh_rollups)
+    return {**result, "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+@app.get("/collect/cache/stats")
+def get_upstream_cache_stats():
+    """외부 API 응답 캐시 통계 조회"""
+    return upstream_cache.stats()
+
+
+@app.get("/collect/upstream/stats")
+def get_upstream_stats():
+    """외부 API 호출 제한(토큰 버킷)과 API별 회로 차단기/재시도 통계 조회"""
+    return upstream_stats()
+
+
+@app.get("/scheduler/status")
+def get_scheduler_status():
+    """주기 수집 스케줄러 상태 조회 (마지막/다음 실행 시각, 소요 시간, 지연)"""
+    return scheduler.status()
 
 
 # =======================
 # 데이터 조회 API (DB -> 클라이언트)
 # =======================
 
+@app.get("/api/cache/stats")
+def get_api_cache_stats():
+    """조회 응답 캐시와 전체 건수 캐시 통계 (적중률, 크기, 축출 횟수)와 테이블별 데이터 버전"""
+    return {
+        "responses": api_cache.stats(),
+        "counts": count_cache.stats(),
+        "data_versions": all_versions()
+    }
+
+
+def _page_fields(result: Page, page: int, page_size: int) -> dict:
+    """목록 응답의 페이지 관련 항목 (count_mode는 total_count를 만든 방식, none이면 total_count는 null)"""
+    return {
+        "total_count": result.total_count,
+        "count_mode": result.count_mode,
+        "has_more": result.has_more,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": result.next_cursor
+    }
+
+
 @app.get("/api/road-info")
+@cached_api("road-info", lambda params: (RoadInfoList.__tablename__,))
 def get_road_info(
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    road_rank: str | None = Query(None, description="도로 등급 필터"),
-    route_tp: str | None = Query(None, description="도로 종류 필터"),
-    route_nm: str | None = Query(None, description="도로명 검색 (부분 일치)"),
-    db: Session = Depends(get_db)
+    params: Annotated[RoadInfoPageRequest, Query()],
+    db: Session = Depends(get_read_db)
 ):
-    """도로 정보 목록 조회 - 다양한 필터링 옵션 지원"""
-    # 기본 데이터 조회
-    data, total_count = get_paginated_data(db, "RoadInfoList", page, page_size)
-    
-    # 클라이언트 사이드 필터링 (실제로는 DB 쿼리에서 처리하는 것이 좋음)
-    filtered_data = data
-    if road_rank:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'roadRank') and item.roadRank == road_rank]
-    if route_tp:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'routeTp') and item.routeTp == route_tp]
-    if route_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'routeNm') and item.routeNm and route_nm in item.routeNm]
+    """도로 정보 목록 조회 - 모든 필터는 DB에서 처리 (조건에 맞는 현재 페이지만 조회)"""
+    result = get_road_info_page(db, params)
+    data = result.items
     
     return {
         "items": [
             {
                 "id": item.id,
-                "routeId": getattr(item, 'routeId', None),
-                "routeNm": getattr(item, 'routeNm', None),
-                "roadRank": getattr(item, 'roadRank', None),
-                "routeTp": getattr(item, 'routeTp', None),
+                "routeId": item.routeId,
+                "routeNm": item.routeNm,
+                "roadRank": item.roadRank,
+                "routeTp": item.routeTp,
                 "routeDesc": getattr(item, 'routeDesc', None)
-            } for item in filtered_data
+            } for item in data
         ],
-        "total_count": len(filtered_data),
-        "original_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "filters": {
-            "road_rank": road_rank,
-            "route_tp": route_tp,
-            "route_nm": route_nm
-        }
+        **_page_fields(result, params.page, params.page_size),
+        "filters": applied_filters(params)
     }
 
 
 @app.get("/api/road-traffic")
+@cached_api("road-traffic", lambda params: (
+    (LinkTrafficCurrent if params.source == "current" else getRoadTrafficInfoList).__tablename__,
+    RoadInfoList.__tablename__, getRoadLinkInfoList.__tablename__
+))
 def get_road_traffic(
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    route_id: str | None = Query(None, description="도로 ID 필터"),
-    route_nm: str | None = Query(None, description="도로 이름 필터"),
-    cong_grade: str | None = Query(None, description="혼잡 등급 필터 (0:정보없음, 1:원활, 2:지체, 3:정체)"),
-    min_speed: int | None = Query(None, description="최소 속도 필터", ge=0, le=300),
-    max_speed: int | None = Query(None, description="최대 속도 필터", ge=0, le=300),
-    db: Session = Depends(get_db)
+    params: Annotated[RoadTrafficInfoPageRequest, Query()],
+    db: Session = Depends(get_read_db)
 ):
-    """도로 교통 정보 목록 조회 - 다양한 필터링 옵션 지원"""
-    if route_id:
-        # 특정 도로의 교통 정보만 조회
-        data = get_road_traffic_info_by_route(db, route_id)
-        total_count = len(data)
-        # 페이지네이션 수동 적용
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        data = data[start_idx:end_idx]
-    else:
-        data, total_count = get_paginated_data(db, "getRoadTrafficInfoList", page, page_size)
-    
-    # 추가 필터링 적용
-    filtered_data = data
-    if route_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'routeNm') and item.routeNm and route_nm in item.routeNm]
-    if cong_grade:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'congGrade') and str(item.congGrade) == cong_grade]
-    if min_speed is not None:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'spd') and item.spd and item.spd >= min_speed]
-    if max_speed is not None:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'spd') and item.spd and item.spd <= max_speed]
+    """
+    도로 교통 정보 목록 조회 - 모든 필터는 DB에서 처리 (속도/혼잡 등급은 숫자, 수집 시각은 범위 비교)
+    source=current면 링크별 최신 상태 테이블에서 조회하여 링크당 한 건만 반환합니다.
+    """
+    result = get_road_traffic_page(db, params)
+    data = result.items
+    # 도로 이름과 링크 속성은 이력에 저장하지 않으므로 현재 페이지의 도로/링크 ID로 한 번에 조회
+    route_names = get_route_names(db, (item.routeId for item in data))
+    link_attributes = get_link_attributes(db, (item.linkId for item in data))
     
     return {
         "items": [
             {
-                "id": getattr(item, 'id', None),
-                "routeId": getattr(item, 'routeId', None),
-                "routeNm": getattr(item, 'routeNm', None),
-                "linkId": getattr(item, 'linkId', None),
-                "spd": getattr(item, 'spd', None),
-                "vol": getattr(item, 'vol', None),
-                "trvlTime": getattr(item, 'trvlTime', None),
-                "congGrade": getattr(item, 'congGrade', None),
-                "updateTime": getattr(item, 'updateTime', None)
-            } for item in filtered_data
+                "id": getattr(item, "id", None),  # 최신 상태 테이블은 (modelName, linkId)가 기본키
+                "routeId": item.routeId,
+                "routeNm": route_names.get(item.routeId),
+                "linkId": item.linkId,
+                **link_attributes.get(item.linkId, dict.fromkeys(LINK_ATTRIBUTE_COLUMNS)),
+                "spd": item.spd,
+                "vol": item.vol,
+                "trvlTime": item.trvlTime,
+                "congGrade": item.congGrade,
+                "collDate": item.collDate,
+                # 기존 응답 키 호환용 (같은 값)
+                "updateTime": item.collDate
+            } for item in data
         ],
-        "total_count": len(filtered_data),
-        "original_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "filters": {
-            "route_id": route_id,
-            "route_nm": route_nm,
-            "cong_grade": cong_grade,
-            "min_speed": min_speed,
-            "max_speed": max_speed
-        }
+        **_page_fields(result, params.page, params.page_size),
+        "filters": applied_filters(params)
     }
 
 
 @app.get("/api/parking-info")
+@cached_api("parking-info", lambda params: (getParkingPlaceInfoList.__tablename__,))
 def get_parking_info(
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    lae_id: str | None = Query(None, description="지방자치단체ID 필터"),
-    lae_nm: str | None = Query(None, description="지방자치단체명 필터"),
-    pkplc_nm: str | None = Query(None, description="주차장명 검색 (부분 일치)"),
-    pkplc_type_nm: str | None = Query(None, description="주차장 유형 필터"),
-    db: Session = Depends(get_db)
+    params: Annotated[ParkingPlaceInfoPageRequest, Query()],
+    db: Session = Depends(get_read_db)
 ):
-    """주차장 정보 목록 조회 - 다양한 필터링 옵션 지원"""
-    if lae_id:
-        # 특정 지역의 주차장 정보만 조회
-        data = get_parking_info_by_location(db, lae_id)
-        total_count = len(data)
-        # 페이지네이션 수동 적용
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        data = data[start_idx:end_idx]
-    else:
-        data, total_count = get_paginated_data(db, "getParkingPlaceInfoList", page, page_size)
-    
-    # 추가 필터링 적용
-    filtered_data = data
-    if lae_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'laeNm') and item.laeNm and lae_nm in item.laeNm]
-    if pkplc_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'pkplcNm') and item.pkplcNm and pkplc_nm in item.pkplcNm]
-    if pkplc_type_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'pkplcTypeNm') and item.pkplcTypeNm == pkplc_type_nm]
+    """주차장 정보 목록 조회 - 모든 필터는 DB에서 처리 (조건에 맞는 현재 페이지만 조회)"""
+    result = get_parking_info_page(db, params)
+    data = result.items
     
     return {
         "items": [
             {
-                "id": getattr(item, 'id', None),
-                "pkplcId": getattr(item, 'pkplcId', None),
-                "pkplcNm": getattr(item, 'pkplcNm', None),
-                "laeId": getattr(item, 'laeId', None),
-                "laeNm": getattr(item, 'laeNm', None),
-                "pkplcTypeNm": getattr(item, 'pkplcTypeNm', None),
+                "id": item.id,
+                "pkplcId": item.pkplcId,
+                "pkplcNm": item.pkplcNm,
+                "laeId": item.laeId,
+                "laeNm": item.laeNm,
+                "pkplcTypeNm": item.pkplcTypeNm,
                 "addr": getattr(item, 'addr', None),
                 "operTm": getattr(item, 'operTm', None),
                 "totPkplcQty": getattr(item, 'totPkplcQty', None),
                 "bscPkplcChrgAmt": getattr(item, 'bscPkplcChrgAmt', None)
-            } for item in filtered_data
+            } for item in data
         ],
-        "total_count": len(filtered_data),
-        "original_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "filters": {
-            "lae_id": lae_id,
-            "lae_nm": lae_nm,
-            "pkplc_nm": pkplc_nm,
-            "pkplc_type_nm": pkplc_type_nm
-        }
+        **_page_fields(result, params.page, params.page_size),
+        "filters": applied_filters(params)
     }
 
 
 @app.get("/api/incident-info")
+@cached_api("incident-info", lambda params: (getIncidentInfo.__tablename__,))
 def get_incident_info(
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    route_id: str | None = Query(None, description="도로 ID 필터"),
-    restrict_type: str | None = Query(None, description="제한 유형 필터"),
-    is_active: bool | None = Query(None, description="진행중인 돌발상황만 조회"),
-    start_date: str | None = Query(None, description="시작 날짜 필터 (YYYY-MM-DD)"),
-    end_date: str | None = Query(None, description="종료 날짜 필터 (YYYY-MM-DD)"),
-    db: Session = Depends(get_db)
+    params: Annotated[IncidentInfoPageRequest, Query()],
+    db: Session = Depends(get_read_db)
 ):
-    """돌발상황 정보 목록 조회 - 다양한 필터링 옵션 지원"""
-    data, total_count = get_paginated_data(db, "getIncidentInfo", page, page_size)
-    
-    # 필터링 적용
-    filtered_data = data
-    if route_id:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'routeId') and item.routeId == route_id]
-    if restrict_type:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'restrictType') and item.restrictType == restrict_type]
-    if is_active is not None:
-        # 활성 상태 필터링 (예: endDt가 없거나 미래인 경우)
-        if is_active:
-            filtered_data = [item for item in filtered_data if hasattr(item, 'endDt') and (not item.endDt or item.endDt == '')]
-        else:
-            filtered_data = [item for item in filtered_data if hasattr(item, 'endDt') and item.endDt]
+    """돌발상황 정보 목록 조회 - 모든 필터는 DB에서 처리 (진행 여부/기간은 DATETIME 비교)"""
+    result = get_incident_page(db, params)
+    data = result.items
     
     return {
         "items": [
             {
-                "id": getattr(item, 'id', None),
-                "routeId": getattr(item, 'routeId', None),
-                "routeNm": getattr(item, 'routeNm', None),
-                "linkId": getattr(item, 'linkId', None),
-                "restrictType": getattr(item, 'restrictType', None),
-                "restrictNm": getattr(item, 'restrictNm', None),
-                "incidentDesc": getattr(item, 'incidentDesc', None),
-                "startDt": getattr(item, 'startDt', None),
-                "endDt": getattr(item, 'endDt', None),
-                "laneNm": getattr(item, 'laneNm', None)
-            } for item in filtered_data
+                "id": item.id,
+                "routeId": item.routeId,
+                "linkId": item.linkId,
+                "regSeq": item.regSeq,
+                "restrictType": item.restrictType,
+                "inciDesc": item.inciDesc,
+                "startDate": item.startDate,
+                "estEndDate": item.estEndDate,
+                "endDate": item.endDate,
+                "coord_x": item.coord_x,
+                "coord_y": item.coord_y
+            } for item in data
         ],
-        "total_count": len(filtered_data),
-        "original_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "filters": {
-            "route_id": route_id,
-            "restrict_type": restrict_type,
-            "is_active": is_active,
-            "start_date": start_date,
-            "end_date": end_date
-        }
+        **_page_fields(result, params.page, params.page_size),
+        "filters": applied_filters(params)
     }
 
 
 @app.get("/api/parking-availability")
+@cached_api("parking-availability", lambda params: (
+    (ParkingAvailabilityCurrent if params.source == "current" else getParkingPlaceAvailabilityInfoList).__tablename__,
+))
 def get_parking_availability(
-    page: int = Query(1, ge=1, description="페이지 번호"),
-    page_size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    min_spaces: int = Query(0, ge=0, description="최소 이용가능 공간 수"),
-    max_spaces: int | None = Query(None, ge=0, description="최대 이용가능 공간 수"),
-    lae_id: str | None = Query(None, description="지방자치단체ID 필터"),
-    pkplc_nm: str | None = Query(None, description="주차장명 검색 (부분 일치)"),
-    only_available: bool = Query(False, description="이용가능한 주차장만 조회"),
-    db: Session = Depends(get_db)
+    params: Annotated[ParkingAvailabilityPageRequest, Query()],
+    db: Session = Depends(get_read_db)
 ):
-    """주차장 이용가능 정보 조회 - 다양한 필터링 옵션 지원"""
-    data, total_count = get_paginated_data(db, "getParkingPlaceAvailabilityInfoList", page, page_size)
-    
-    # 필터링 적용
-    filtered_data = data
-    
-    # 최소/최대 공간 수 필터링
-    if min_spaces > 0 or max_spaces is not None:
-        temp_data = []
-        for item in filtered_data:
-            if hasattr(item, 'avblPklotCnt') and item.avblPklotCnt is not None:
-                if min_spaces > 0 and item.avblPklotCnt < min_spaces:
-                    continue
-                if max_spaces is not None and item.avblPklotCnt > max_spaces:
-                    continue
-                temp_data.append(item)
-        filtered_data = temp_data
-    
-    # 지역 필터링
-    if lae_id:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'laeId') and item.laeId == lae_id]
-    
-    # 주차장명 검색
-    if pkplc_nm:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'pkplcNm') and item.pkplcNm and pkplc_nm in item.pkplcNm]
-    
-    # 이용가능한 주차장만 조회
-    if only_available:
-        filtered_data = [item for item in filtered_data if hasattr(item, 'avblPklotCnt') and item.avblPklotCnt and item.avblPklotCnt > 0]
+    """
+    주차장 이용가능 정보 조회 - 모든 필터는 DB에서 처리 (가용 공간 수는 정수, 제공 시각은 범위 비교)
+    source=current면 주차장별 최신 상태 테이블에서 조회하여 주차장당 한 건만 반환합니다.
+    """
+    result = get_parking_availability_page(db, params)
+    data = result.items
     
     return {
         "items": [
             {
-                "id": getattr(item, 'id', None),
-                "pkplcId": getattr(item, 'pkplcId', None),
-                "pkplcNm": getattr(item, 'pkplcNm', None),
-                "laeId": getattr(item, 'laeId', None),
-                "laeNm": getattr(item, 'laeNm', None),
-                "avblPklotCnt": getattr(item, 'avblPklotCnt', None),
-                "totPkplcQty": getattr(item, 'totPkplcQty', None),
-                "usageRate": round((1 - (getattr(item, 'avblPklotCnt', 0) / max(getattr(item, 'totPkplcQty', 1), 1))) * 100, 1) if getattr(item, 'totPkplcQty', 0) > 0 else 0,
-                "ocrnDt": getattr(item, 'ocrnDt', None),
-                "status": "available" if getattr(item, 'avblPklotCnt', 0) > 0 else "full"
-            } for item in filtered_data
+                "id": getattr(item, "id", None),  # 최신 상태 테이블은 pkplcId가 기본키
+                "pkplcId": item.pkplcId,
+                "pkplcNm": item.pkplcNm,
+                "laeId": item.laeId,
+                "laeNm": item.laeNm,
+                "avblPklotCnt": item.avblPklotCnt,
+                "pklotCnt": item.pklotCnt,
+                "usageRate": round((1 - (item.avblPklotCnt or 0) / item.pklotCnt) * 100, 1) if item.pklotCnt else 0,
+                "ocrnDt": item.ocrnDt,
+                "status": "available" if (item.avblPklotCnt or 0) > 0 else "full"
+            } for item in data
         ],
-        "total_count": len(filtered_data),
-        "original_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "filters": {
-            "min_spaces": min_spaces,
-            "max_spaces": max_spaces,
-            "lae_id": lae_id,
-            "pkplc_nm": pkplc_nm,
-            "only_available": only_available
-        },
+        **_page_fields(result, params.page, params.page_size),
+        "filters": applied_filters(params),
+        # 현재 페이지 기준 요약
         "summary": {
-            "available_parking_lots": len([item for item in filtered_data if getattr(item, 'avblPklotCnt', 0) > 0]),
-            "full_parking_lots": len([item for item in filtered_data if getattr(item, 'avblPklotCnt', 0) == 0]),
-            "total_available_spaces": sum([getattr(item, 'avblPklotCnt', 0) for item in filtered_data])
+            "available_parking_lots": sum(1 for item in data if (item.avblPklotCnt or 0) > 0),
+            "full_parking_lots": sum(1 for item in data if item.avblPklotCnt == 0),
+            "total_available_spaces": sum(item.avblPklotCnt or 0 for item in data)
+        }
+    }
+
+
+@app.get("/api/rollups/traffic")
+@cached_api("rollups-traffic", lambda **params: (TrafficRollup.__tablename__,))
+def get_traffic_rollups(
+    scope: Literal["link", "route"] = Query("route", description="집계 기준 (link: 링크별, route: 도로별)"),
+    scope_id: str | None = Query(None, description="링크 ID 또는 도로 ID (없으면 전체)"),
+    grain: Literal["5m", "1h", "1d"] = Query("1h", description="집계 단위"),
+    dataset: str = Query("getRoadLinkTrafficInfoList", description=f"원본 이력 데이터셋 ({', '.join(ROLLUP_MODELS)})"),
+    start_time: datetime | None = Query(None, description="버킷 시작 시각 하한 (예: 2025-08-01T00:00:00)"),
+    end_time: datetime | None = Query(None, description="버킷 시작 시각 상한 (미포함)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    page_size: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+    pagination: Literal["offset", "cursor"] = Query("offset", description="페이지네이션 방식 (offset: page 번호, cursor: next_cursor 이어받기)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (주면 cursor 방식으로 조회, page는 무시)"),
+    count: Literal["exact", "approx", "none"] = Query("exact", description="전체 건수 계산 방식 (exact: 정확한 건수 - 적재 전까지 캐시, approx: 통계 기반 추정치, none: 세지 않고 has_more만)"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    링크/도로별 교통 집계 조회 - 평균/최저/최고 속도, 교통량 합계, 평균 여행 시간, 혼잡 등급 분포.
+    원본 이력을 묶지 않고 미리 집계된 버킷을 읽으므로 이력이 쌓여도 응답 시간이 일정합니다.
+    """
+    if dataset not in ROLLUP_MODELS:
+        raise HTTPException(status_code=400, detail=f"집계하지 않는 데이터셋입니다: {dataset}")
+    result = get_rollup_page(
+        db, page, page_size, cursor=cursor, use_cursor=pagination == "cursor", count_mode=count, model_name=dataset, grain=grain, scope=scope,
+        scope_id=scope_id, start_time=start_time, end_time=end_time
+    )
+    return {
+        "items": [summarize(bucket) for bucket in result.items],
+        **_page_fields(result, page, page_size),
+        "filters": {
+            "scope": scope,
+            "scope_id": scope_id,
+            "grain": grain,
+            "dataset": dataset,
+            "start_time": start_time,
+            "end_time": end_time
         }
     }
 
@@ -448,45 +569,42 @@ async def test_external_api(api_endpoint: str):
     if not API_URL or not SERVICE_KEY:
         raise HTTPException(status_code=500, detail="환경 변수(API_URL, SERVICE_KEY) 설정이 필요합니다.")
     
-    encoded_key = quote_plus(SERVICE_KEY)
     # 당신이 원한 URL 구조: API_URL + api_endpoint + ?serviceKey=...
-    full_url = f"{API_URL}{api_endpoint}?serviceKey={encoded_key}"
+    full_url = build_url(api_endpoint)
     
     try:
-        response = requests.get(full_url, timeout=30)
-        response.raise_for_status()
-        
-        # XML 파싱
-        root = ET.fromstring(response.text)
-        
-        # 에러 체크
-        result_code = root.findtext(".//resultCode")
-        result_msg = root.findtext(".//resultMsg", "")
-        
-        if result_code and result_code != "00":
-            return {
-                "status": "error",
-                "result_code": result_code,
-                "result_message": result_msg,
-                "url": full_url
-            }
-        
-        # 데이터 개수 확인
-        item_list = root.findall(".//itemList")
+        # 응답을 스트리밍으로 파싱하면서 개수만 세고 샘플 2건만 보관
+        parser = ItemListParser()
+        data_count = 0
+        sample_data = []
+        async with open_payload(api_endpoint) as payload:
+            async for batch in aiter_batches(payload.chunks, INGEST_BATCH_SIZE, parser):
+                data_count += len(batch)
+                sample_data.extend(batch[:2 - len(sample_data)])
         
         return {
             "status": "success",
             "endpoint": api_endpoint,
             "url": full_url,
-            "data_count": len(item_list),
-            "result_code": result_code,
-            "result_message": result_msg,
-            "sample_data": _extract_sample_data(item_list[:2]) if item_list else None
+            "cache_hit": payload.cache_hit,
+            "data_count": data_count,
+            "result_code": parser.result_code,
+            "result_message": parser.result_msg or "",
+            "sample_data": sample_data or None
         }
         
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except UpstreamResultError as e:
+        return {
+            "status": "error",
+            "result_code": e.result_code,
+            "result_message": e.result_msg,
+            "url": full_url
+        }
     except ET.ParseError as e:
         raise HTTPException(status_code=502, detail=f"XML 파싱 실패: {str(e)}")
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=502, detail=f"API 요청 실패: {str(e)}")
 
 
@@ -494,31 +612,109 @@ async def test_external_api(api_endpoint: str):
 # 헬퍼 함수들
 # =======================
 
-async def _collect_and_store_data(api_endpoint: str, db: Session):
-    """외부 API에서 데이터를 수집하고 DB에 저장하는 공통 함수"""
+async def _job_result(job: PipelineJob) -> dict:
+    """파이프라인 작업이 끝날 때까지 기다린 뒤 결과를 반환합니다 (실패하면 HTTP 오류)."""
+    await job.wait()
+    if job.status == "failed":
+        raise _to_http_error(job.exception)
+    return job.result()
+
+
+async def _submit_collect(api_endpoint: str, mode: str, wait: bool):
+    """수집 작업을 파이프라인에 제출하고, wait이면 결과를, 아니면 202와 작업 ID를 반환합니다."""
+    if not API_URL or not SERVICE_KEY:
+        raise HTTPException(status_code=500, detail="환경 변수(API_URL, SERVICE_KEY) 설정이 필요합니다.")
+    
+    if wait:
+        return await _collect_via_pipeline(api_endpoint, mode)
+    job = await pipeline.submit(api_endpoint, mode)
+    return JSONResponse(status_code=202, content={
+        "message": f"{api_endpoint} 수집 작업이 등록되었습니다.",
+        "job_id": job.id,
+        "status_url": f"/collect/jobs/{job.id}"
+    })
+
+
+async def _collect_via_pipeline(api_endpoint: str, mode: str = "incremental") -> dict:
+    """파이프라인으로 수집하고 결과를 기다립니다 (동시 수집/스케줄러용)"""
+    job = await pipeline.submit(api_endpoint, mode)
+    return await _job_result(job)
+
+
+async def _collect_endpoint(api_endpoint: str, mode: str = "incremental") -> dict:
+    """
+    /collect/all과 스케줄러의 수집 단위.
+    파라미터가 필요한 링크 API는 크롤러로 DB의 ID마다 호출하고, 나머지는 파이프라인으로 한 번 호출합니다.
+    """
+    if api_endpoint in SLOW_APIS and api_endpoint in CRAWL_SPECS:
+        result = await crawl(api_endpoint, _collect_and_store_data, mode=mode)
+        _after_ingest(api_endpoint, result)
+        return result
+    return await _collect_via_pipeline(api_endpoint, mode)
+
+
+def _after_ingest(api_endpoint: str, stats: dict):
+    """적재로 집계 대상 이력이 바뀌었으면 집계 갱신을 요청합니다 (스케줄러가 갱신하는 경우 제외)."""
+    model_name = API_MODEL_MAPPING.get(api_endpoint, api_endpoint)
+    if ROLLUP_REFRESH_AFTER_INGEST and model_name in ROLLUP_MODELS and (stats.get("inserted") or stats.get("updated")):
+        _request_rollup_refresh()
+
+
+def _request_rollup_refresh():
+    """
+    집계 갱신을 백그라운드에서 실행합니다.
+    이미 실행 중이면 끝난 뒤 한 번만 더 실행하므로, 적재가 몰려도 갱신은 하나씩 차례로 돕니다.
+    """
+    global _rollup_refresh, _rollup_refresh_pending
+    if _rollup_refresh and not _rollup_refresh.done():
+        _rollup_refresh_pending = True
+        return
+
+    async def run():
+        global _rollup_refresh_pending
+        while True:
+            _rollup_refresh_pending = False
+            try:
+                await run_in_threadpool(refresh_rollups)
+            except Exception as e:
+                logger.warning("적재 후 집계 갱신 실패 (다음 적재나 POST /collect/rollups/refresh로 다시 시도): %s", e)
+            if not _rollup_refresh_pending:
+                return
+
+    _rollup_refresh = asyncio.create_task(run(), name="rollup-refresh-after-ingest")
+
+
+async def _collect_and_store_data(api_endpoint: str, db: Session, mode: str = "incremental", params: dict | None = None):
+    """외부 API에서 데이터를 수집하고 DB에 저장하는 공통 함수 (params: routeId 등 추가 요청 파라미터)"""
     if not API_URL or not SERVICE_KEY:
         raise HTTPException(status_code=500, detail="환경 변수(API_URL, SERVICE_KEY) 설정이 필요합니다.")
     
     # URL 구성 (당신이 원한 방식대로)
-    encoded_key = quote_plus(SERVICE_KEY)
-    full_url = f"{API_URL}{api_endpoint}?serviceKey={encoded_key}"
+    full_url = build_url(api_endpoint)
+    # DB에 저장할 ORM 모델명
+    model_name = API_MODEL_MAPPING.get(api_endpoint, api_endpoint)
     
     try:
-        response = requests.get(full_url, timeout=30)
-        response.raise_for_status()
+        # 응답 본문을 스트리밍으로 파싱하여 itemList를 INGEST_BATCH_SIZE 단위로 바로 DB에 저장
+        # (전체 응답을 문자열/트리로 만들지 않으므로 응답 크기와 무관하게 메모리 사용량이 일정)
+        count = 0
+        stats = {"inserted": 0, "updated": 0, "unchanged": 0}
         
-        # XML 파싱
-        root = ET.fromstring(response.text)
+        async def collect_once() -> bool:
+            nonlocal count
+            async with open_payload(api_endpoint, params) as payload:
+                async for batch in aiter_batches(payload.chunks, INGEST_BATCH_SIZE):
+                    # DB 쓰기는 동기 작업이므로 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+                    batch_stats = await run_in_threadpool(ingest_data, db, model_name, batch, mode)
+                    for key, value in batch_stats.items():
+                        stats[key] += value
+                    count += len(batch)
+            return payload.cache_hit
         
-        # 에러 체크
-        result_code = root.findtext(".//resultCode")
-        if result_code and result_code != "00":
-            result_msg = root.findtext(".//resultMsg", "알 수 없는 오류")
-            raise HTTPException(status_code=502, detail=f"API 오류 ({result_code}): {result_msg}")
+        # 일시적인 외부 API 오류는 백오프 후 재시도 (이미 일부를 저장했다면 중복 적재를 피하기 위해 재시도하지 않음)
+        cache_hit = await call_with_retry(api_endpoint, collect_once, retry_if=lambda e: count == 0)
         
-        # 데이터 추출
-        item_list = root.findall(".//itemList")
-        if not item_list:
+        if not count:
             return {
                 "message": f"{api_endpoint}: 수집된 데이터가 없습니다.",
                 "count": 0,
@@ -526,51 +722,34 @@ async def _collect_and_store_data(api_endpoint: str, db: Session):
                 "url": full_url
             }
         
-        # XML을 딕셔너리로 변환
-        data = []
-        for item in item_list:
-            item_dict = {}
-            for child in item:
-                # 빈 값 처리
-                value = child.text.strip() if child.text else None
-                # 숫자 타입 변환 시도 (정수만)
-                if value and value.isdigit():
-                    value = int(value)
-                item_dict[child.tag] = value
-            data.append(item_dict)
-        
-        # DB에 저장 (ORM 모델명 가져오기)
-        model_name = API_MODEL_MAPPING.get(api_endpoint, api_endpoint)
-        insert_data(db, model_name, data)
-        
         return {
             "message": f"{api_endpoint} 데이터 수집 및 저장 완료",
-            "count": len(data),
+            "count": count,
+            **stats,
+            "mode": mode,
+            "cache_hit": cache_hit,
             "endpoint": api_endpoint,
             "model": model_name,
             "url": full_url
         }
         
-    except ET.ParseError as e:
-        raise HTTPException(status_code=502, detail=f"XML 파싱 실패: {str(e)}")
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"API 요청 실패: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"데이터 처리 실패: {str(e)}")
-
-
-def _extract_sample_data(item_list):
-    """샘플 데이터 추출 (디버깅용)"""
-    sample_data = []
-    for item in item_list:
-        item_dict = {}
-        for child in item:
-            value = child.text.strip() if child.text else None
-            if value and value.isdigit():
-                value = int(value)
-            item_dict[child.tag] = value
-        sample_data.append(item_dict)
-    return sample_data
+        raise _to_http_error(e) from e
+
+
+def _to_http_error(e: Exception) -> HTTPException:
+    """수집 중 발생한 예외를 HTTP 오류 응답으로 변환합니다."""
+    if isinstance(e, HTTPException):
+        return e
+    if isinstance(e, CircuitOpenError):
+        return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    if isinstance(e, UpstreamResultError):
+        return HTTPException(status_code=502, detail=str(e))
+    if isinstance(e, ET.ParseError):
+        return HTTPException(status_code=502, detail=f"XML 파싱 실패: {str(e)}")
+    if isinstance(e, httpx.HTTPError):
+        return HTTPException(status_code=502, detail=f"API 요청 실패: {str(e)}")
+    return HTTPException(status_code=500, detail=f"데이터 처리 실패: {str(e)}")
 
 
 if __name__ == "__main__":
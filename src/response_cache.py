@@ -0,0 +1,130 @@
+"""
+/api/* 조회 응답 캐시와 조건부 GET (ETag / Last-Modified).
+
+조회 데이터는 /collect/*나 스케줄러의 적재가 커밋될 때만 바뀌므로,
+정규화한 조회 조건과 응답에 쓰인 테이블의 데이터 버전(database.version)이 같으면
+DB를 다시 조회하거나 직렬화하지 않고 저장해 둔 JSON 바이트를 그대로 돌려줍니다.
+같은 값으로 ETag를 만들어, 클라이언트가 If-None-Match로 보낸 ETag가 같으면 DB에 접근하지 않고 304로 응답합니다.
+
+    @app.get("/api/road-info")
+    @cached_api("road-info", lambda params: (RoadInfoList.__tablename__,))
+    def get_road_info(params: ..., db: Session = Depends(get_read_db)): ...
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections.abc import Callable
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from cache import TTLCache
+from database.version import table_versions, last_modified
+
+
+# 캐시 유지 시간 (초, 0이면 캐시 안 함). 적재는 버전으로 반영되므로 TTL은 "진행 중" 같은 현재 시각 기준 조건의 최대 지연 시간
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "30"))
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "512"))
+api_cache = TTLCache(max_entries=API_CACHE_MAX_ENTRIES, ttl=API_CACHE_TTL)
+# ETag 유효 구간 (초, 0이면 데이터 버전이 바뀔 때만 변경).
+# "진행 중" 같은 현재 시각 기준 조건은 버전에 반영되지 않으므로 이 간격마다 ETag를 새로 만듦
+ETAG_TTL = float(os.getenv("ETAG_TTL", "30"))
+
+
+def normalize_params(arguments: dict) -> str:
+    """조회 조건을 캐시 키 문자열로 만듭니다 (요청 스키마는 필드 값으로 펼치고, 이름 순 정렬)."""
+    params = {}
+    for name, value in arguments.items():
+        if isinstance(value, BaseModel):
+            params.update(value.model_dump(mode="json"))
+        else:
+            params[name] = jsonable_encoder(value)
+    return json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def render(content) -> bytes:
+    """FastAPI 기본 JSONResponse와 같은 형식으로 직렬화"""
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def _validators(name: str, params_key: str, table_names: tuple[str, ...],
+                versions: tuple[int, ...]) -> tuple[str, float | None]:
+    """
+    (ETag, Last-Modified 시각) - 엔드포인트, 조회 조건, DB의 테이블 버전, ETag 유효 구간으로 만듦.
+    프로세스마다 다른 값을 넣지 않으므로 어느 워커가 응답해도 같은 ETag가 나옴
+    (쓰기 기록이 없고 ETAG_TTL이 0이면 Last-Modified 시각은 None)
+    """
+    modified = last_modified(*table_names)
+    window = 0
+    if ETAG_TTL > 0:
+        window = int(time.time() // ETAG_TTL)
+        modified = max(modified or 0, window * ETAG_TTL)
+    digest = hashlib.sha1(f"{name}|{params_key}|{versions}|{window}".encode()).hexdigest()[:32]
+    return f'"{digest}"', modified
+
+
+def not_modified(request: Request, etag: str, modified: float | None) -> bool:
+    """조건부 요청 헤더로 보면 클라이언트가 가진 응답이 최신인지 (If-None-Match가 있으면 If-Modified-Since는 무시)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and modified is not None:
+        try:
+            return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def cached_api(name: str, tables: Callable[..., tuple[str, ...]]):
+    """
+    동기 조회 엔드포인트의 응답을 캐시하고, ETag/Last-Modified가 같은 조건부 GET에는 304로 응답하는 데코레이터.
+
+    캐시 키와 ETag에 쓰는 데이터 버전(database.version)은 DB의 data_version 테이블에서 읽으므로
+    여러 워커(uvicorn --workers)로 띄우거나 스케줄러 리더가 다른 프로세스여도, 적재가 커밋되면
+    최대 DATA_VERSION_CACHE_TTL초(기본 1초) 안에 모든 워커가 캐시된 응답을 버리고 다시 조회합니다.
+    ETag도 DB의 버전으로 만들므로 워커가 달라도 같은 데이터면 같은 ETag로 304를 돌려줍니다.
+
+    :param name: 캐시 키에 넣을 엔드포인트 이름
+    :param tables: 엔드포인트 인자(db 제외)를 받아 응답에 쓰이는 테이블 이름들을 반환하는 함수
+    """
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        def wrapper(**kwargs):
+            request = kwargs.pop("request")
+            arguments = {key: value for key, value in kwargs.items() if key != "db"}
+            params_key = normalize_params(arguments)
+            table_names = tables(**arguments)
+            # 조회 전에 버전을 읽어, 조회 중에 적재가 커밋되면 다음 요청은 새 버전으로 다시 조회
+            versions = table_versions(*table_names)
+            etag, modified = _validators(name, params_key, table_names, versions)
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if modified is not None:
+                headers["Last-Modified"] = formatdate(modified, usegmt=True)
+            if not_modified(request, etag, modified):
+                return Response(status_code=304, headers=headers)
+
+            key = (name, params_key, versions)
+            body = api_cache.get(key) if API_CACHE_TTL > 0 else None
+            if body is None:
+                body = render(endpoint(**kwargs))
+                if API_CACHE_TTL > 0:
+                    api_cache.set(key, body)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        # FastAPI가 조건부 요청 헤더를 넘겨주도록 request 인자를 시그니처에 추가
+        signature = inspect.signature(endpoint)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request)
+        ])
+        return wrapper
+    return decorator
@@ -0,0 +1,61 @@
+"""
+테스트 공통 설정.
+
+database.connection은 import할 때 DATABASE_URL로 엔진을 만들므로, 애플리케이션 모듈을 import하기 전에
+메모리 SQLite와 테스트용 외부 API 설정을 환경 변수로 지정합니다 (.env 값보다 우선).
+"""
+import os
+
+os.environ["DATABASE_URL"] = "sqlite://"
+os.environ["DATABASE_READ_URL"] = ""
+os.environ["API_URL"] = "http://upstream.test/api/rest/"
+os.environ["SERVICE_KEY"] = "test-key"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["UPSTREAM_CACHE_ENABLED"] = "false"
+os.environ["ARCHIVE_DIR"] = ""
+os.environ["DB_ECHO"] = "false"
+# ETag가 시간 구간에 따라 바뀌지 않고 데이터 버전으로만 바뀌게 함
+os.environ["ETAG_TTL"] = "0"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database.connection import SessionFactory, engine
+from database.orm import Base
+from database.version import invalidate_versions
+
+
+def item(**fields) -> str:
+    """itemList 요소 하나 (값은 문자열 그대로)"""
+    return "<itemList>" + "".join(f"<{tag}>{value}</{tag}>" for tag, value in fields.items()) + "</itemList>"
+
+
+def payload(items: list[str], result_code: str = "00", result_msg: str = "NORMAL SERVICE") -> bytes:
+    """외부 API 응답 본문 형식의 XML"""
+    return (
+        f"<response><header><resultCode>{result_code}</resultCode><resultMsg>{result_msg}</resultMsg></header>"
+        f"<body><items>{''.join(items)}</items></body></response>"
+    ).encode()
+
+
+@pytest.fixture
+def db():
+    """테스트마다 빈 테이블로 시작하는 세션"""
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    # 테이블을 다시 만들었으므로 프로세스에 보관한 데이터 버전도 버림
+    invalidate_versions()
+    session = SessionFactory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    """lifespan(테이블 생성, HTTP 클라이언트, 파이프라인)을 실행한 API 테스트 클라이언트"""
+    from main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
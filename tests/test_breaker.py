@@ -0,0 +1,117 @@
+import asyncio
+import time
+
+import pytest
+
+from collector import breaker as breaker_module
+from collector.breaker import CircuitBreaker, CircuitOpenError
+from collector.limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(breaker_module.time, "monotonic", clock)
+    return clock
+
+
+def fail(breaker: CircuitBreaker, times: int = 1):
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure("boom")
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("api", failure_threshold=3, reset_timeout=30)
+    fail(breaker, 2)
+    assert breaker.state == "closed"
+    # 성공하면 연속 실패 수가 초기화됨
+    breaker.before_call()
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == "closed"
+    fail(breaker)
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_after == pytest.approx(30)
+    assert breaker.rejected == 1 and breaker.times_opened == 1
+
+
+def test_half_open_success_closes(clock):
+    breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30, half_open_max=1)
+    fail(breaker)
+    clock.now += 30
+
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    # 시험 호출은 half_open_max개까지만
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_half_open_failure_reopens(clock):
+    breaker = CircuitBreaker("api", failure_threshold=5, reset_timeout=30)
+    fail(breaker, 5)
+    clock.now += 31
+
+    fail(breaker)
+    assert breaker.state == "open"
+    assert breaker.times_opened == 2
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert error.value.retry_after == pytest.approx(20)
+
+
+def test_release_returns_probe_slot(clock):
+    breaker = CircuitBreaker("api", failure_threshold=1, reset_timeout=30)
+    fail(breaker)
+    clock.now += 30
+    breaker.before_call()
+    # 외부 API와 무관한 실패는 상태를 바꾸지 않고 시험 호출 자리만 반납
+    breaker.release()
+    assert breaker.state == "half_open"
+    breaker.before_call()
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    async def run() -> list[float]:
+        bucket = TokenBucket(rate=20, burst=2)
+        started = time.monotonic()
+        times = []
+        for _ in range(4):
+            await bucket.acquire()
+            times.append(time.monotonic() - started)
+        return bucket, times
+
+    bucket, times = asyncio.run(run())
+    # 처음 burst개는 바로, 이후는 1/rate초(50ms) 간격
+    assert times[1] < 0.02
+    assert times[2] >= 0.04
+    assert times[3] - times[2] >= 0.04
+    assert bucket.acquired == 4
+    assert bucket.throttled == 2
+
+
+def test_token_bucket_limits_concurrent_callers():
+    async def run() -> float:
+        bucket = TokenBucket(rate=50, burst=1)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+        return time.monotonic() - started
+
+    # 첫 토큰 이후 5개는 20ms씩 기다려야 함
+    assert asyncio.run(run()) >= 0.09
@@ -0,0 +1,135 @@
+import asyncio
+import xml.etree.ElementTree as ET
+
+import httpx
+import pytest
+
+from collector import client as client_module
+from collector.breaker import CircuitOpenError
+from collector.client import call_with_retry, guarded, is_retryable, is_upstream_failure, retry_delay
+from collector.parser import UpstreamResultError
+
+
+REQUEST = httpx.Request("GET", "http://upstream.test/api/rest/getIncidentInfo")
+
+
+def status_error(status_code: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    response = httpx.Response(status_code, headers=headers, request=REQUEST)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=REQUEST, response=response)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """API별 차단기와 재시도 통계를 테스트마다 새로 만들고, 재시도 대기는 하지 않음"""
+    monkeypatch.setattr(client_module, "_breakers", {})
+    monkeypatch.setattr(client_module, "_retries", {})
+    monkeypatch.setattr(client_module, "UPSTREAM_RETRY_BASE", 0)
+    monkeypatch.setattr(client_module, "BREAKER_FAILURE_THRESHOLD", 2)
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (status_error(503), True),
+    (status_error(429), True),
+    (status_error(404), False),
+    (httpx.ReadTimeout("timeout", request=REQUEST), True),
+    (httpx.ConnectError("refused", request=REQUEST), True),
+    (UpstreamResultError("01", "APPLICATION ERROR"), True),
+    (UpstreamResultError("22", "LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS"), False),
+    (UpstreamResultError("30", "SERVICE KEY IS NOT REGISTERED"), False),
+    (ET.ParseError("broken"), False),
+    (ValueError("bug"), False),
+])
+def test_is_retryable(error, retryable):
+    assert is_retryable(error) is retryable
+
+
+def test_upstream_failure_classification():
+    assert is_upstream_failure(UpstreamResultError("22"))
+    assert is_upstream_failure(ET.ParseError("broken"))
+    # 데이터 없음(03)과 우리 쪽 오류는 차단기 실패로 세지 않음
+    assert not is_upstream_failure(UpstreamResultError("03", "NODATA_ERROR"))
+    assert not is_upstream_failure(ValueError("bug"))
+
+
+def test_retry_delay_follows_retry_after(monkeypatch):
+    monkeypatch.setattr(client_module, "UPSTREAM_RETRY_MAX_DELAY", 10)
+    assert retry_delay(status_error(429, {"Retry-After": "3"}), 0) == 3
+    assert retry_delay(status_error(429, {"Retry-After": "120"}), 0) == 10
+
+
+def test_call_with_retry_retries_only_retryable_errors():
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise status_error(503)
+        return "ok"
+
+    assert asyncio.run(call_with_retry("getIncidentInfo", flaky, max_retries=2)) == "ok"
+    assert len(attempts) == 3
+    assert client_module._retries == {"getIncidentInfo": 2}
+
+    attempts.clear()
+
+    async def key_error():
+        attempts.append(1)
+        raise UpstreamResultError("30", "SERVICE KEY IS NOT REGISTERED")
+
+    with pytest.raises(UpstreamResultError):
+        asyncio.run(call_with_retry("getIncidentInfo", key_error, max_retries=2))
+    assert len(attempts) == 1
+
+
+def test_retries_stop_once_breaker_opens():
+    attempts = []
+
+    async def failing():
+        async with guarded("getIncidentInfo"):
+            attempts.append(1)
+            raise status_error(503)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(call_with_retry("getIncidentInfo", failing, max_retries=5))
+    # 두 번째 실패에서 차단기가 열리므로 남은 재시도는 하지 않음
+    assert len(attempts) == 2
+    assert client_module.get_breaker("getIncidentInfo").state == "open"
+
+    # 열린 동안에는 호출하지 않고 바로 실패
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(call_with_retry("getIncidentInfo", failing, max_retries=5))
+    assert len(attempts) == 2
+
+
+def test_guarded_does_not_count_local_errors():
+    async def local_bug():
+        async with guarded("getIncidentInfo"):
+            raise ValueError("bug")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            asyncio.run(local_bug())
+    assert client_module.get_breaker("getIncidentInfo").state == "closed"
+
+
+def test_http_client_is_shared_until_closed():
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            client_module.get_http_client()
+        first = await client_module.open_http_client()
+        try:
+            assert await client_module.open_http_client() is first
+            assert client_module.get_http_client() is first
+        finally:
+            await client_module.close_http_client()
+        with pytest.raises(RuntimeError):
+            client_module.get_http_client()
+
+    asyncio.run(scenario())
+
+
+def test_timeout_per_host(monkeypatch):
+    monkeypatch.setattr(client_module, "HTTP_HOST_TIMEOUTS", {"slow.test": 60.0})
+    monkeypatch.setattr(client_module, "HTTP_READ_TIMEOUT", 10.0)
+    assert client_module.get_timeout("http://slow.test/api/getRoadLinkInfoList").read == 60.0
+    assert client_module.get_timeout("http://upstream.test/api/getIncidentInfo").read == 10.0
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+@pytest.fixture
+def fake_collect(monkeypatch):
+    """엔드포인트별 결과를 정해 두고 동시에 실행된 수를 기록하는 수집 함수"""
+    state = {"running": 0, "peak": 0, "order": []}
+
+    async def collect_endpoint(api_endpoint: str, mode: str = "incremental") -> dict:
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        state["order"].append(api_endpoint)
+        try:
+            await asyncio.sleep(0.01)
+            if api_endpoint == "getIncidentInfo":
+                raise HTTPException(status_code=502, detail="API 오류 (22): LIMITED")
+            if api_endpoint == "getRoadLinkInfoList":
+                return {"count": 3, "failed": 1, "aborted": 0, "total": 4}
+            return {"count": 10}
+        finally:
+            state["running"] -= 1
+
+    monkeypatch.setattr(main, "_collect_endpoint", collect_endpoint)
+    return state
+
+
+def test_collect_all_reports_each_endpoint(client, fake_collect):
+    body = client.post("/collect/all", params={"concurrency": 2}).json()
+
+    statuses = {result["endpoint"]: result["status"] for result in body["results"]}
+    assert statuses == {endpoint: "success" for endpoint in main.MAIN_APIS} | {"getIncidentInfo": "error"}
+    assert (body["succeeded"], body["failed"], body["total_count"]) == (4, 1, 40)
+    error = next(result for result in body["results"] if result["endpoint"] == "getIncidentInfo")
+    assert error["error"] == "API 오류 (22): LIMITED"
+    assert fake_collect["peak"] == 2
+
+
+def test_collect_all_include_slow_runs_link_apis_in_order(client, fake_collect):
+    body = client.post("/collect/all", params={"include_slow": True}).json()
+
+    assert fake_collect["order"][-len(main.SLOW_APIS):] == main.SLOW_APIS
+    crawled = next(result for result in body["results"] if result["endpoint"] == "getRoadLinkInfoList")
+    # 크롤링은 일부 파라미터만 실패해도 결과를 돌려주므로 실패 건수로 오류 판단
+    assert (crawled["status"], crawled["error"]) == ("error", "파라미터 1/4개 수집 실패")
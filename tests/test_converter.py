@@ -0,0 +1,46 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from database.converter import convert_records, get_converter, parse_upstream_datetime
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("20250801123000", datetime(2025, 8, 1, 12, 30)),
+    ("2025-08-01 12:30:00", datetime(2025, 8, 1, 12, 30)),
+    ("2025.08.01", datetime(2025, 8, 1)),
+    (20250801, datetime(2025, 8, 1)),
+    ("garbage", "garbage"),
+])
+def test_parse_upstream_datetime(value, expected):
+    assert parse_upstream_datetime(value) == expected
+
+
+def test_convert_records_coerces_column_types():
+    [row] = convert_records("getRoadTrafficInfoList", [{
+        "routeId": 100, "linkId": " L1 ", "collDate": "20250801120000", "spd": "50", "vol": "", "unknownTag": "x"
+    }])
+    assert row == {"routeId": "100", "linkId": "L1", "collDate": datetime(2025, 8, 1, 12), "spd": 50, "vol": None}
+
+
+def test_convert_records_parses_decimal_with_comma():
+    [row] = convert_records("getRoadLinkInfoList", [{"linkId": "L1", "linkLength": "1,234.50"}])
+    assert row["linkLength"] == Decimal("1234.50")
+
+
+def test_invalid_values_become_none_without_dropping_rows():
+    rows = convert_records("getRoadTrafficInfoList", [
+        {"linkId": "L1", "collDate": "20250801120000", "spd": "fast"},
+        {"linkId": "L2", "collDate": "garbage", "spd": "40"},
+    ])
+    assert rows == [
+        {"linkId": "L1", "collDate": datetime(2025, 8, 1, 12), "spd": None},
+        {"linkId": "L2", "collDate": None, "spd": 40},
+    ]
+
+
+def test_converter_is_cached_per_model():
+    assert get_converter("getRoadTrafficInfoList") is get_converter("getRoadTrafficInfoList")
+    with pytest.raises(ValueError):
+        get_converter("noSuchModel")
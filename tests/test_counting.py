@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import insert
+
+from database.connection import engine
+from database.counting import count_cache, count_rows, read_tables
+from database.orm import getRoadTrafficInfoList
+from database.repository import ingest_data, road_traffic_query, save_crawl_checkpoint
+
+
+@pytest.fixture
+def traffic_db(db):
+    count_cache.clear()
+    ingest_data(db, "RoadInfoList", [{"routeId": "R1", "routeNm": "경부고속도로"}])
+    ingest_data(db, "getRoadTrafficInfoList", [
+        {"routeId": "R1", "linkId": f"L{i}", "collDate": "20250801120000", "spd": str(i * 10)} for i in range(5)
+    ])
+    return db
+
+
+def sneak_in_row(link_id: str):
+    """세션을 거치지 않아 데이터 버전이 바뀌지 않는 쓰기 - 캐시된 건수가 쓰였는지 확인하는 용도"""
+    with engine.begin() as conn:
+        conn.execute(insert(getRoadTrafficInfoList.__table__), {
+            "routeId": "R1", "linkId": link_id, "collDate": datetime(2025, 8, 1, 13), "spd": 10
+        })
+
+
+def test_count_modes(traffic_db):
+    stmt = road_traffic_query(min_speed=20)
+    assert count_rows(traffic_db, stmt, "exact") == (3, "exact")
+    assert count_rows(traffic_db, stmt, "none") == (None, "none")
+    # SQLite는 추정치를 지원하지 않으므로 정확한 건수로 셈
+    assert count_rows(traffic_db, stmt, "approx") == (3, "exact")
+
+
+def test_read_tables_include_subqueries():
+    assert read_tables(road_traffic_query(route_nm="경부")) == ("road_info_list", "road_traffic_info_list")
+    assert read_tables(road_traffic_query(route_id="R1")) == ("road_traffic_info_list",)
+
+
+def test_cache_survives_writes_to_unrelated_tables(traffic_db):
+    stmt = road_traffic_query(route_id="R1")
+    assert count_rows(traffic_db, stmt)[0] == 5
+    sneak_in_row("L9")
+
+    # 크롤링 체크포인트와 돌발상황 적재는 교통 이력 건수와 무관
+    save_crawl_checkpoint(traffic_db, "getRoadLinkInfoList", "20250801120000", "R1", "done", 3)
+    ingest_data(traffic_db, "getIncidentInfo", [{"regSeq": "1"}])
+    assert count_rows(traffic_db, stmt)[0] == 5
+    assert count_cache.stats()["hits"] >= 1
+
+
+def test_cache_invalidated_by_write_to_read_table(traffic_db):
+    stmt = road_traffic_query(route_id="R1")
+    assert count_rows(traffic_db, stmt)[0] == 5
+
+    ingest_data(traffic_db, "getRoadTrafficInfoList", [{"routeId": "R1", "linkId": "L5", "collDate": "20250801120000"}])
+    assert count_rows(traffic_db, stmt)[0] == 6
+
+
+def test_cache_invalidated_by_write_to_subquery_table(traffic_db):
+    stmt = road_traffic_query(route_nm="서해안")
+    assert count_rows(traffic_db, stmt)[0] == 0
+
+    # 이력은 그대로지만 이름 필터의 하위 쿼리가 읽는 road_info_list가 바뀌었으므로 다시 셈
+    ingest_data(traffic_db, "RoadInfoList", [{"routeId": "R1", "routeNm": "서해안고속도로"}])
+    assert count_rows(traffic_db, stmt)[0] == 5
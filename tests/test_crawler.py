@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from collector.crawler import CRAWL_SPECS, CrawlSourceEmptyError, crawl
+from collector.parser import UpstreamResultError
+from database.repository import get_crawl_progress, ingest_data
+
+
+class FakeCollect:
+    """파라미터 값마다 호출을 기록하고, failing에 든 값은 실패시키는 수집 함수"""
+
+    def __init__(self, failing=(), error: Exception | None = None):
+        self.failing = set(failing)
+        self.error = error or RuntimeError("일시적 오류")
+        self.calls: list[str] = []
+
+    async def __call__(self, api_endpoint, db, mode, params):
+        value = next(iter(params.values()))
+        self.calls.append(value)
+        if value in self.failing:
+            raise self.error
+        return {"count": 1, "inserted": 1, "updated": 0, "unchanged": 0}
+
+
+@pytest.fixture
+def routes(db):
+    ingest_data(db, "RoadInfoList", [{"routeId": route_id} for route_id in ("R1", "R2", "R3")])
+    return db
+
+
+def test_resume_calls_only_unfinished_values(routes):
+    first_collect = FakeCollect(failing={"R2"})
+    first = asyncio.run(crawl("getRoadLinkInfoList", first_collect, concurrency=1, rate=100))
+    assert sorted(first_collect.calls) == ["R1", "R2", "R3"]
+    assert (first["succeeded"], first["failed"], first["skipped"]) == (2, 1, 0)
+    assert get_crawl_progress(routes, "getRoadLinkInfoList") == (first["run_id"], {"R1", "R3"})
+
+    resumed_collect = FakeCollect()
+    resumed = asyncio.run(crawl("getRoadLinkInfoList", resumed_collect, resume=True, concurrency=1, rate=100))
+    assert resumed_collect.calls == ["R2"]
+    assert resumed["run_id"] == first["run_id"]
+    assert (resumed["resumed"], resumed["total"], resumed["skipped"], resumed["succeeded"]) == (True, 3, 2, 1)
+    assert get_crawl_progress(routes, "getRoadLinkInfoList") == (first["run_id"], {"R1", "R2", "R3"})
+
+
+def test_abort_result_code_leaves_remaining_values_for_resume(routes):
+    collect = FakeCollect(failing={"R1"}, error=UpstreamResultError("22", "LIMITED NUMBER OF SERVICE REQUESTS EXCEEDS"))
+    result = asyncio.run(crawl("getRoadLinkInfoList", collect, concurrency=1, rate=100))
+    assert collect.calls == ["R1"]
+    assert (result["failed"], result["aborted"]) == (1, 2)
+
+    resumed_collect = FakeCollect()
+    asyncio.run(crawl("getRoadLinkInfoList", resumed_collect, resume=True, concurrency=1, rate=100))
+    assert sorted(resumed_collect.calls) == ["R1", "R2", "R3"]
+
+
+def test_parking_crawl_uses_parking_info_lae_ids(db):
+    assert CRAWL_SPECS["getParkingPlaceAvailabilityInfoList"].source_model == "getParkingPlaceInfoList"
+    ingest_data(db, "getParkingPlaceInfoList", [
+        {"pkplcId": "P1", "laeId": "41110"}, {"pkplcId": "P2", "laeId": "41110"}, {"pkplcId": "P3", "laeId": "41130"}
+    ])
+    collect = FakeCollect()
+    asyncio.run(crawl("getParkingPlaceAvailabilityInfoList", collect, rate=100))
+    assert sorted(collect.calls) == ["41110", "41130"]
+
+
+def test_empty_source_raises(db):
+    with pytest.raises(CrawlSourceEmptyError, match="laeId"):
+        asyncio.run(crawl("getParkingPlaceAvailabilityInfoList", FakeCollect(), rate=100))
+
+
+def test_crawl_endpoint_returns_409_without_source_values(client):
+    response = client.post("/collect/crawl/getParkingPlaceAvailabilityInfoList")
+    assert response.status_code == 409
+    assert "getParkingPlaceInfoList.laeId" in response.json()["detail"]
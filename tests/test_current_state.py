@@ -0,0 +1,89 @@
+from datetime import datetime
+
+from sqlalchemy import select, text
+
+from database.connection import engine
+from database.migrate import build_current_state, find_stale_current_tables
+from database.orm import LinkTrafficCurrent, ParkingAvailabilityCurrent
+from database.repository import get_road_traffic_page, ingest_data
+from database.schema.request import RoadTrafficInfoPageRequest
+
+
+def traffic(link_id: str, coll_date: str, spd: int, vol: int = 10) -> dict:
+    return {"routeId": "R1", "linkId": link_id, "collDate": coll_date, "spd": str(spd), "vol": str(vol)}
+
+
+def current(db, model_name: str = "getRoadTrafficInfoList") -> dict[str, tuple]:
+    db.expire_all()
+    return {
+        row.linkId: (row.collDate, row.spd, row.vol)
+        for row in db.scalars(select(LinkTrafficCurrent).where(LinkTrafficCurrent.modelName == model_name))
+    }
+
+
+def test_newer_snapshot_replaces_current_state(db):
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120000", 50), traffic("L2", "20250801120000", 60)])
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120500", 30)])
+
+    assert current(db) == {
+        "L1": (datetime(2025, 8, 1, 12, 5), 30, 10),
+        "L2": (datetime(2025, 8, 1, 12), 60, 10),
+    }
+
+
+def test_late_snapshot_does_not_roll_back_current_state(db):
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120500", 30)])
+    # 늦게 도착한 과거 스냅샷은 이력에만 들어감
+    counts = ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120000", 50)])
+
+    assert counts["inserted"] == 1
+    assert current(db) == {"L1": (datetime(2025, 8, 1, 12, 5), 30, 10)}
+
+
+def test_latest_row_within_batch_wins(db):
+    ingest_data(db, "getRoadTrafficInfoList", [
+        traffic("L1", "20250801121000", 40), traffic("L1", "20250801120000", 50), traffic("L1", "20250801120500", 30)
+    ])
+    assert current(db) == {"L1": (datetime(2025, 8, 1, 12, 10), 40, 10)}
+
+
+def test_datasets_keep_separate_current_state(db):
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120000", 50, vol=10)])
+    ingest_data(db, "getRoadLinkTrafficInfoList", [traffic("L1", "20250801120000", 20, vol=99)])
+    ingest_data(db, "getRoadLinkTrafficInfo", [traffic("L1", "20250801120500", 25, vol=77)])
+
+    assert current(db) == {"L1": (datetime(2025, 8, 1, 12), 50, 10)}
+    assert current(db, "getRoadLinkTrafficInfoList") == {"L1": (datetime(2025, 8, 1, 12), 20, 99)}
+
+    page = get_road_traffic_page(db, RoadTrafficInfoPageRequest(source="current"))
+    assert [(item.linkId, item.vol) for item in page.items] == [("L1", 10)]
+    assert page.total_count == 1
+
+
+def test_parking_availability_current_state(db):
+    def availability(available: str, ocrn_dt: str) -> dict:
+        return {"pkplcId": "P1", "laeId": "41110", "pkplcNm": "공영주차장", "avblPklotCnt": available, "ocrnDt": ocrn_dt}
+
+    ingest_data(db, "getParkingPlaceAvailabilityInfoList", [availability("5", "2025-08-01 12:05:00")])
+    ingest_data(db, "getParkingPlaceAvailabilityInfoList", [availability("9", "2025-08-01 12:00:00")])
+
+    db.expire_all()
+    row = db.get(ParkingAvailabilityCurrent, "P1")
+    assert (row.avblPklotCnt, row.ocrnDt) == (5, datetime(2025, 8, 1, 12, 5))
+
+
+def test_build_current_recreates_table_with_old_key(db):
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "20250801120000", 50)])
+    ingest_data(db, "getRoadLinkTrafficInfoList", [traffic("L1", "20250801120500", 20)])
+    db.close()
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE link_traffic_current"))
+        conn.execute(text("CREATE TABLE link_traffic_current (linkId VARCHAR(50) PRIMARY KEY, routeId VARCHAR(50), "
+                          "collDate DATETIME, spd SMALLINT, vol INTEGER, trvlTime INTEGER, linkDelayTime INTEGER, congGrade SMALLINT)"))
+    assert find_stale_current_tables(engine) == ["link_traffic_current"]
+
+    build_current_state(bind=engine)
+
+    assert find_stale_current_tables(engine) == []
+    assert current(db) == {"L1": (datetime(2025, 8, 1, 12), 50, 10)}
+    assert current(db, "getRoadLinkTrafficInfoList") == {"L1": (datetime(2025, 8, 1, 12, 5), 20, 10)}
@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from database.cursor import InvalidCursorError, cursor_page, decode_cursor, encode_cursor, keyset_query, order_columns
+from database.orm import getRoadTrafficInfoList
+
+
+@pytest.fixture
+def traffic_rows(db):
+    start = datetime(2025, 8, 1, 12)
+    # 같은 수집 시각이 여러 건이어도 기본키로 순서가 정해져야 함
+    db.add_all(
+        getRoadTrafficInfoList(linkId=f"L{i}", routeId="R1", collDate=start + timedelta(minutes=i // 3), spd=i)
+        for i in range(10)
+    )
+    db.commit()
+    return db
+
+
+def test_cursor_round_trip(traffic_rows):
+    columns = order_columns(getRoadTrafficInfoList, "collDate")
+    row = traffic_rows.scalars(select(getRoadTrafficInfoList).limit(1)).one()
+
+    cursor = encode_cursor(columns, row)
+    assert "=" not in cursor
+    assert decode_cursor(columns, cursor) == [row.collDate, row.id]
+
+
+def test_cursor_pages_cover_all_rows_once(traffic_rows):
+    stmt, columns = keyset_query(select(getRoadTrafficInfoList), "collDate")
+    seen, cursor = [], None
+    while True:
+        page, cursor = cursor_page(traffic_rows, stmt, columns, cursor, page_size=4)
+        seen.extend(row.id for row in page)
+        if cursor is None:
+            break
+    ordered = traffic_rows.scalars(
+        select(getRoadTrafficInfoList.id).order_by(getRoadTrafficInfoList.collDate, getRoadTrafficInfoList.id)
+    ).all()
+    assert seen == ordered
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "!!!", base64.urlsafe_b64encode(b"[1,2]").decode(), ""])
+def test_tampered_cursor_is_rejected(cursor):
+    columns = order_columns(getRoadTrafficInfoList, "collDate")
+    with pytest.raises(InvalidCursorError, match="잘못된 커서입니다."):
+        decode_cursor(columns, cursor)
+
+
+def test_cursor_from_other_sort_order_is_rejected(traffic_rows):
+    row = traffic_rows.scalars(select(getRoadTrafficInfoList).limit(1)).one()
+    cursor = encode_cursor(order_columns(getRoadTrafficInfoList), row)
+    with pytest.raises(InvalidCursorError, match="다른 정렬 순서의 커서입니다."):
+        decode_cursor(order_columns(getRoadTrafficInfoList, "collDate"), cursor)
+
+    # 정렬 컬럼 이름이 같아도 값 개수가 다르면 거부
+    foreign = base64.urlsafe_b64encode(json.dumps({"k": ["collDate", "id"], "v": [None]}).encode()).decode()
+    with pytest.raises(InvalidCursorError, match="다른 정렬 순서의 커서입니다."):
+        decode_cursor(order_columns(getRoadTrafficInfoList, "collDate"), foreign)
+
+
+def test_cursor_with_wrong_value_type_is_rejected():
+    forged = base64.urlsafe_b64encode(json.dumps({"k": ["collDate", "id"], "v": ["yesterday", 1]}).encode()).decode()
+    with pytest.raises(InvalidCursorError, match="잘못된 커서입니다."):
+        decode_cursor(order_columns(getRoadTrafficInfoList, "collDate"), forged)
+
+
+def test_api_rejects_invalid_cursor(client):
+    response = client.get("/api/road-info", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "잘못된 커서입니다."}
@@ -0,0 +1,20 @@
+from sqlalchemy import select
+
+from database.connection import engine
+from database.explain import check_queries, explain
+from database.orm import getRoadTrafficInfoList
+
+
+def test_declared_indexes_cover_repository_queries(db):
+    results = check_queries()
+    assert results
+    assert [result.name for result in results if result.full_scan] == []
+    assert all(result.indexes for result in results)
+
+
+def test_explain_reports_full_scan_without_index(db):
+    with engine.connect() as conn:
+        full_scan, indexes, plan = explain(conn, select(getRoadTrafficInfoList).where(getRoadTrafficInfoList.spd > 50))
+    assert full_scan
+    assert indexes == []
+    assert any(line.startswith("SCAN") for line in plan)
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.filters import Filter, applied_filters, filter_clauses
+from database.orm import RoadInfoList, getIncidentInfo, getRoadTrafficInfoList
+from database.repository import road_traffic_query
+from database.schema.request import IncidentInfoPageRequest, RoadTrafficInfoPageRequest
+
+
+@pytest.fixture
+def traffic_db(db):
+    start = datetime(2025, 8, 1, 12)
+    db.add_all([
+        RoadInfoList(routeId="R1", routeNm="경부고속도로"),
+        RoadInfoList(routeId="R2", routeNm="서해안고속도로"),
+        getRoadTrafficInfoList(routeId="R1", linkId="L1", collDate=start, spd=30, congGrade=3),
+        getRoadTrafficInfoList(routeId="R1", linkId="L2", collDate=start + timedelta(hours=1), spd=80, congGrade=1),
+        getRoadTrafficInfoList(routeId="R2", linkId="L3", collDate=start + timedelta(hours=2), spd=100, congGrade=1),
+    ])
+    db.commit()
+    return db
+
+
+def links(db, **filters) -> list[str]:
+    return sorted(row.linkId for row in db.scalars(road_traffic_query(**filters)))
+
+
+def test_filter_is_abstract():
+    with pytest.raises(TypeError):
+        Filter("routeId")
+
+
+def test_unset_fields_add_no_clauses():
+    assert filter_clauses(getRoadTrafficInfoList, RoadTrafficInfoPageRequest()) == []
+    assert filter_clauses(getRoadTrafficInfoList, RoadTrafficInfoPageRequest(route_id="")) == []
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ({"route_id": "R1"}, ["L1", "L2"]),
+    ({"min_speed": 50, "max_speed": 90}, ["L2"]),
+    ({"cong_grade": 1}, ["L2", "L3"]),
+    ({"start_time": datetime(2025, 8, 1, 13), "end_time": datetime(2025, 8, 1, 14)}, ["L2"]),
+    ({"route_nm": "서해안"}, ["L3"]),
+    ({"route_nm": "경부", "min_speed": 50}, ["L2"]),
+    ({"route_nm": "%"}, []),
+])
+def test_traffic_filters_run_in_sql(traffic_db, filters, expected):
+    assert links(traffic_db, **filters) == expected
+
+
+def test_active_incident_filter(db):
+    now = datetime.now()
+    db.add_all([
+        getIncidentInfo(regSeq="1", endDate=None),
+        getIncidentInfo(regSeq="2", endDate=now + timedelta(hours=1)),
+        getIncidentInfo(regSeq="3", endDate=now - timedelta(hours=1)),
+    ])
+    db.commit()
+
+    def reg_seqs(is_active: bool) -> list[str]:
+        request = IncidentInfoPageRequest(is_active=is_active)
+        clauses = filter_clauses(getIncidentInfo, request)
+        return sorted(row.regSeq for row in db.query(getIncidentInfo).filter(*clauses))
+
+    assert reg_seqs(True) == ["1", "2"]
+    assert reg_seqs(False) == ["3"]
+
+
+def test_applied_filters_use_query_parameter_names():
+    request = RoadTrafficInfoPageRequest(route_id="R1", page=2, cursor="abc")
+    filters = applied_filters(request)
+    assert filters["route_id"] == "R1"
+    assert not {"page", "page_size", "pagination", "cursor", "count"} & filters.keys()
@@ -0,0 +1,81 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy import inspect, select, text
+
+from database.connection import engine
+from database.migrate import convert_types, dedupe, find_type_mismatches
+from database.orm import getRoadTrafficInfoList
+
+
+def create_string_typed_traffic_table():
+    """숫자/날짜 컬럼이 문자열이던 이전 버전의 road_traffic_info_list"""
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE road_traffic_info_list"))
+        conn.execute(text(
+            "CREATE TABLE road_traffic_info_list (id INTEGER PRIMARY KEY, routeId VARCHAR(50), linkId VARCHAR(50), "
+            "collDate VARCHAR(20), spd VARCHAR(10), vol VARCHAR(10), trvlTime VARCHAR(10), "
+            "linkDelayTime VARCHAR(10), congGrade VARCHAR(10))"
+        ))
+        conn.execute(text(
+            "INSERT INTO road_traffic_info_list (id, routeId, linkId, collDate, spd, congGrade) VALUES "
+            "(1, 'R1', 'L1', '20250801120000', '40', '2'), "
+            "(2, 'R1', 'L2', '20250801120000', '80', '1'), "
+            "(3, 'R1', 'L1', '20250801120000', '45', '2'), "
+            "(4, 'R1', 'L3', '수집시각없음', '60', '1'), "
+            "(5, 'R1', 'L3', '20250801120500', '빠름', '1')"
+        ))
+
+
+def test_convert_types_rebuilds_string_columns(db, caplog, capsys):
+    create_string_typed_traffic_table()
+    assert "spd" in find_type_mismatches()["road_traffic_info_list"]
+
+    with caplog.at_level(logging.INFO, logger="database.migrate"):
+        result = convert_types(chunk_size=2)["road_traffic_info_list"]
+
+    # 비운 값: 격리한 행의 수집 시각 + id 5의 속도
+    assert (result["copied"], result["merged"], result["quarantined"], result["nulled"]) == (4, 1, 1, 2)
+    assert find_type_mismatches() == {}
+    rows = db.execute(
+        select(getRoadTrafficInfoList.id, getRoadTrafficInfoList.linkId, getRoadTrafficInfoList.collDate,
+               getRoadTrafficInfoList.spd).order_by(getRoadTrafficInfoList.id)
+    ).all()
+    # 자연키가 같은 행은 마지막으로 적재된 행(id 3)만 남음
+    assert rows == [
+        (2, "L2", datetime(2025, 8, 1, 12), 80),
+        (3, "L1", datetime(2025, 8, 1, 12), 45),
+        (5, "L3", datetime(2025, 8, 1, 12, 5), None),
+    ]
+    tables = set(inspect(engine).get_table_names())
+    assert "road_traffic_info_list_legacy" not in tables
+    assert "road_traffic_info_list_quarantine" in tables
+
+    # 진행 상황은 CLI가 아닌 곳에서도 쓸 수 있도록 로그로만 남김
+    assert capsys.readouterr().out == ""
+    progress = [record.getMessage() for record in caplog.records if record.name == "database.migrate"]
+    assert progress[-1] == "road_traffic_info_list: 4행 복사 (id <= 5)"
+
+
+def test_dedupe_keeps_latest_row_and_adds_unique_index(db):
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_road_traffic_info_list_link_coll"))
+        conn.execute(text("CREATE INDEX ix_road_traffic_info_list_link_coll ON road_traffic_info_list (linkId, collDate)"))
+        conn.execute(text(
+            "INSERT INTO road_traffic_info_list (id, routeId, linkId, collDate, spd) VALUES "
+            "(1, 'R1', 'L1', '2025-08-01 12:00:00.000000', 40), "
+            "(2, 'R1', 'L1', '2025-08-01 12:00:00.000000', 45), "
+            "(3, 'R1', 'L2', '2025-08-01 12:00:00.000000', 80), "
+            "(4, 'R1', 'L1', '2025-08-01 12:00:00.000000', 50), "
+            "(5, 'R1', 'L1', '2025-08-01 12:05:00.000000', 60)"
+        ))
+
+    assert dedupe(chunk_size=2) == {"road_traffic_info_list": 2}
+    assert db.execute(
+        select(getRoadTrafficInfoList.id, getRoadTrafficInfoList.spd).order_by(getRoadTrafficInfoList.id)
+    ).all() == [(3, 80), (4, 50), (5, 60)]
+    indexes = {index["name"]: index["unique"] for index in inspect(engine).get_indexes("road_traffic_info_list")}
+    assert indexes.get("uq_road_traffic_info_list_link_coll")
+    assert "ix_road_traffic_info_list_link_coll" not in indexes
+    # 유니크 인덱스가 이미 있으면 다시 실행해도 대상이 없음
+    assert dedupe() == {}
@@ -0,0 +1,60 @@
+import pytest
+
+from collector.parser import ItemListParser, UpstreamResultError, iter_batches
+from conftest import item, payload
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+def test_records_across_chunk_boundaries():
+    body = payload([item(linkId=f"L{i}", spd=str(i)) for i in range(5)])
+    parser = ItemListParser()
+    records = []
+    # 태그 중간에서 잘린 청크도 처리
+    for chunk in chunked(body, 7):
+        records.extend(parser.feed(chunk))
+    records.extend(parser.close())
+
+    assert [record["linkId"] for record in records] == [f"L{i}" for i in range(5)]
+    assert records[0] == {"linkId": "L0", "spd": "0"}
+    assert parser.result_code == "00"
+
+
+def test_empty_values_become_none():
+    records = list(iter_batches([payload([item(linkId="L1", spd="", vol="  ")])], 10))[0]
+    assert records == [{"linkId": "L1", "spd": None, "vol": None}]
+
+
+@pytest.mark.parametrize("count, batch_size, sizes", [
+    (0, 3, []),
+    (3, 3, [3]),
+    (7, 3, [3, 3, 1]),
+    (6, 2, [2, 2, 2]),
+])
+def test_batch_boundaries(count, batch_size, sizes):
+    body = payload([item(linkId=f"L{i}") for i in range(count)])
+    batches = list(iter_batches(chunked(body, 16), batch_size))
+
+    assert [len(batch) for batch in batches] == sizes
+    assert [record["linkId"] for batch in batches for record in batch] == [f"L{i}" for i in range(count)]
+
+
+def test_error_result_code_aborts_before_body():
+    body = payload([item(linkId=f"L{i}") for i in range(100)], result_code="30", result_msg="SERVICE KEY IS NOT REGISTERED")
+    header_end = body.index(b"</header>") + len(b"</header>")
+    parser = ItemListParser()
+
+    with pytest.raises(UpstreamResultError) as error:
+        # 헤더가 닫히는 청크에서 바로 실패하고 본문 레코드는 만들지 않음
+        parser.feed(body[:header_end])
+    assert error.value.result_code == "30"
+    assert error.value.result_msg == "SERVICE KEY IS NOT REGISTERED"
+
+
+def test_error_result_code_stops_batches():
+    body = payload([item(linkId="L1")], result_code="22")
+    with pytest.raises(UpstreamResultError) as error:
+        list(iter_batches(chunked(body, 32), 10))
+    assert error.value.result_code == "22"
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from database.connection import engine
+from database.orm import RecordFingerprint, getRoadTrafficInfoList
+from database.partition import HISTORY_RETENTION_DAYS, parse_partition_name, purge_expired_rows, run_maintenance
+from database.repository import ingest_data
+
+NOW = datetime(2025, 8, 1, 12)
+
+
+def snapshot(link_id: str, collected: datetime) -> dict:
+    return {"routeId": "R1", "linkId": link_id, "collDate": collected.strftime("%Y%m%d%H%M%S"), "spd": "50"}
+
+
+def link_ids(db) -> list[str]:
+    db.expire_all()
+    return sorted(db.scalars(select(getRoadTrafficInfoList.linkId)))
+
+
+def test_delete_fallback_removes_only_expired_rows(db):
+    expired = NOW - timedelta(days=HISTORY_RETENTION_DAYS, minutes=5)
+    kept = NOW - timedelta(days=HISTORY_RETENTION_DAYS - 1)
+    ingest_data(db, "getRoadTrafficInfoList", [snapshot(f"OLD{i}", expired) for i in range(5)] + [snapshot("NEW", kept)])
+
+    results = run_maintenance(engine, now=NOW)
+
+    assert results["road_traffic_info_list"] == {"created": [], "dropped": [], "deleted": 5, "fingerprints": 0}
+    assert results["parking_place_availability_info_list"]["deleted"] == 0
+    assert link_ids(db) == ["NEW"]
+    # 다시 적재하면 지워진 스냅샷도 새로 들어감 (변경 없음으로 건너뛰지 않음)
+    counts = ingest_data(db, "getRoadTrafficInfoList", [snapshot("OLD0", expired)])
+    assert counts["inserted"] == 1
+
+
+def test_purge_expired_rows_in_chunks(db):
+    old = NOW - timedelta(days=400)
+    ingest_data(db, "getRoadTrafficInfoList", [snapshot(f"L{i}", old) for i in range(7)])
+
+    assert purge_expired_rows("getRoadTrafficInfoList", NOW, engine, chunk_size=3) == 7
+    assert purge_expired_rows("getRoadTrafficInfoList", NOW, engine, chunk_size=3) == 0
+    assert link_ids(db) == []
+
+
+def test_maintenance_purges_leftover_history_fingerprints(db):
+    db.add_all([
+        RecordFingerprint(modelName="getParkingPlaceAvailabilityInfoList", recordKey=f"k{i}", fingerprint="f")
+        for i in range(3)
+    ] + [RecordFingerprint(modelName="getIncidentInfo", recordKey="k", fingerprint="f")])
+    db.commit()
+
+    results = run_maintenance(engine, now=NOW)
+
+    assert results["parking_place_availability_info_list"]["fingerprints"] == 3
+    # 참조/돌발상황 테이블의 지문은 유지
+    assert db.scalars(select(RecordFingerprint.modelName)).all() == ["getIncidentInfo"]
+
+
+def test_parse_partition_name():
+    assert parse_partition_name("p202508") == (datetime(2025, 8, 1), datetime(2025, 9, 1))
+    assert parse_partition_name("p20251231") == (datetime(2025, 12, 31), datetime(2026, 1, 1))
+    assert parse_partition_name("p_future") is None
@@ -0,0 +1,135 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from collector import client as client_module
+from collector import pipeline as pipeline_module
+from collector.pipeline import IngestPipeline
+from collector.source import Payload
+from conftest import item, payload
+from database.orm import getRoadTrafficInfoList
+
+ENDPOINT = "getRoadTrafficInfoList"
+
+
+def traffic_items(start: int, count: int) -> list[str]:
+    return [item(routeId="R1", linkId=f"L{i}", collDate="20250801120000", spd=50) for i in range(start, start + count)]
+
+
+def split(body: bytes, *markers: bytes) -> list[bytes]:
+    """본문을 각 marker가 시작하는 위치에서 나눈 청크 목록"""
+    chunks, start = [], 0
+    for marker in markers:
+        end = body.index(marker)
+        chunks.append(body[start:end])
+        start = end
+    return chunks + [body[start:]]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """open_payload를 대신해 청크 목록(또는 청크를 만드는 비동기 생성기)을 순서대로 돌려주는 가짜 외부 API"""
+    responses = []
+    calls = []
+
+    @asynccontextmanager
+    async def open_payload(api_endpoint, params=None):
+        calls.append(params)
+        response = responses.pop(0)
+        yield Payload(response() if callable(response) else _iterate(response), cache_hit=False)
+
+    async def _iterate(chunks):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    monkeypatch.setattr(pipeline_module, "open_payload", open_payload)
+    monkeypatch.setattr(client_module, "UPSTREAM_RETRY_BASE", 0)
+    return responses, calls
+
+
+def run_job(pipeline: IngestPipeline, mode: str = "incremental"):
+    async def run():
+        await pipeline.start()
+        try:
+            job = await pipeline.submit(ENDPOINT, mode)
+            return await asyncio.wait_for(job.wait(), timeout=5)
+        finally:
+            await pipeline.stop()
+    return asyncio.run(run())
+
+
+def stored(db) -> int:
+    db.expire_all()
+    return db.scalar(select(func.count()).select_from(getRoadTrafficInfoList))
+
+
+def test_batches_are_written_while_stream_is_open(db, upstream):
+    responses, _ = upstream
+    body = payload(traffic_items(0, 5))
+    first, rest = split(body, b"<itemList><routeId>R1</routeId><linkId>L3")
+    pipeline = IngestPipeline(fetchers=1, writers=1, batch_size=2)
+    written_before_end = []
+
+    async def stream():
+        yield first
+        # 첫 묶음(L0, L1)은 응답이 끝나기 전에 적재되어야 함
+        for _ in range(200):
+            job = next(iter(pipeline.jobs.values()))
+            if job.batches_done:
+                break
+            await asyncio.sleep(0.01)
+        written_before_end.append(stored(db))
+        yield rest
+
+    responses.append(stream)
+    job = run_job(pipeline)
+
+    assert job.status == "done"
+    assert written_before_end == [2]
+    assert (job.batches_total, job.batches_done) == (3, 3)
+    assert job.stats == {"count": 5, "inserted": 5, "updated": 0, "unchanged": 0}
+    assert stored(db) == 5
+
+
+def test_failure_before_first_batch_is_retried(db, upstream):
+    responses, calls = upstream
+    body = payload(traffic_items(0, 3))
+    responses.extend([[body[:40], httpx.ReadError("connection reset")], [body]])
+
+    job = run_job(IngestPipeline(fetchers=1, writers=1, batch_size=2))
+
+    assert job.status == "done"
+    assert len(calls) == 2
+    assert job.stats["inserted"] == 3
+
+
+def test_failure_after_queued_batch_is_not_retried(db, upstream):
+    responses, calls = upstream
+    body = payload(traffic_items(0, 4))
+    first, _ = split(body, b"<itemList><routeId>R1</routeId><linkId>L3")
+    responses.extend([[first, httpx.ReadError("connection reset")], [body]])
+    pipeline = IngestPipeline(fetchers=1, writers=1, batch_size=2)
+
+    job = run_job(pipeline)
+
+    # 이미 넘긴 묶음이 있으면 다시 받지 않음 (다시 받으면 같은 레코드를 또 적재하게 됨)
+    assert job.status == "failed"
+    assert len(calls) == 1
+    assert job.batches_queued == 1
+
+
+def test_result_code_error_fails_job_without_writes(db, upstream):
+    responses, calls = upstream
+    responses.append([payload(traffic_items(0, 3), result_code="30", result_msg="SERVICE KEY IS NOT REGISTERED ERROR.")])
+
+    job = run_job(IngestPipeline(fetchers=1, writers=1, batch_size=2))
+
+    assert job.status == "failed"
+    assert "30" in job.error
+    assert len(calls) == 1
+    assert stored(db) == 0
@@ -0,0 +1,74 @@
+import gzip
+from datetime import datetime
+
+from sqlalchemy import select
+
+from collector.archive import ArchiveWriter, list_archived
+from collector.replay import plan_tasks, replay
+from conftest import item, payload
+from database.orm import RoadInfoList, getRoadTrafficInfoList
+
+
+def archive(archive_dir: str, api_endpoint: str, body: bytes, params: dict | None = None) -> str:
+    """수집 때와 같이 응답 본문을 나눠 받아 보관 파일로 남김"""
+    writer = ArchiveWriter(api_endpoint, params, archive_dir=archive_dir)
+    for start in range(0, len(body), 50):
+        writer.write(body[start:start + 50])
+    writer.commit()
+    return writer.path
+
+
+def test_replay_reloads_archived_payloads(db, tmp_path):
+    archive_dir = str(tmp_path)
+    archive(archive_dir, "getRoadInfoList", payload([item(routeId="R1", routeNm="경부선"), item(routeId="R2", routeNm="서해안선")]))
+    # 기준 정보는 나중에 받은 스냅샷이 마지막에 반영되어야 함
+    archive(archive_dir, "getRoadInfoList", payload([item(routeId="R1", routeNm="경부고속도로")]))
+    archive(archive_dir, "getRoadTrafficInfoList", payload([
+        item(routeId="R1", linkId="L1", collDate="20250801120000", spd="50"),
+        item(routeId="R1", linkId="L2", collDate="20250801120000", spd="70"),
+    ]), {"routeId": "R1"})
+
+    summary = replay(archive_dir, workers=1)
+    assert (summary["files"], summary["count"], summary["errors"]) == (3, 5, [])
+    assert dict(db.execute(select(RoadInfoList.routeId, RoadInfoList.routeNm)).all()) == {"R1": "경부고속도로", "R2": "서해안선"}
+    assert dict(db.execute(select(getRoadTrafficInfoList.linkId, getRoadTrafficInfoList.spd)).all()) == {"L1": 50, "L2": 70}
+
+    # 다시 재처리해도 이력은 늘지 않음
+    again = replay(archive_dir, api_endpoint="getRoadTrafficInfoList", workers=1)
+    assert (again["files"], again["inserted"], again["unchanged"]) == (1, 0, 2)
+    assert len(db.scalars(select(getRoadTrafficInfoList)).all()) == 2
+
+
+def test_replay_reports_broken_files_and_continues(db, tmp_path):
+    archive_dir = str(tmp_path)
+    broken = archive(archive_dir, "getIncidentInfo", payload([], result_code="22", result_msg="LIMITED"))
+    archive(archive_dir, "getRoadInfoList", payload([item(routeId="R1", routeNm="경부고속도로")]))
+
+    summary = replay(archive_dir, workers=1)
+    assert summary["files"] == 1
+    assert [error["path"] for error in summary["errors"]] == [broken]
+    assert db.scalars(select(RoadInfoList.routeId)).all() == ["R1"]
+
+
+def test_list_archived_filters_and_plans_tasks(tmp_path):
+    archive_dir = str(tmp_path)
+    paths = [
+        archive(archive_dir, "getRoadInfoList", payload([])),
+        archive(archive_dir, "getRoadTrafficInfoList", payload([])),
+        archive(archive_dir, "getRoadInfoList", payload([])),
+        archive(archive_dir, "getRoadTrafficInfoList", payload([])),
+    ]
+    # 보관이 끝나지 않은 임시 파일은 적재 대상이 아님
+    with gzip.open(tmp_path / "getRoadInfoList" / "unfinished.xml.gz.part", "wb") as file:
+        file.write(b"<response>")
+
+    payloads = list_archived(archive_dir)
+    assert [payload.path for payload in payloads] == paths
+    assert list_archived(archive_dir, "getRoadTrafficInfoList", since=payloads[1].fetched_at,
+                         until=payloads[3].fetched_at) == [payloads[1]]
+    assert list_archived(archive_dir, since=datetime.max) == []
+
+    # 기준 정보는 API별로 시간 순서대로 한 작업, 이력은 파일마다 독립 작업
+    assert [[payload.path for payload in task] for task in plan_tasks(payloads)] == [
+        [paths[0], paths[2]], [paths[1]], [paths[3]]
+    ]
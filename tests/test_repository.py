@@ -0,0 +1,133 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from database.orm import LinkTrafficCurrent, RecordFingerprint, getIncidentInfo, getRoadTrafficInfoList
+from database.repository import (
+    bulk_insert_data, get_link_attributes, get_route_names, ingest_data, ingest_incremental, upsert_data
+)
+
+
+def traffic(link_id: str, spd: str, coll_date: str = "20250801120000") -> dict:
+    """getRoadTrafficInfoList 레코드 (외부 API 태그 이름, 문자열 값)"""
+    return {"routeId": "R1", "linkId": link_id, "collDate": coll_date, "spd": spd}
+
+
+def rows(db) -> list[tuple]:
+    return db.execute(
+        select(getRoadTrafficInfoList.linkId, getRoadTrafficInfoList.collDate, getRoadTrafficInfoList.spd)
+        .order_by(getRoadTrafficInfoList.linkId, getRoadTrafficInfoList.collDate)
+    ).all()
+
+
+def test_upsert_data_inserts_then_updates_by_natural_key(db):
+    at = datetime(2025, 8, 1, 12)
+    assert upsert_data(db, "getRoadTrafficInfoList", [
+        {"linkId": "L1", "collDate": at, "spd": 50},
+        {"linkId": "L2", "collDate": at, "spd": 60},
+    ]) == 2
+    # 배치 안에서 자연키가 겹치면 뒤의 값이 남음
+    assert upsert_data(db, "getRoadTrafficInfoList", [
+        {"linkId": "L1", "collDate": at, "spd": 55},
+        {"linkId": "L1", "collDate": at, "spd": 70},
+    ]) == 1
+    assert rows(db) == [("L1", at, 70), ("L2", at, 60)]
+
+
+def test_ingest_incremental_counts(db):
+    first = [{"regSeq": "1", "restrictType": "전면"}, {"regSeq": "2", "restrictType": "부분"}]
+    assert ingest_incremental(db, "getIncidentInfo", first) == {"inserted": 2, "updated": 0, "unchanged": 0}
+
+    second = [
+        {"regSeq": "1", "restrictType": "전면"},
+        {"regSeq": "2", "restrictType": "해제"},
+        {"regSeq": "3", "restrictType": "부분"},
+    ]
+    assert ingest_incremental(db, "getIncidentInfo", second) == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert dict(db.execute(select(getIncidentInfo.regSeq, getIncidentInfo.restrictType)).all()) == {
+        "1": "전면", "2": "해제", "3": "부분"
+    }
+    assert db.scalar(select(func.count()).select_from(RecordFingerprint)) == 3
+
+
+def test_history_ingest_skips_existing_snapshots_without_fingerprints(db):
+    at = datetime(2025, 8, 1, 12)
+    first = [{"linkId": "L1", "collDate": at, "spd": 50}, {"linkId": "L2", "collDate": at, "spd": 60}]
+    assert ingest_incremental(db, "getRoadTrafficInfoList", first) == {"inserted": 2, "updated": 0, "unchanged": 0}
+
+    second = [{"linkId": "L1", "collDate": at, "spd": 50}, {"linkId": "L3", "collDate": at, "spd": 70}]
+    assert ingest_incremental(db, "getRoadTrafficInfoList", second) == {"inserted": 1, "updated": 0, "unchanged": 1}
+    assert rows(db) == [("L1", at, 50), ("L2", at, 60), ("L3", at, 70)]
+    # 이력은 자연키 유니크 인덱스로 중복을 거르므로 지문을 쓰지 않음
+    assert db.scalar(select(func.count()).select_from(RecordFingerprint)) == 0
+
+
+def test_ingest_data_is_idempotent(db):
+    data = [traffic("L1", "50"), traffic("L2", "60"), traffic("L1", "40", "20250801120500")]
+    assert ingest_data(db, "getRoadTrafficInfoList", data) == {"inserted": 3, "updated": 0, "unchanged": 0}
+    before = rows(db)
+
+    assert ingest_data(db, "getRoadTrafficInfoList", data) == {"inserted": 0, "updated": 0, "unchanged": 3}
+    assert rows(db) == before
+    assert db.scalar(select(func.count()).select_from(getRoadTrafficInfoList)) == 3
+    # 최신 상태 테이블에는 링크마다 가장 최근 수집 시각 한 건
+    current = dict(db.execute(select(LinkTrafficCurrent.linkId, LinkTrafficCurrent.spd)).all())
+    assert current == {"L1": 40, "L2": 60}
+
+
+def test_ingest_data_append_skips_existing_keys(db):
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "50")], mode="append")
+    counts = ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "55"), traffic("L2", "60")], mode="append")
+    assert counts == {"inserted": 1, "updated": 0, "unchanged": 1}
+    assert [row.spd for row in db.scalars(select(getRoadTrafficInfoList).order_by(getRoadTrafficInfoList.linkId))] == [50, 60]
+
+
+def test_ingest_data_append_skips_duplicates_within_batch(db):
+    counts = ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "50"), traffic("L1", "55")], mode="append")
+    assert counts == {"inserted": 1, "updated": 0, "unchanged": 1}
+    assert [row[0] for row in rows(db)] == ["L1"]
+
+
+def test_bulk_insert_chunks_and_skips_existing_snapshots(db):
+    data = [
+        {"routeId": "R1", "linkId": f"L{index}", "collDate": datetime(2025, 8, 1, 12), "spd": index, "unknown": "x"}
+        for index in range(5)
+    ]
+    assert bulk_insert_data(db, "getRoadTrafficInfoList", data[:3], chunk_size=2) == 3
+    # 이미 있는 (linkId, collDate)는 건너뛰고 새 행만 삽입 (모델에 없는 키는 무시)
+    assert bulk_insert_data(db, "getRoadTrafficInfoList", data, chunk_size=2, commit_per_chunk=True) == 2
+    assert [row[0] for row in rows(db)] == ["L0", "L1", "L2", "L3", "L4"]
+
+
+def test_ingest_data_skips_rows_without_collection_time(db):
+    counts = ingest_data(db, "getRoadTrafficInfoList", [traffic("L1", "50"), traffic("L2", "60", "")])
+    assert counts["inserted"] == 1
+    assert [row[0] for row in rows(db)] == ["L1"]
+
+
+def test_traffic_names_move_to_reference_tables(db):
+    ingest_data(db, "getRoadTrafficInfoList", [
+        {**traffic("L1", "50"), "routeNm": "경부고속도로", "routeWay": "상행", "routeSeq": "3",
+         "startNodeId": "N1", "startNodeNm": "서울TG", "endNodeId": "N2", "endNodeNm": "판교JC"},
+    ])
+    assert get_route_names(db, ["R1"]) == {"R1": "경부고속도로"}
+    assert get_link_attributes(db, ["L1", "L9"]) == {"L1": {
+        "routeWay": "상행", "routeSeq": 3, "startNodeId": "N1", "startNodeNm": "서울TG",
+        "endNodeId": "N2", "endNodeNm": "판교JC"
+    }}
+
+
+def test_road_traffic_api_fills_link_attributes(client, db):
+    ingest_data(db, "getRoadTrafficInfoList", [
+        {**traffic("L1", "50"), "routeNm": "경부고속도로", "routeWay": "상행", "routeSeq": "3",
+         "startNodeId": "N1", "startNodeNm": "서울TG", "endNodeId": "N2", "endNodeNm": "판교JC"},
+    ])
+    first = client.get("/api/road-traffic").json()["items"][0]
+    assert (first["routeNm"], first["routeWay"], first["routeSeq"], first["startNodeNm"], first["endNodeNm"]) == (
+        "경부고속도로", "상행", 3, "서울TG", "판교JC"
+    )
+
+    # 링크 정보를 전용 API로 다시 수집하면 교통 정보 응답에도 반영됨 (응답 캐시는 참조 테이블 버전도 봄)
+    ingest_data(db, "getRoadLinkInfoList", [{"linkId": "L1", "routeWay": "하행", "routeSeq": "4"}])
+    updated = client.get("/api/road-traffic").json()["items"][0]
+    assert (updated["routeWay"], updated["routeSeq"]) == ("하행", 4)
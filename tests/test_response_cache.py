@@ -0,0 +1,64 @@
+from database.repository import ingest_data
+from database.version import invalidate_versions
+from response_cache import api_cache
+
+
+def road(route_id: str, name: str) -> dict:
+    return {"routeId": route_id, "routeNm": name, "roadRank": "101"}
+
+
+def test_if_none_match_returns_304(client, db):
+    ingest_data(db, "RoadInfoList", [road("R1", "경부고속도로")])
+
+    first = client.get("/api/road-info")
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    cached = client.get("/api/road-info", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    # 다른 조회 조건은 ETag도 다름
+    assert client.get("/api/road-info", params={"route_nm": "경부"}, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_changes_after_write(client, db):
+    ingest_data(db, "RoadInfoList", [road("R1", "경부고속도로")])
+    first = client.get("/api/road-info")
+    etag = first.headers["ETag"]
+
+    ingest_data(db, "RoadInfoList", [road("R2", "서해안고속도로")])
+    response = client.get("/api/road-info", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert {item["routeId"] for item in response.json()["items"]} == {"R1", "R2"}
+    assert client.get("/api/road-info", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+
+def test_write_to_other_table_keeps_etag(client, db):
+    ingest_data(db, "RoadInfoList", [road("R1", "경부고속도로")])
+    etag = client.get("/api/road-info").headers["ETag"]
+
+    ingest_data(db, "getIncidentInfo", [{"regSeq": "1"}])
+    assert client.get("/api/road-info", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_etag_is_same_on_every_worker(client, db):
+    ingest_data(db, "RoadInfoList", [road("R1", "경부고속도로")])
+    first = client.get("/api/road-info")
+
+    # 새 워커처럼 보관 중인 버전과 응답 캐시를 비워도 DB의 버전이 같으면 같은 ETag와 Last-Modified
+    invalidate_versions()
+    api_cache.clear()
+    other = client.get("/api/road-info", headers={"If-None-Match": first.headers["ETag"]})
+    assert other.status_code == 304
+    assert other.headers["ETag"] == first.headers["ETag"]
+    assert other.headers["Last-Modified"] == first.headers["Last-Modified"]
+
+
+def test_no_last_modified_without_writes(client, db):
+    response = client.get("/api/road-info")
+    assert response.status_code == 200
+    assert "Last-Modified" not in response.headers
+    assert client.get("/api/road-info", headers={"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}).status_code == 200
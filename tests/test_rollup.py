@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from database.orm import RollupDirty, TrafficRollup
+from database.repository import ingest_data, mark_rollup_dirty
+from database.rollup import rebuild_rollups, refresh_rollups
+
+
+def traffic(link_id: str, coll_date: str, spd: str, cong_grade: str = "1") -> dict:
+    return {"routeId": "R1", "linkId": link_id, "collDate": coll_date, "spd": spd, "vol": "10", "congGrade": cong_grade}
+
+
+SNAPSHOTS = [
+    traffic("L1", "20250801120000", "40", "2"),
+    traffic("L1", "20250801120500", "60"),
+    traffic("L2", "20250801120000", "80"),
+]
+
+
+def rollups(db) -> dict[tuple, tuple]:
+    """(단위, 기준, ID, 버킷 시작) -> (행 수, 속도 합계, 교통량 합계, 지체 건수)"""
+    db.expire_all()
+    return {
+        (row.grain, row.scope, row.scopeId, row.bucketStart): (row.sampleCount, row.spdSum, row.volSum, row.congGrade2)
+        for row in db.scalars(select(TrafficRollup).where(TrafficRollup.modelName == "getRoadTrafficInfoList"))
+    }
+
+
+def test_refresh_aggregates_each_grain(db):
+    ingest_data(db, "getRoadTrafficInfoList", SNAPSHOTS)
+    result = refresh_rollups()
+    assert result["rounds"] == 1
+
+    buckets = rollups(db)
+    assert buckets[("5m", "link", "L1", datetime(2025, 8, 1, 12, 0))] == (1, 40, 10, 1)
+    assert buckets[("5m", "link", "L1", datetime(2025, 8, 1, 12, 5))] == (1, 60, 10, 0)
+    assert buckets[("1h", "link", "L1", datetime(2025, 8, 1, 12))] == (2, 100, 20, 1)
+    assert buckets[("1h", "route", "R1", datetime(2025, 8, 1, 12))] == (3, 180, 30, 1)
+    assert buckets[("1d", "route", "R1", datetime(2025, 8, 1))] == (3, 180, 30, 1)
+    assert db.scalars(select(RollupDirty)).all() == []
+
+
+def test_refresh_is_idempotent_after_replayed_data(db):
+    ingest_data(db, "getRoadTrafficInfoList", SNAPSHOTS)
+    refresh_rollups()
+    before = rollups(db)
+
+    # 같은 스냅샷을 다시 수집(재처리)하고, 적재가 건너뛴 행도 집계 대상으로 다시 표시
+    ingest_data(db, "getRoadTrafficInfoList", SNAPSHOTS)
+    mark_rollup_dirty(db, "getRoadTrafficInfoList", [
+        {"linkId": row["linkId"], "routeId": row["routeId"], "collDate": datetime.strptime(row["collDate"], "%Y%m%d%H%M%S")}
+        for row in SNAPSHOTS
+    ])
+    db.commit()
+    refresh_rollups()
+    assert rollups(db) == before
+
+    # 전체 다시 집계해도 같음
+    rebuild_rollups()
+    assert rollups(db) == before
+    # 표시된 버킷이 없으면 아무것도 하지 않음
+    assert refresh_rollups()["rounds"] == 0
+
+
+def test_late_row_updates_only_its_buckets(db):
+    ingest_data(db, "getRoadTrafficInfoList", SNAPSHOTS)
+    refresh_rollups()
+    before = rollups(db)
+
+    ingest_data(db, "getRoadTrafficInfoList", [traffic("L2", "20250801120300", "20", "2")])
+    refresh_rollups()
+    after = rollups(db)
+
+    assert after[("5m", "link", "L2", datetime(2025, 8, 1, 12, 0))] == (2, 100, 20, 1)
+    assert after[("1h", "route", "R1", datetime(2025, 8, 1, 12))] == (4, 200, 40, 2)
+    changed = {key for key in after if after[key] != before.get(key)}
+    assert changed == {
+        ("5m", "link", "L2", datetime(2025, 8, 1, 12, 0)), ("1h", "link", "L2", datetime(2025, 8, 1, 12)),
+        ("1d", "link", "L2", datetime(2025, 8, 1)), ("5m", "route", "R1", datetime(2025, 8, 1, 12, 0)),
+        ("1h", "route", "R1", datetime(2025, 8, 1, 12)), ("1d", "route", "R1", datetime(2025, 8, 1)),
+    }
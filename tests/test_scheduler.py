@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from collector import scheduler as scheduler_module
+from collector.scheduler import Scheduler
+
+
+@pytest.fixture
+def no_jitter(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "SCHEDULER_JITTER", 0)
+    monkeypatch.setattr(scheduler_module, "SCHEDULER_BACKOFF_MAX", 3600)
+
+
+def test_overlapping_run_is_skipped():
+    async def scenario():
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_job():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+
+        scheduler = Scheduler()
+        scheduler.add_job("slow", 60, slow_job)
+        first = asyncio.create_task(scheduler.run_job("slow"))
+        await asyncio.sleep(0)
+        assert scheduler.jobs["slow"].running
+
+        # 앞 실행이 끝나지 않았으면 새 실행은 시작하지 않음
+        assert await scheduler.run_job("slow") is False
+        release.set()
+        assert await first is True
+        return calls, scheduler.jobs["slow"]
+
+    calls, job = asyncio.run(scenario())
+    assert calls == 1
+    assert (job.run_count, job.running, job.last_status) == (1, False, "success")
+
+
+def test_failure_backoff_starts_at_interval_and_is_capped(no_jitter):
+    async def failing_job():
+        raise RuntimeError("외부 API 오류")
+
+    scheduler = Scheduler()
+    scheduler.add_job("incident", 120, failing_job)
+    job = scheduler.jobs["incident"]
+    assert scheduler._next_delay(job) == 120
+
+    delays = []
+    for _ in range(7):
+        asyncio.run(scheduler.run_job("incident"))
+        delays.append(scheduler._next_delay(job))
+    assert delays == [120, 240, 480, 960, 1920, 3600, 3600]
+    assert (job.consecutive_failures, job.last_error) == (7, "외부 API 오류")
+
+
+def test_backoff_never_shorter_than_interval(no_jitter):
+    async def failing_job():
+        raise RuntimeError("외부 API 오류")
+
+    scheduler = Scheduler()
+    scheduler.add_job("daily", 24 * 60 * 60, failing_job)
+    for _ in range(3):
+        asyncio.run(scheduler.run_job("daily"))
+    assert scheduler._next_delay(scheduler.jobs["daily"]) == 24 * 60 * 60
+
+
+def test_success_resets_backoff(no_jitter):
+    outcomes = [RuntimeError("실패"), RuntimeError("실패"), None]
+
+    async def flaky_job():
+        error = outcomes.pop(0)
+        if error:
+            raise error
+
+    scheduler = Scheduler()
+    scheduler.add_job("parking", 60, flaky_job)
+    job = scheduler.jobs["parking"]
+    asyncio.run(scheduler.run_job("parking"))
+    asyncio.run(scheduler.run_job("parking"))
+    assert scheduler._next_delay(job) == 120
+
+    asyncio.run(scheduler.run_job("parking"))
+    assert (job.consecutive_failures, job.failure_count) == (0, 2)
+    assert scheduler._next_delay(job) == 60
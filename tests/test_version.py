@@ -0,0 +1,68 @@
+from sqlalchemy import insert, update
+
+from database import version
+from database.connection import engine
+from database.orm import DataVersion, RoadInfoList
+from database.repository import ingest_data, save_crawl_checkpoint
+from database.version import all_versions, invalidate_versions, last_modified, table_versions
+
+
+def other_process_write(route_id: str, name: str):
+    """다른 워커의 적재 - 이 프로세스의 세션을 거치지 않고 데이터와 버전을 한 트랜잭션으로 커밋"""
+    with engine.begin() as conn:
+        conn.execute(insert(RoadInfoList.__table__), {"routeId": route_id, "routeNm": name})
+        conn.execute(update(DataVersion.__table__).where(DataVersion.tableName == RoadInfoList.__tablename__)
+                     .values(version=DataVersion.version + 1))
+    # 이 프로세스가 보관한 버전은 그대로이므로 보관 시간(DATA_VERSION_CACHE_TTL)이 지난 것처럼 버림
+    invalidate_versions()
+
+
+def test_commit_bumps_version_row(db):
+    assert table_versions("road_info_list", "incident_info") == (0, 0)
+
+    ingest_data(db, "RoadInfoList", [{"routeId": "R1", "routeNm": "경부고속도로"}])
+    ingest_data(db, "RoadInfoList", [{"routeId": "R2", "routeNm": "서해안고속도로"}])
+
+    assert table_versions("road_info_list", "incident_info") == (2, 0)
+    assert all_versions()["road_info_list"] == 2
+    assert last_modified("road_info_list") > 0
+
+
+def test_rollback_does_not_bump(db):
+    db.execute(insert(RoadInfoList.__table__), {"routeId": "R1"})
+    db.rollback()
+    assert "road_info_list" not in all_versions()
+
+
+def test_bookkeeping_tables_are_not_versioned(db):
+    save_crawl_checkpoint(db, "getRoadLinkInfoList", "20250801120000", "R1", "done")
+    assert all_versions() == {}
+
+
+def test_versions_are_shared_across_processes(db):
+    ingest_data(db, "RoadInfoList", [{"routeId": "R1", "routeNm": "경부고속도로"}])
+    assert table_versions("road_info_list") == (1,)
+
+    other_process_write("R2", "서해안고속도로")
+    assert table_versions("road_info_list") == (2,)
+
+
+def test_versions_are_cached_briefly(db, monkeypatch):
+    monkeypatch.setattr(version, "DATA_VERSION_CACHE_TTL", 60)
+    assert table_versions("road_info_list") == (0,)
+    with engine.begin() as conn:
+        conn.execute(insert(DataVersion.__table__), {"tableName": "road_info_list", "version": 5, "modifiedAt": 0})
+    # 보관 시간 안에는 DB를 다시 읽지 않음
+    assert table_versions("road_info_list") == (0,)
+
+    monkeypatch.setattr(version, "DATA_VERSION_CACHE_TTL", 0)
+    assert table_versions("road_info_list") == (5,)
+
+
+def test_response_cache_sees_other_process_write(client, db):
+    ingest_data(db, "RoadInfoList", [{"routeId": "R1", "routeNm": "경부고속도로"}])
+    assert [item["routeId"] for item in client.get("/api/road-info").json()["items"]] == ["R1"]
+
+    other_process_write("R2", "서해안고속도로")
+    assert [item["routeId"] for item in client.get("/api/road-info").json()["items"]] == ["R1", "R2"]
+    assert client.get("/api/cache/stats").json()["data_versions"]["road_info_list"] == 2